@@ -0,0 +1 @@
+# vision-color-pipeline benchmarks
@@ -0,0 +1,141 @@
+# ==================================================
+# BACKENDS - K-Means Backend Karşılaştırması
+# ==================================================
+# apply_kmeans()'ı aynı sentetik görüntüler ve aynı seed ile her
+# kurulu backend (sklearn, cv2, numba) üzerinde çalıştırır; süreyi,
+# inertia'yı ve en iyi backend'e göre inertia farkını raporlar.
+# Kurulu olmayan backend'ler (örn. numba) atlanır.
+#
+# Kullanım (proje kök klasöründen):
+#   python -m benchmarks.backends --sizes 1,4 --complexities photo,noise
+
+import argparse
+import json
+import os
+import statistics
+from typing import List
+
+from config import K_CLUSTERS, RANDOM_STATE
+from benchmarks.run_benchmarks import _git_commit, _time
+from benchmarks.synthetic import COMPLEXITIES, make_image
+from src.clustering import apply_kmeans
+from src.kmeans_backends import KMEANS_BACKENDS, available_backends
+
+
+def compare_backends(
+    megapixels: float,
+    complexity: str,
+    backends: List[str],
+    k: int,
+    repeat: int,
+) -> List[dict]:
+    """Tek bir görüntüde backend'leri ölçer.
+
+    Args:
+        megapixels: Sentetik görüntü boyutu.
+        complexity: synthetic.COMPLEXITIES anahtarı.
+        backends: Ölçülecek backend adları.
+        k: Küme sayısı.
+        repeat: Her backend için tekrar sayısı (medyan raporlanır).
+
+    Returns:
+        list: Backend başına sonuç sözlükleri.
+    """
+    pixels = make_image(megapixels, complexity).reshape(-1, 3)
+    results = []
+
+    for backend in backends:
+        stats = {}
+
+        def run():
+            stats.clear()
+            apply_kmeans(
+                pixels, k, RANDOM_STATE, stats=stats, backend=backend
+            )
+
+        timings = _time(run, repeat)
+        results.append({
+            "megapixels": megapixels,
+            "complexity": complexity,
+            "backend": backend,
+            "median_s": statistics.median(timings),
+            "timings_s": timings,
+            "inertia": stats["inertia"],
+            "abandoned": stats["abandoned"],
+        })
+
+    best = min(r["inertia"] for r in results)
+    for r in results:
+        r["inertia_gap"] = r["inertia"] / best - 1.0 if best else 0.0
+        print(
+            f"[OK] {megapixels:>6} MP {complexity:<6} {r['backend']:<8} "
+            f"{r['median_s']:8.3f} s  inertia +{r['inertia_gap']:.2%}"
+        )
+
+    return results
+
+
+def main(argv=None) -> str:
+    parser = argparse.ArgumentParser(
+        description="K-Means backend karşılaştırması"
+    )
+    parser.add_argument(
+        "--sizes", default="0.25,1",
+        help="Virgülle ayrılmış megapiksel değerleri",
+    )
+    parser.add_argument(
+        "--complexities", default="photo,noise",
+        help=f"Virgülle ayrılmış karmaşıklıklar ({', '.join(COMPLEXITIES)})",
+    )
+    parser.add_argument(
+        "--backends", default=",".join(KMEANS_BACKENDS),
+        help="Ölçülecek backend'ler (kurulu olmayanlar atlanır)",
+    )
+    parser.add_argument("--k", type=int, default=K_CLUSTERS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--output", default=None,
+        help="Sonuç dosyası (varsayılan: benchmarks/results/"
+             "backends-<commit>.json)",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [float(s) for s in args.sizes.split(",") if s]
+    complexities = [c for c in args.complexities.split(",") if c]
+    installed = available_backends()
+    backends = [b for b in args.backends.split(",") if b in installed]
+    skipped = [b for b in args.backends.split(",") if b and b not in installed]
+
+    commit = _git_commit()
+    output = args.output or os.path.join(
+        "benchmarks", "results", f"backends-{commit}.json"
+    )
+
+    print("=" * 60)
+    print(f"K-MEANS BACKENDS (commit {commit})")
+    print("=" * 60)
+    if skipped:
+        print(f"[..] Kurulu olmadigi icin atlandi: {', '.join(skipped)}")
+
+    results = []
+    for megapixels in sizes:
+        for complexity in complexities:
+            results.extend(compare_backends(
+                megapixels, complexity, backends, args.k, args.repeat
+            ))
+
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {"meta": {"commit": commit, "cpu_count": os.cpu_count()},
+             "results": results},
+            f, indent=2,
+        )
+
+    print("=" * 60)
+    print(f"[OK] Sonuçlar kaydedildi: {output}")
+    return output
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# ==================================================
+# COMPARE - İki Benchmark Sonucunu Karşılaştırma
+# ==================================================
+# run_benchmarks.py çıktısı iki JSON dosyasını (case, function)
+# çiftlerine göre eşleştirir ve süre oranlarını listeler.
+#
+# Kullanım:
+#   python -m benchmarks.compare base.json new.json [--threshold 1.10]
+
+import argparse
+import json
+import sys
+
+
+def _load(path: str) -> dict:
+    """Sonuç dosyasını (case, function) -> sonuç sözlüğüne çevirir."""
+    with open(path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    return {(r["case"], r["function"]): r for r in report["results"]}
+
+
+def compare(base_path: str, new_path: str, threshold: float) -> int:
+    """İki sonucu karşılaştırır ve yavaşlayan ölçüm sayısını döndürür.
+
+    Oran = yeni / eski (seconds_min). threshold'dan büyük oranlar
+    gerileme (regression) olarak işaretlenir.
+    """
+    base = _load(base_path)
+    new = _load(new_path)
+
+    regressions = 0
+
+    print(f"{'case':<18} {'function':<24} {'base':>10} {'new':>10} {'ratio':>7}")
+    print("-" * 73)
+
+    for key in sorted(base.keys() & new.keys()):
+        old_s = base[key]["seconds_min"]
+        new_s = new[key]["seconds_min"]
+        ratio = new_s / old_s if old_s else float("inf")
+
+        flag = ""
+        if ratio > threshold:
+            flag = "  << yavaşladı"
+            regressions += 1
+        elif ratio < 1 / threshold:
+            flag = "  >> hızlandı"
+
+        print(f"{key[0]:<18} {key[1]:<24} {old_s:>10.4f} {new_s:>10.4f} "
+              f"{ratio:>7.2f}{flag}")
+
+    missing = sorted(base.keys() ^ new.keys())
+    if missing:
+        print(f"\nSadece bir dosyada olan ölçümler: {len(missing)}")
+
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="İki benchmark sonucunu karşılaştırır"
+    )
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument(
+        "--threshold", type=float, default=1.10,
+        help="Gerileme sayılacak süre oranı (varsayılan 1.10)",
+    )
+    args = parser.parse_args(argv)
+
+    regressions = compare(args.base, args.new, args.threshold)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,244 @@
+# ==================================================
+# RUN BENCHMARKS - Fonksiyon ve Pipeline Benchmark'ları
+# ==================================================
+# src/ altındaki her genel fonksiyonu ve uçtan uca pipeline'ı
+# sentetik görüntüler üzerinde ayrı ayrı ölçer. Sonuçlar JSON
+# olarak yazılır; iki commit'in sonuçları compare.py ile
+# karşılaştırılabilir.
+#
+# Kullanım (proje kök klasöründen):
+#   python -m benchmarks.run_benchmarks --sizes 0.25,1,4 \
+#       --complexities flat,photo,noise --output bench.json
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, List
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import cv2
+import numpy as np
+import sklearn
+
+from config import K_CLUSTERS, RANDOM_STATE
+from benchmarks.synthetic import COMPLEXITIES, make_image
+from src.image_io import load_image, save_image
+from src.pixel_analysis import get_image_info, extract_pixels
+from src.histogram import (
+    compute_histograms,
+    plot_rgb_histogram,
+    plot_combined_histogram,
+)
+from src.clustering import apply_kmeans, get_dominant_colors
+from src.segmentation import segment_image, create_label_map
+from src.color_categorization import categorize_centers
+from src.visualization import plot_color_palette, plot_comparison, plot_summary
+from src.render import render_color_palette, render_comparison, render_summary
+from src.pipeline import run_pipeline
+
+
+def _git_commit() -> str:
+    """Çalışılan commit'in kısa hash'ini döndürür (yoksa "unknown")."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL, text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _time(fn: Callable[[], object], repeat: int) -> List[float]:
+    """Fonksiyonu repeat kez çalıştırıp süreleri (sn) döndürür.
+
+    Fonksiyonların konsol çıktısı ölçüme karışmaması için bastırılır.
+    """
+    timings = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def benchmark_case(
+    megapixels: float,
+    complexity: str,
+    k: int,
+    repeat: int,
+    work_dir: str,
+    functions: List[str],
+) -> List[dict]:
+    """Tek bir (boyut, karmaşıklık) durumu için tüm ölçümleri yapar.
+
+    Args:
+        megapixels: Görüntü boyutu (milyon piksel).
+        complexity: Sentetik görüntü karmaşıklığı.
+        k: Küme sayısı.
+        repeat: Her fonksiyonun tekrar sayısı.
+        work_dir: Geçici çıktıların yazılacağı klasör.
+        functions: Ölçülecek fonksiyon adları (boşsa hepsi).
+
+    Returns:
+        Her fonksiyon için sonuç sözlükleri listesi.
+    """
+    image = make_image(megapixels, complexity)
+    output_dir = os.path.join(work_dir, f"{megapixels}mp-{complexity}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    image_path = os.path.join(output_dir, "input.png")
+    cv2.imwrite(image_path, cv2.cvtColor(image, cv2.COLOR_RGB2BGR))
+
+    # Sonraki adimlarin girdileri bir kez hazirlanir
+    with contextlib.redirect_stdout(io.StringIO()):
+        pixels = extract_pixels(image, np.uint8)
+        labels, centers = apply_kmeans(pixels, k, RANDOM_STATE)
+        histograms = compute_histograms(image)
+        segmented = segment_image(labels, centers, image.shape)
+        dominant_colors = get_dominant_colors(centers, labels)
+        color_names = categorize_centers(centers)
+
+    cases = {
+        "load_image": lambda: load_image(image_path),
+        "load_image_scale8": lambda: load_image(image_path, scale=8),
+        "save_image": lambda: save_image(segmented, "segmented.png", output_dir),
+        "get_image_info": lambda: get_image_info(image),
+        "extract_pixels": lambda: extract_pixels(image),
+        "compute_histograms": lambda: compute_histograms(image),
+        "plot_rgb_histogram":
+            lambda: plot_rgb_histogram(image, output_dir, histograms),
+        "plot_combined_histogram":
+            lambda: plot_combined_histogram(image, output_dir, histograms),
+        "apply_kmeans": lambda: apply_kmeans(pixels, k, RANDOM_STATE),
+        "get_dominant_colors": lambda: get_dominant_colors(centers, labels),
+        "segment_image": lambda: segment_image(labels, centers, image.shape),
+        "create_label_map": lambda: create_label_map(labels, image.shape),
+        "categorize_centers": lambda: categorize_centers(centers),
+        "plot_color_palette":
+            lambda: plot_color_palette(dominant_colors, color_names, output_dir),
+        "plot_comparison":
+            lambda: plot_comparison(image, segmented, output_dir, k=k),
+        "plot_summary": lambda: plot_summary(
+            image, segmented, dominant_colors, color_names, output_dir
+        ),
+        "render_color_palette": lambda: render_color_palette(
+            dominant_colors, color_names, output_dir
+        ),
+        "render_comparison":
+            lambda: render_comparison(image, segmented, output_dir, k=k),
+        "render_summary": lambda: render_summary(
+            image, segmented, dominant_colors, color_names, output_dir
+        ),
+        "pipeline": lambda: run_pipeline(
+            image_path, output_dir, k, RANDOM_STATE, write_run_report=False
+        ),
+    }
+
+    results = []
+    for name, fn in cases.items():
+        if functions and name not in functions:
+            continue
+
+        timings = _time(fn, repeat)
+        results.append({
+            "case": f"{megapixels}mp-{complexity}",
+            "function": name,
+            "megapixels": megapixels,
+            "complexity": complexity,
+            "pixels": int(image.shape[0] * image.shape[1]),
+            "k": k,
+            "repeat": repeat,
+            "seconds_min": round(min(timings), 6),
+            "seconds_median": round(statistics.median(timings), 6),
+        })
+        print(f"  {results[-1]['case']:<18} {name:<24} "
+              f"{results[-1]['seconds_min']:>10.4f} sn")
+
+    return results
+
+
+def main(argv=None) -> str:
+    parser = argparse.ArgumentParser(
+        description="Vision Color Pipeline benchmark'ları"
+    )
+    parser.add_argument(
+        "--sizes", default="0.25,1,4",
+        help="Virgülle ayrılmış megapiksel değerleri (örn: 0.25,1,4,24,100)",
+    )
+    parser.add_argument(
+        "--complexities", default=",".join(COMPLEXITIES),
+        help=f"Virgülle ayrılmış karmaşıklıklar ({', '.join(COMPLEXITIES)})",
+    )
+    parser.add_argument(
+        "--functions", default="",
+        help="Sadece bu fonksiyonları ölç (virgülle ayrılmış)",
+    )
+    parser.add_argument("--k", type=int, default=K_CLUSTERS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--output", default=None,
+        help="Sonuç dosyası (varsayılan: benchmarks/results/<commit>.json)",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [float(s) for s in args.sizes.split(",") if s]
+    complexities = [c for c in args.complexities.split(",") if c]
+    functions = [f for f in args.functions.split(",") if f]
+
+    commit = _git_commit()
+    output = args.output or os.path.join(
+        "benchmarks", "results", f"{commit}.json"
+    )
+
+    print("=" * 60)
+    print(f"BENCHMARK (commit {commit})")
+    print("=" * 60)
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for megapixels in sizes:
+            for complexity in complexities:
+                results.extend(benchmark_case(
+                    megapixels, complexity, args.k, args.repeat,
+                    work_dir, functions,
+                ))
+
+    report = {
+        "meta": {
+            "commit": commit,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+            "sklearn": sklearn.__version__,
+            "matplotlib": matplotlib.__version__,
+        },
+        "results": results,
+    }
+
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print("=" * 60)
+    print(f"[OK] Sonuçlar kaydedildi: {output}")
+    return output
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,88 @@
+# ==================================================
+# SYNTHETIC - Deterministik Sentetik Test Görüntüleri
+# ==================================================
+# Benchmark'lar için boyutu ve renk karmaşıklığı kontrollü,
+# seed ile tekrarlanabilir RGB görüntüler üretir.
+#
+# Karmaşıklık seviyeleri (az renkten çok renge):
+#   "flat"     -> 8 renkli düz bloklar (poster)
+#   "gradient" -> yumuşak renk geçişleri
+#   "photo"    -> geçiş + şekiller + hafif gürültü (fotoğrafa yakın)
+#   "noise"    -> tamamen rastgele pikseller (en kötü durum)
+
+from typing import Tuple
+
+import numpy as np
+
+
+COMPLEXITIES = ("flat", "gradient", "photo", "noise")
+
+
+def image_shape(megapixels: float) -> Tuple[int, int]:
+    """Verilen megapiksel için 4:3 oranlı (H, W) boyutunu döndürür."""
+    total = megapixels * 1_000_000
+    width = int(round(np.sqrt(total * 4 / 3)))
+    height = int(round(total / width))
+    return height, width
+
+
+def _gradient(height: int, width: int) -> np.ndarray:
+    """Köşeden köşeye yumuşak RGB geçişi üretir (uint8)."""
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, np.newaxis]
+    x = np.linspace(0, 255, width, dtype=np.float32)[np.newaxis, :]
+
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:, :, 0] = x
+    image[:, :, 1] = y
+    image[:, :, 2] = (x + y) / 2
+    return image
+
+
+def make_image(megapixels: float, complexity: str, seed: int = 0) -> np.ndarray:
+    """Deterministik bir sentetik RGB görüntü üretir.
+
+    Args:
+        megapixels: Görüntü boyutu (milyon piksel, örn: 0.25 - 100).
+        complexity: COMPLEXITIES içinden bir seviye.
+        seed: Rastgelelik için seed değeri.
+
+    Returns:
+        RGB formatında uint8 numpy dizisi (H, W, 3).
+
+    Raises:
+        ValueError: Bilinmeyen karmaşıklık seviyesi verilirse.
+    """
+    height, width = image_shape(megapixels)
+    rng = np.random.default_rng(seed)
+
+    if complexity == "flat":
+        palette = rng.integers(0, 256, size=(8, 3), dtype=np.uint8)
+        block_rows = np.arange(height) * 4 // height
+        block_cols = np.arange(width) * 2 // width
+        index = block_rows[:, np.newaxis] * 2 + block_cols[np.newaxis, :]
+        return palette[index]
+
+    if complexity == "gradient":
+        return _gradient(height, width)
+
+    if complexity == "photo":
+        image = _gradient(height, width)
+
+        # Rastgele renkli dikdortgenler (nesneler)
+        for _ in range(12):
+            top, left = rng.integers(0, height), rng.integers(0, width)
+            h = rng.integers(height // 10, height // 3 + 1)
+            w = rng.integers(width // 10, width // 3 + 1)
+            image[top:top + h, left:left + w] = rng.integers(0, 256, size=3)
+
+        # Satir satir gurultu: tam boyutlu int16 kopya olusturulmaz
+        for top in range(0, height, 512):
+            band = image[top:top + 512]
+            noise = rng.integers(-12, 13, size=band.shape, dtype=np.int16)
+            band[...] = np.clip(band + noise, 0, 255)
+        return image
+
+    if complexity == "noise":
+        return rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+
+    raise ValueError(f"Bilinmeyen karmaşıklık seviyesi: {complexity}")
@@ -15,3 +15,206 @@ K_CLUSTERS = 8
 
 # Rastgelelik kontrolü için seed değeri
 RANDOM_STATE = 42
+
+# K-Means'i benzersiz renkler uzerinde agirlikli calistir
+# (piksel sayisindan cok daha az benzersiz renk oldugunda hizli)
+KMEANS_UNIQUE_COLORS = False
+
+# Goruntu okuma olcegi (1, 2, 4, 8): JPEG'ler IMREAD_REDUCED_COLOR_*
+# ile kucultulerek cozulur. LOAD_TARGET_SIZE verilirse olcek, uzun
+# kenari bu degerin altina dusurmeyen en buyuk oran olarak secilir.
+# Palet cikarma / onizleme icin tam cozunurluk gerekmez.
+LOAD_SCALE = 1
+LOAD_TARGET_SIZE = None
+
+# K-Means ayarlari: baslangic yontemi ("k-means++" / "random"),
+# baslangic (restart) sayisi, yakinsama toleransi ve en fazla iterasyon
+KMEANS_INIT = "k-means++"
+KMEANS_N_INIT = 10
+KMEANS_TOL = 1e-4
+KMEANS_MAX_ITER = 300
+
+# Lloyd iterasyonlarini yapan motor (bkz. src/kmeans_backends.py):
+#   "sklearn" -> sklearn KMeans (varsayilan)
+#   "cv2"     -> cv2.kmeans (agirliksiz; KMEANS_UNIQUE_COLORS ile
+#                birlikte secilirse calistirmadan once hata verilir)
+#   "numba"   -> Numba ile derlenen cekirdekler (pip install numba)
+KMEANS_BACKEND = "sklearn"
+
+# Baslangic merkezleri bu kadar piksellik bir ornekte secilir
+# (None ise tum pikseller; k-means++ her merkez icin veriyi tarar)
+KMEANS_SEED_SAMPLE_SIZE = 100_000
+
+# Restart'lari paralel calistiran thread sayisi (None: tum cekirdekler).
+# Her restart'in seed'i RANDOM_STATE'ten turetilir; sonuc isci
+# sayisindan bagimsizdir.
+KMEANS_WORKERS = None
+
+# Erken birakma: her restart once KMEANS_PROBE_ITER iterasyon calisir;
+# inertia'si en iyinin KMEANS_ABANDON_RATIO katindan kotu olanlar
+# birakilir, kalanlar yakinsayana kadar devam eder (0: kapali).
+# Yoklamada %2'den fazla geride kalan restart nadiren en iyi olur.
+KMEANS_PROBE_ITER = 10
+KMEANS_ABANDON_RATIO = 1.02
+
+# Kumeleme modu:
+#   "full"      -> tum piksellerle K-Means (varsayilan)
+#   "streaming" -> tile tile MiniBatch K-Means (cok buyuk goruntuler)
+#   "downsample"-> kucuk ornekte fit, tam cozunurlukte etiketleme
+#   "palette"   -> K-Means yok; her piksel FIXED_PALETTE'in en yakin
+#                  rengine (LAB) arama tablosuyla eslenir, K = palet boyu
+KMEANS_MODE = "full"
+
+# "palette" modunun renkleri: None ise COLOR_DICTIONARY, aksi halde
+# JSON dosya yolu (isim -> RGB sozlugu, RGB listesi veya palette.json)
+FIXED_PALETTE = None
+
+# Palet arama tablosunun kanal basina boyutu: 256 -> tam tablo (16 MB,
+# tek indeksleme), 32 / 64 -> kaba izgara (<= 256 KB, belirsiz
+# hucrelerdeki pikseller tek tek kesin eslenir; daha yavas)
+PALETTE_LUT_LEVELS = 256
+
+# Streaming modunda her tile'daki satir sayisi ve partial_fit gecis sayisi
+STREAMING_TILE_ROWS = 256
+STREAMING_EPOCHS = 1
+
+# Downsample modunda ornekleme yontemi ("resize" / "stratified")
+# ve fit icin kullanilacak yaklasik piksel sayisi
+DOWNSAMPLE_METHOD = "resize"
+DOWNSAMPLE_SIZE = 250_000
+
+# Downsample modunda tam fit ile palet farkini (Delta-E) raporla
+# (--report-drift). Ek bir tam K-Means calistirir; ornek boyutunu secmek
+# icin kullanilir, sonuc run_report.json'daki palette_drift kaydina yazilir.
+REPORT_PALETTE_DRIFT = False
+
+# Otomatik K secimi: K_CLUSTERS yerine AUTO_K_RANGE araligi ortak bir
+# piksel orneginde paralel denenir, sadece secilen K tam cozunurlukte calisir
+AUTO_K = False
+AUTO_K_RANGE = (3, 12)
+
+# Secim metrigi: "silhouette" (en yuksek), "davies_bouldin" (en dusuk)
+# veya "elbow" (inertia egrisinin dirsegi)
+AUTO_K_METRIC = "silhouette"
+
+# Fit icin ortak ornek boyutu ve silhouette / Davies-Bouldin icin
+# kullanilacak piksel sayisi (silhouette O(n^2))
+AUTO_K_SAMPLE_SIZE = 50_000
+AUTO_K_SCORE_SAMPLE_SIZE = 3_000
+
+# Secimin toplam sure butcesi (saniye, None: sinirsiz)
+# ve paralel fit sayisi (None: tum cekirdekler)
+AUTO_K_TIME_BUDGET = 10.0
+AUTO_K_WORKERS = None
+
+# Toplu (batch) modda islenecek goruntu uzantilari
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp")
+
+# Toplu modda isci surec sayisi (None: tum cekirdekler)
+BATCH_WORKERS = None
+
+# Toplu calistirma ozetinin dosya adi
+BATCH_SUMMARY_FILE = "batch_summary.json"
+
+# Toplu modda surec havuzu yerine tek surecte okuma/hesaplama/yazma
+# ortusmesi: sonraki PREFETCH_DEPTH goruntu arka planda cozulur,
+# ciktilar WRITER_THREADS thread'li, en fazla WRITER_MAX_PENDING
+# bekleyen isli bir kuyrukla yazilir (ag depolamasinda faydali)
+BATCH_PIPELINED = False
+PREFETCH_DEPTH = 4
+WRITER_THREADS = 2
+WRITER_MAX_PENDING = 16
+
+# Koleksiyon modu (python main.py collection): tum goruntuler icin tek
+# ortak palet. Fit gecisinde her goruntu uzun kenari en az
+# COLLECTION_FIT_TARGET_SIZE olacak sekilde kucultulerek cozulur ve
+# COLLECTION_SAMPLE_SIZE piksellik ornegi MiniBatch K-Means'e verilir;
+# baslangic merkezleri ilk COLLECTION_INIT_SAMPLE_SIZE benzersiz
+# renkte secilir. Ortak palet ve koleksiyon yuzdeleri
+# COLLECTION_PALETTE_FILE'a yazilir (FIXED_PALETTE olarak kullanilabilir)
+COLLECTION_SAMPLE_SIZE = 20_000
+COLLECTION_INIT_SAMPLE_SIZE = 100_000
+COLLECTION_FIT_TARGET_SIZE = 512
+COLLECTION_EPOCHS = 1
+COLLECTION_PALETTE_FILE = "collection_palette.json"
+
+# Calistirilacak istege bagli adimlar (src/pipeline.py STAGES):
+# "histogram", "segmentation", "naming", "plots" veya "all" / "palette"
+PIPELINE_STAGES = ("all",)
+
+# Palet, karsilastirma ve ozet ciktilarini ureten backend:
+#   "matplotlib" -> src/visualization.py (figur + eksen, dpi=150)
+#   "cv2"        -> src/render.py (NumPy birlestirme + cv2.putText, hizli)
+RENDER_BACKEND = "matplotlib"
+
+# cv2 backend'inde karsilastirma / ozet ciktisinin en fazla genisligi
+RENDER_MAX_WIDTH = 2100
+
+# Segmented goruntunun kayit formati:
+#   "indexed" -> 8-bit paletli PNG (piksel basina 1 byte, K <= 256)
+#   "rgb"     -> 24-bit RGB PNG
+SEGMENTED_FORMAT = "indexed"
+
+# Etiket haritasinin kayit formati ("npz", "png" veya None)
+LABEL_MAP_FORMAT = "npz"
+
+# Merkezler, yuzdeler ve isimleri tutan JSON dosyasi (None ise yazilmaz)
+PALETTE_SIDECAR_FILE = "palette.json"
+
+# Bolge adimi: bu alandan (piksel) kucuk bolgeler en uzun ortak sinira
+# sahip komsusuna birlestirilir (0 ise birlestirme yapilmaz)
+REGION_MIN_AREA = 64
+
+# Bolge bilesenlerinin komsulugu (4 veya 8)
+REGION_CONNECTIVITY = 4
+
+# Bolge haritasi ve bolge bilgilerinin NPZ dosyasi (None ise yazilmaz)
+REGIONS_FILE = "regions.npz"
+
+# Palet indeksi (src/palette_index.py): benzer paletli goruntu aramasi
+# icin imza klasoru, kayit basina tutulan en fazla renk, varsayilan
+# sonuc sayisi ve imza benzerligiyle secilip gercek palet mesafesiyle
+# yeniden siralanan aday sayisi
+PALETTE_INDEX_DIR = "outputs/palette_index"
+PALETTE_INDEX_MAX_COLORS = 16
+PALETTE_INDEX_TOP_K = 10
+PALETTE_INDEX_CANDIDATES = 2000
+
+# Histogram sayimlarinin disa aktarim formati ("json", "npy" veya None)
+HISTOGRAM_EXPORT_FORMAT = "json"
+
+# 24-bit RGB -> renk ismi / LAB arama tablolarinin onbellek klasoru
+COLOR_LUT_CACHE_DIR = ".cache/color_lut"
+
+# Asama onbellegi: ayni goruntu + ayni parametrelerle K-Means,
+# dominant renk ve isimlendirme sonuclari diskten okunur
+STAGE_CACHE_ENABLED = False
+STAGE_CACHE_DIR = ".cache/stages"
+STAGE_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# HTTP palet servisi (python main.py serve): adres, isci surec sayisi
+# (None: tum cekirdekler), isciler mesgulken bekletilecek istek sayisi
+# (asilirsa 503), istek zaman asimi (sn) ve en buyuk govde boyutu
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8000
+SERVER_WORKERS = None
+SERVER_QUEUE_SIZE = 16
+SERVER_TIMEOUT = 30.0
+SERVER_MAX_BODY_BYTES = 50 * 1024 * 1024
+
+# Servisin varsayilan kumeleme modu (istekte ?mode= ile degisir)
+SERVER_KMEANS_MODE = "downsample"
+
+# Video modu: sahne gecisi sayilacak histogram farki esigi (0-1)
+# ve cikti videosu codec'i
+VIDEO_SCENE_CUT_THRESHOLD = 0.35
+VIDEO_FOURCC = "mp4v"
+
+# Asama olcum raporu (sure, CPU, bellek) - None ise yazilmaz
+RUN_REPORT_FILE = "run_report.json"
+
+# Her asama icin cProfile ciktisi (outputs/.../profiles/*.prof)
+PROFILE_STAGES = False
+
+# tracemalloc ile asama ici tepe bellek olcumu (yavaslatir)
+TRACE_MEMORY = False
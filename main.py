@@ -4,69 +4,462 @@
 # Bu dosya sadece modulleri cagirarak pipeline'i yonetir.
 # Tum is mantigi src/ icerisindeki modullerde bulunur.
 # main.py = controller, src/ = logic
+#
+# Kullanim:
+#   python main.py [secenekler]                        -> tek goruntu
+#   python main.py batch <klasor|glob> [N] [secenekler] -> N isci ile toplu islem
+#   python main.py batch <klasor|glob> --pipelined      -> okuma/yazma ortusmeli
+#   python main.py video <girdi> [cikti] [secenekler]   -> video karelerini posterize et
+#   python main.py serve [--host H] [--port P] [--workers N] -> HTTP palet servisi
+#   python main.py batch <klasor|glob> --index [DIR]    -> paletleri indekse ekle
+#   python main.py search <goruntu|palette.json> [--top N] -> benzer paletler
+#   python main.py collection <klasor|glob> [N] [secenekler] -> ortak palet + esleme
+#
+# Ortak secenekler config.py degerlerini ezer:
+#   --output-dir, --k, --random-state, --unique-colors,
+#   --backend sklearn|cv2|numba (video modu yalnizca bunlari kabul eder),
+#   --image, --mode, --auto-k, --report-drift, --renderer matplotlib|cv2,
+#   --scale 1|2|4|8, --target-size N,
+#   --only palette|histogram,segmentation,..., --no-plots
+#
+# Agir kutuphaneler (cv2, sklearn, matplotlib) burada import edilmez;
+# her mod ve her adim sadece ihtiyac duydugu modulu yukler.
 
-from config import IMAGE_PATH, OUTPUT_DIR, K_CLUSTERS, RANDOM_STATE
+import argparse
+import os
+import sys
 
-from src.image_io import load_image, save_image
-from src.pixel_analysis import get_image_info, extract_pixels
-from src.histogram import plot_rgb_histogram, plot_combined_histogram
-from src.clustering import apply_kmeans, get_dominant_colors
-from src.segmentation import segment_image, create_label_map
-from src.color_categorization import categorize_centers
-from src.visualization import plot_color_palette, plot_comparison, plot_summary
+from config import (
+    IMAGE_PATH,
+    OUTPUT_DIR,
+    K_CLUSTERS,
+    RANDOM_STATE,
+    BATCH_WORKERS,
+    BATCH_PIPELINED,
+    VIDEO_SCENE_CUT_THRESHOLD,
+    VIDEO_FOURCC,
+    KMEANS_UNIQUE_COLORS,
+    KMEANS_MODE,
+    PIPELINE_STAGES,
+    AUTO_K,
+    REPORT_PALETTE_DRIFT,
+    RENDER_BACKEND,
+    KMEANS_BACKEND,
+    LOAD_SCALE,
+    LOAD_TARGET_SIZE,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_WORKERS,
+    PALETTE_INDEX_DIR,
+    PALETTE_INDEX_TOP_K,
+)
 
 
-def main():
+def main(
+    image_path=IMAGE_PATH,
+    output_dir=OUTPUT_DIR,
+    k=K_CLUSTERS,
+    random_state=RANDOM_STATE,
+    **pipeline_options,
+):
     """Vision Color Pipeline - Ana fonksiyon.
 
     Bir goruntunun piksel analizinden renk kumeleme ve
     segmentasyona kadar tum adimlari sirasiyla calistirir.
     """
+    from src.pipeline import run_pipeline
+
     print("=" * 55)
     print("  VISION COLOR PIPELINE")
     print("=" * 55)
 
-    # 1. Goruntu yukleme
-    print("\n[ADIM 1] Goruntu yukleniyor...")
-    image = load_image(IMAGE_PATH)
-
-    # 2. Piksel analizi
-    print("\n[ADIM 2] Piksel analizi yapiliyor...")
-    get_image_info(image)
-    pixels = extract_pixels(image)
-
-    # 3. Histogram
-    print("\n[ADIM 3] Histogramlar olusturuluyor...")
-    plot_rgb_histogram(image, OUTPUT_DIR)
-    plot_combined_histogram(image, OUTPUT_DIR)
-
-    # 4. K-Means kumeleme
-    print("\n[ADIM 4] K-Means kumeleme basliyor...")
-    labels, centers = apply_kmeans(pixels, K_CLUSTERS, RANDOM_STATE)
-    dominant_colors = get_dominant_colors(centers, labels)
-
-    # 5. Segmentasyon
-    print("\n[ADIM 5] Segmentasyon yapiliyor...")
-    segmented = segment_image(labels, centers, image.shape)
-    create_label_map(labels, image.shape)
-    save_image(segmented, "segmented.png", OUTPUT_DIR)
-
-    # 6. Renk kategorizasyonu
-    print("\n[ADIM 6] Renkler isimlendiriliyor...")
-    color_names = categorize_centers(centers)
-
-    # 7. Gorsellestirme
-    print("\n[ADIM 7] Gorsellestirmeler olusturuluyor...")
-    plot_color_palette(dominant_colors, color_names, OUTPUT_DIR)
-    plot_comparison(image, segmented, OUTPUT_DIR)
-    plot_summary(image, segmented, dominant_colors, color_names, OUTPUT_DIR)
+    run_pipeline(image_path, output_dir, k, random_state, **pipeline_options)
 
     # Tamamlandi
     print("\n" + "=" * 55)
     print("  PIPELINE TAMAMLANDI!")
-    print(f"  Ciktilar: {OUTPUT_DIR}")
+    print(f"  Ciktilar: {output_dir}")
+    print("=" * 55)
+
+
+def main_batch(
+    source: str,
+    workers=BATCH_WORKERS,
+    output_dir=OUTPUT_DIR,
+    k=K_CLUSTERS,
+    random_state=RANDOM_STATE,
+    **pipeline_options,
+):
+    """Toplu mod - bir klasordeki tum goruntuleri paralel isler.
+
+    Args:
+        source: Klasor yolu veya glob deseni (orn: "data/*.jpg").
+        workers: Isci surec sayisi. None ise tum cekirdekler.
+    """
+    from src.batch import run_batch
+
+    print("=" * 55)
+    print("  VISION COLOR PIPELINE - TOPLU MOD")
+    print("=" * 55)
+
+    run_batch(
+        source, output_dir, k, random_state, workers, **pipeline_options
+    )
+
+
+def main_collection(
+    source: str,
+    workers=BATCH_WORKERS,
+    output_dir=OUTPUT_DIR,
+    k=K_CLUSTERS,
+    random_state=RANDOM_STATE,
+    **pipeline_options,
+):
+    """Koleksiyon modu - tum goruntuler icin tek ortak K renkli palet.
+
+    Palet goruntu orneklerinden akisli ogrenilir, ardindan her
+    goruntu bu palete gore paralel segmentlenir.
+
+    Args:
+        source: Klasor yolu veya glob deseni (orn: "data/*.jpg").
+        workers: Esleme gecisindeki isci surec sayisi.
+    """
+    from src.collection import run_collection
+
+    print("=" * 55)
+    print("  VISION COLOR PIPELINE - KOLEKSIYON MODU")
     print("=" * 55)
 
+    summary = run_collection(
+        source, output_dir, k, random_state, workers, **pipeline_options
+    )
+
+    print("ORTAK PALET")
+    for color in summary["collection"]["colors"]:
+        r, g, b = color["rgb"]
+        print(f"  #{color['color_id']:<3} RGB({r:3d}, {g:3d}, {b:3d})  "
+              f"%{color['percentage']:<6} {color['name']}")
+    print(f"[OK] Palet dosyasi: {summary['collection']['palette_file']}")
+
+
+def main_video(
+    input_path: str,
+    output_path: str = None,
+    output_dir=OUTPUT_DIR,
+    k=K_CLUSTERS,
+    random_state=RANDOM_STATE,
+    unique_colors=KMEANS_UNIQUE_COLORS,
+    kmeans_backend=KMEANS_BACKEND,
+):
+    """Video modu - her kareyi K renge indirger.
+
+    Args:
+        input_path: Girdi video dosyasi.
+        output_path: Cikti video dosyasi. None ise
+            output_dir/<isim>_segmented.mp4.
+        kmeans_backend: K-Means motoru ("sklearn", "cv2", "numba").
+    """
+    from src.video import process_video
+
+    print("=" * 55)
+    print("  VISION COLOR PIPELINE - VIDEO MODU")
+    print("=" * 55)
+
+    if output_path is None:
+        stem = os.path.splitext(os.path.basename(input_path))[0]
+        output_path = os.path.join(output_dir, f"{stem}_segmented.mp4")
+
+    process_video(
+        input_path, output_path, k, random_state,
+        VIDEO_SCENE_CUT_THRESHOLD, VIDEO_FOURCC, unique_colors,
+        backend=kmeans_backend,
+    )
+
+
+def main_serve(host: str, port: int, workers=SERVER_WORKERS):
+    """Servis modu - palet cikarmayi HTTP uzerinden sunar.
+
+    Args:
+        host: Dinlenecek adres.
+        port: Dinlenecek port.
+        workers: Isci surec sayisi. None ise tum cekirdekler.
+    """
+    from src.server import serve
+
+    print("=" * 55)
+    print("  VISION COLOR PIPELINE - SERVIS MODU")
+    print("=" * 55)
+
+    serve(host, port, workers)
+
+
+def main_search(
+    query: str,
+    index_dir=PALETTE_INDEX_DIR,
+    top_k=PALETTE_INDEX_TOP_K,
+    k=K_CLUSTERS,
+    random_state=RANDOM_STATE,
+):
+    """Arama modu - paleti sorguya en benzer indekslenmis goruntuler.
+
+    Args:
+        query: Sorgu goruntusu veya palette.json dosyasi.
+        index_dir: Palet indeksi klasoru.
+        top_k: Listelenecek sonuc sayisi.
+    """
+    import time
+
+    from src.palette_index import PaletteIndex, query_palette
+
+    print("=" * 55)
+    print("  VISION COLOR PIPELINE - PALET ARAMA")
+    print("=" * 55)
+
+    centers, percentages = query_palette(query, k, random_state)
+    index = PaletteIndex(index_dir)
+
+    start = time.perf_counter()
+    matches = index.search(centers, percentages, top_k)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"[OK] {len(index)} goruntu arandi ({elapsed_ms:.1f} ms)")
+    for rank, match in enumerate(matches, start=1):
+        print(f"  #{rank:<3} Delta-E {match['distance']:7.3f}  "
+              f"{match['image']}")
+
+
+def _common_options() -> argparse.ArgumentParser:
+    """Goruntu ve video modlarinda ortak olan (config.py'yi ezen) secenekler.
+
+    Varsayilanlar SUPPRESS'tir: verilmeyen secenek namespace'e hic
+    yazilmaz, boylece config.py degeri gecerli kalir.
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--output-dir", default=argparse.SUPPRESS,
+        help=f"Cikti klasoru (varsayilan: {OUTPUT_DIR})",
+    )
+    common.add_argument(
+        "--k", type=int, default=argparse.SUPPRESS,
+        help=f"Kume sayisi (varsayilan: {K_CLUSTERS})",
+    )
+    common.add_argument(
+        "--random-state", type=int, default=argparse.SUPPRESS,
+        help=f"Seed degeri (varsayilan: {RANDOM_STATE})",
+    )
+    common.add_argument(
+        "--unique-colors", action="store_true", default=argparse.SUPPRESS,
+        help="K-Means'i benzersiz renkler uzerinde agirlikli calistir",
+    )
+    common.add_argument(
+        "--backend", choices=("sklearn", "cv2", "numba"),
+        default=argparse.SUPPRESS,
+        help=f"K-Means motoru (varsayilan: {KMEANS_BACKEND})",
+    )
+    return common
+
+
+def _image_options() -> argparse.ArgumentParser:
+    """Yalnizca goruntu modlarinda (tek, batch, collection) gecerli secenekler.
+
+    Video modu bunlari kabul etmez (bkz. parse_args).
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--image", default=argparse.SUPPRESS,
+        help=f"Girdi goruntusu (varsayilan: {IMAGE_PATH})",
+    )
+    common.add_argument(
+        "--scale", type=int, choices=(1, 2, 4, 8), default=argparse.SUPPRESS,
+        help=f"Goruntuyu 1/N olcekte coz (varsayilan: {LOAD_SCALE})",
+    )
+    common.add_argument(
+        "--target-size", type=int, default=argparse.SUPPRESS,
+        help="Uzun kenari bu degerin altina dusurmeyen en kucuk olcekte coz",
+    )
+    common.add_argument(
+        "--mode", choices=("full", "streaming", "downsample", "palette"),
+        default=argparse.SUPPRESS,
+        help=f"Kumeleme modu (varsayilan: {KMEANS_MODE})",
+    )
+    common.add_argument(
+        "--auto-k", action="store_true", default=argparse.SUPPRESS,
+        help="K'yi AUTO_K_RANGE araligindan otomatik sec (--k yedek olur)",
+    )
+    common.add_argument(
+        "--report-drift", action="store_true", default=argparse.SUPPRESS,
+        help="Streaming/downsample modunda tam fit ile palet farkini "
+             "(Delta-E) olc ve calistirma raporuna yaz",
+    )
+    common.add_argument(
+        "--renderer", choices=("matplotlib", "cv2"), default=argparse.SUPPRESS,
+        help=f"Palet/karsilastirma/ozet cizimi (varsayilan: {RENDER_BACKEND})",
+    )
+    common.add_argument(
+        "--only", default=argparse.SUPPRESS,
+        help="Sadece bu adimlari calistir, virgulle ayrilmis "
+             "(histogram, segmentation, regions, naming, plots) veya hazir grup "
+             "(all, palette, segment)",
+    )
+    common.add_argument(
+        "--no-plots", action="store_true", default=argparse.SUPPRESS,
+        help="matplotlib grafiklerini uretme (matplotlib import edilmez)",
+    )
+    return common
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Komut satiri argumanlarini ayristirir."""
+    common = _common_options()
+    image_options = _image_options()
+
+    parser = argparse.ArgumentParser(
+        description="Vision Color Pipeline", parents=[common, image_options]
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch = subparsers.add_parser(
+        "batch", parents=[common, image_options],
+        help="Klasor/glob icin toplu islem",
+    )
+    batch.add_argument("source", help="Klasor yolu veya glob deseni")
+    batch.add_argument(
+        "workers", nargs="?", type=int, default=BATCH_WORKERS,
+        help="Isci surec sayisi (varsayilan: tum cekirdekler)",
+    )
+    batch.add_argument(
+        "--pipelined", action="store_true", default=BATCH_PIPELINED,
+        help="Tek surecte onden okuma + arka plan yazma ile calis",
+    )
+    batch.add_argument(
+        "--index", nargs="?", const=PALETTE_INDEX_DIR, default=None,
+        help=f"Paletleri palet indeksine ekle (varsayilan: {PALETTE_INDEX_DIR})",
+    )
+
+    collection = subparsers.add_parser(
+        "collection", parents=[common, image_options],
+        help="Koleksiyon icin ortak palet ogren ve her goruntuyu esle",
+    )
+    collection.add_argument("source", help="Klasor yolu veya glob deseni")
+    collection.add_argument(
+        "workers", nargs="?", type=int, default=BATCH_WORKERS,
+        help="Esleme gecisindeki isci surec sayisi (varsayilan: tum cekirdekler)",
+    )
+    collection.add_argument(
+        "--pipelined", action="store_true", default=BATCH_PIPELINED,
+        help="Esleme gecisini tek surecte onden okuma ile calistir",
+    )
+    collection.add_argument(
+        "--index", nargs="?", const=PALETTE_INDEX_DIR, default=None,
+        help=f"Paletleri palet indeksine ekle (varsayilan: {PALETTE_INDEX_DIR})",
+    )
+
+    search = subparsers.add_parser(
+        "search", help="Paleti sorguya benzeyen indekslenmis goruntuleri bul",
+    )
+    search.add_argument("query", help="Sorgu goruntusu veya palette.json")
+    search.add_argument(
+        "--index", default=PALETTE_INDEX_DIR,
+        help=f"Palet indeksi klasoru (varsayilan: {PALETTE_INDEX_DIR})",
+    )
+    search.add_argument(
+        "--top", type=int, default=PALETTE_INDEX_TOP_K,
+        help=f"Sonuc sayisi (varsayilan: {PALETTE_INDEX_TOP_K})",
+    )
+
+    serve = subparsers.add_parser(
+        "serve", help="HTTP palet servisi (isitilmis surec havuzu)"
+    )
+    serve.add_argument("--host", default=SERVER_HOST)
+    serve.add_argument("--port", type=int, default=SERVER_PORT)
+    serve.add_argument(
+        "--workers", type=int, default=SERVER_WORKERS,
+        help="Isci surec sayisi (varsayilan: tum cekirdekler)",
+    )
+
+    video = subparsers.add_parser(
+        "video", parents=[common], help="Video karelerini posterize et"
+    )
+    video.add_argument("input", help="Girdi video dosyasi")
+    video.add_argument("output", nargs="?", default=None, help="Cikti video")
+
+    args = parser.parse_args(argv)
+
+    # Alt komuttan once verilen goruntu secenekleri video modunda yok sayilirdi
+    if args.command == "video":
+        ignored = [
+            action.option_strings[0] for action in image_options._actions
+            if hasattr(args, action.dest)
+        ]
+        if ignored:
+            video.error(f"video modunda gecersiz secenek: {', '.join(ignored)}")
+
+    return args
+
+
+def _selected_stages(args: argparse.Namespace) -> frozenset:
+    """--only / --no-plots seceneklerinden calisacak adimlari belirler."""
+    from src.pipeline import resolve_stages
+
+    names = args.only.split(",") if hasattr(args, "only") else PIPELINE_STAGES
+    stages = resolve_stages(name.strip() for name in names if name.strip())
+
+    if getattr(args, "no_plots", False):
+        stages = stages - {"plots"}
+
+    return stages
+
+
+def _check_backend(backend: str, unique_colors: bool) -> None:
+    """--backend / --unique-colors uyumunu calistirmadan once dogrular."""
+    from src.kmeans_backends import check_backend
+
+    check_backend(backend, weighted=unique_colors)
+
 
 if __name__ == "__main__":
-    main()
+    args = parse_args(sys.argv[1:])
+
+    settings = {
+        "output_dir": getattr(args, "output_dir", OUTPUT_DIR),
+        "k": getattr(args, "k", K_CLUSTERS),
+        "random_state": getattr(args, "random_state", RANDOM_STATE),
+    }
+    unique_colors = getattr(args, "unique_colors", KMEANS_UNIQUE_COLORS)
+    kmeans_backend = getattr(args, "backend", KMEANS_BACKEND)
+    try:
+        stages = _selected_stages(args)
+        _check_backend(kmeans_backend, unique_colors)
+    except ValueError as exc:
+        sys.exit(f"[HATA] {exc}")
+
+    pipeline_options = {
+        "unique_colors": unique_colors,
+        "kmeans_mode": getattr(args, "mode", KMEANS_MODE),
+        "auto_k": getattr(args, "auto_k", AUTO_K),
+        "report_drift": getattr(args, "report_drift", REPORT_PALETTE_DRIFT),
+        "renderer": getattr(args, "renderer", RENDER_BACKEND),
+        "kmeans_backend": kmeans_backend,
+        "load_scale": getattr(args, "scale", LOAD_SCALE),
+        "load_target_size": getattr(args, "target_size", LOAD_TARGET_SIZE),
+        "stages": stages,
+    }
+
+    if args.command == "batch":
+        main_batch(args.source, args.workers, **settings,
+                   pipelined=args.pipelined, index_dir=args.index,
+                   **pipeline_options)
+    elif args.command == "serve":
+        main_serve(args.host, args.port, args.workers)
+    elif args.command == "collection":
+        main_collection(args.source, args.workers, **settings,
+                        pipelined=args.pipelined, index_dir=args.index,
+                        **pipeline_options)
+    elif args.command == "search":
+        main_search(args.query, args.index, args.top,
+                    settings["k"], settings["random_state"])
+    elif args.command == "video":
+        main_video(args.input, args.output, **settings,
+                   unique_colors=unique_colors, kmeans_backend=kmeans_backend)
+    else:
+        main(getattr(args, "image", IMAGE_PATH), **settings, **pipeline_options)
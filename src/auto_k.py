@@ -0,0 +1,287 @@
+# ==================================================
+# AUTO K - Otomatik Küme Sayısı Seçimi
+# ==================================================
+# Sabit K_CLUSTERS yerine bir K aralığı, görüntüden alınan
+# ortak küçük bir piksel örneği üzerinde denenir:
+#
+#   - her K için K-Means örnek üzerinde fit edilir (paralel)
+#   - inertia eğrisinin dirsek (elbow) noktası bulunur
+#   - her K için örneklenmiş Davies-Bouldin ve (seçilirse)
+#     silhouette skorları hesaplanır
+#
+# Seçilen K ile tam çözünürlükteki K-Means yalnızca bir kez
+# çalışır. Tüm seçim bir süre bütçesiyle sınırlıdır; bütçe
+# dolduğunda o ana kadar biten K değerleri arasından seçilir.
+# Bütçe verildiğinde fit'ler iterasyon dilimleriyle ilerler; her
+# dilimin max_iter'ı kalan süreye sığacak kadar seçilir. Böylece
+# bütçe dolduğunda tüm thread'ler durur ve select_k() arkasında
+# çalışan iş bırakmaz.
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import List, Optional, Sequence
+
+import numpy as np
+from sklearn.cluster import KMeans, kmeans_plusplus
+from sklearn.metrics import davies_bouldin_score, silhouette_score
+from threadpoolctl import threadpool_limits
+
+from src.clustering import restart_seeds, sample_pixels
+
+
+# Örnek üzerindeki fit'lerde başlangıç sayısı (tam fit'ten az)
+_SAMPLE_N_INIT = 3
+# Bütçeli fit'lerde ilk dilimin Lloyd iterasyonu ve toplam sınır
+_FIT_CHUNK_ITER = 10
+_FIT_MAX_ITER = 300
+
+METRICS = ("silhouette", "davies_bouldin", "elbow")
+
+
+def _past(deadline: Optional[float]) -> bool:
+    """Süre bütçesinin (perf_counter zamanı) dolup dolmadığı."""
+    return deadline is not None and time.perf_counter() >= deadline
+
+
+def _fit_sample(
+    sample: np.ndarray,
+    k: int,
+    random_state: int,
+    deadline: Optional[float],
+) -> Optional[KMeans]:
+    """Örneği _SAMPLE_N_INIT başlangıçla fit eder; en iyi modeli döndürür.
+
+    deadline (perf_counter zamanı) verilirse her Lloyd çalıştırması
+    dilimlerle, bir önceki dilimin merkezlerinden devam ederek
+    ilerler. İlk dilim _FIT_CHUNK_ITER iterasyondur; sonrakiler
+    ölçülen iterasyon süresiyle kalan süreye sığacak kadar seçilir.
+    Bir dilim başlamadan deadline dolmuşsa None döner.
+    """
+    best = None
+    for seed in restart_seeds(random_state, _SAMPLE_N_INIT):
+        centers, _ = kmeans_plusplus(sample, k, random_state=seed)
+        total_iter = 0
+        chunk = _FIT_MAX_ITER if deadline is None else _FIT_CHUNK_ITER
+        while True:
+            if _past(deadline):
+                return None
+            chunk = min(chunk, _FIT_MAX_ITER - total_iter)
+            chunk_start = time.perf_counter()
+            kmeans = KMeans(
+                n_clusters=k, init=centers, n_init=1, max_iter=chunk,
+            ).fit(sample)
+            centers = kmeans.cluster_centers_
+            total_iter += kmeans.n_iter_
+            if kmeans.n_iter_ < chunk or total_iter >= _FIT_MAX_ITER:
+                break
+            per_iter = (time.perf_counter() - chunk_start) / chunk
+            if deadline is not None and per_iter > 0:
+                left = deadline - time.perf_counter()
+                chunk = max(1, int(left / per_iter))
+        if best is None or kmeans.inertia_ < best.inertia_:
+            best = kmeans
+    return best
+
+
+def _evaluate_k(
+    sample: np.ndarray,
+    score_sample: np.ndarray,
+    k: int,
+    random_state: int,
+    with_silhouette: bool,
+    deadline: Optional[float] = None,
+) -> Optional[dict]:
+    """Tek bir K değerini örnek üzerinde fit edip skorlar.
+
+    Davies-Bouldin ucuzdur (O(n K)) ve her zaman hesaplanır;
+    silhouette O(n^2) olduğundan yalnızca istenirse hesaplanır.
+    deadline (perf_counter zamanı) fit veya skorlama başlamadan
+    dolarsa None döner.
+    """
+    start = time.perf_counter()
+
+    kmeans = _fit_sample(sample, k, random_state, deadline)
+    if kmeans is None or _past(deadline):
+        return None
+
+    score_labels = kmeans.predict(score_sample)
+    silhouette = davies_bouldin = None
+    # Skor örneğinde tek küme kalırsa metrikler tanımsızdır
+    if len(np.unique(score_labels)) > 1:
+        davies_bouldin = float(davies_bouldin_score(score_sample, score_labels))
+        if with_silhouette:
+            silhouette = float(silhouette_score(score_sample, score_labels))
+
+    return {
+        "k": k,
+        "inertia": float(kmeans.inertia_),
+        "silhouette": silhouette,
+        "davies_bouldin": davies_bouldin,
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+def elbow_k(scores: List[dict]) -> Optional[int]:
+    """Inertia eğrisinin dirsek noktasındaki K'yı bulur.
+
+    K ve inertia değerleri 0-1 aralığına ölçeklenir; ilk ve son
+    noktayı birleştiren doğruya en uzak nokta dirsek kabul edilir.
+
+    Args:
+        scores: K'ya göre sıralı, "k" ve "inertia" içeren sözlükler.
+
+    Returns:
+        Dirsekteki K veya 3'ten az nokta varsa None.
+    """
+    if len(scores) < 3:
+        return None
+
+    ks = np.array([s["k"] for s in scores], dtype=np.float64)
+    inertias = np.array([s["inertia"] for s in scores], dtype=np.float64)
+
+    x = (ks - ks[0]) / (ks[-1] - ks[0])
+    span = inertias[0] - inertias[-1]
+    y = (inertias - inertias[-1]) / span if span > 0 else np.zeros_like(x)
+
+    # Doğru (0, 1) -> (1, 0): x + y = 1; uzaklık |x + y - 1| / sqrt(2)
+    distances = np.abs(x + y - 1.0)
+    return int(ks[distances.argmax()])
+
+
+def select_k(
+    image: np.ndarray,
+    k_values: Sequence[int],
+    random_state: int,
+    sample_size: int,
+    score_sample_size: int,
+    metric: str = "silhouette",
+    time_budget: Optional[float] = None,
+    workers: Optional[int] = None,
+    sample_method: str = "resize",
+    fallback_k: Optional[int] = None,
+) -> dict:
+    """Bir K aralığını örnek üzerinde paralel olarak dener ve en iyisini seçer.
+
+    Tüm K değerleri aynı örnek üzerinde değerlendirildiğinden
+    inertia değerleri karşılaştırılabilir. Her fit bir thread'de
+    çalışır (sklearn'ün K-Means döngüleri GIL'i bırakır); OpenMP/BLAS
+    thread'leri çekirdekleri aşırı yüklememek için 1'e sınırlanır.
+    Bütçe dolunca çalışan fit'ler bir sonraki iterasyon diliminde
+    durur; thread sınırı tüm thread'ler bitene kadar geçerli kalır.
+
+    Seçim kuralı:
+      "silhouette"     -> en yüksek örneklenmiş silhouette
+      "davies_bouldin" -> en düşük Davies-Bouldin
+      "elbow"          -> inertia eğrisinin dirseği
+    Metrik hesaplanamazsa dirsek, o da yoksa fallback_k kullanılır.
+
+    Args:
+        image: RGB formatında numpy dizisi (H, W, 3).
+        k_values: Denenecek K değerleri (örn. range(3, 13)).
+        random_state: Tekrarlanabilirlik için seed değeri.
+        sample_size: Fit için ortak örneğin yaklaşık piksel sayısı.
+        score_sample_size: Silhouette / Davies-Bouldin için kullanılacak
+            piksel sayısı (silhouette O(n^2) olduğundan küçük tutulur).
+        metric: "silhouette", "davies_bouldin" veya "elbow".
+        time_budget: Saniye cinsinden toplam süre sınırı. Dolduğunda
+            başlamamış K'lar iptal edilir, çalışanlar bir iterasyon
+            dilimi içinde bırakılır ve biten K'lar arasından seçilir.
+        workers: Paralel fit sayısı. None ise os.cpu_count().
+        sample_method: sample_pixels() yöntemi ("resize" / "stratified").
+        fallback_k: Hiçbir K bütçe içinde bitmezse dönecek K.
+
+    Returns:
+        {"k": seçilen K, "metric": ..., "elbow_k": ..., "scores": [...],
+         "evaluated": n, "timed_out": bool, "elapsed_seconds": ...}
+
+    Raises:
+        ValueError: Bilinmeyen metrik veya boş K aralığı verilirse.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Bilinmeyen metrik: {metric}")
+
+    k_values = sorted(set(int(k) for k in k_values))
+    if not k_values:
+        raise ValueError("K aralığı boş")
+
+    start = time.perf_counter()
+    print(f"[..] Otomatik K seçimi: K = {k_values[0]}..{k_values[-1]}, "
+          f"metrik: {metric}")
+
+    sample = sample_pixels(image, sample_size, sample_method, random_state)
+    k_values = [k for k in k_values if k <= len(sample)]
+
+    rng = np.random.default_rng(random_state)
+    if len(sample) > score_sample_size:
+        score_sample = sample[
+            rng.choice(len(sample), score_sample_size, replace=False)
+        ]
+    else:
+        score_sample = sample
+
+    timed_out = False
+    remaining = deadline = None
+    if time_budget is not None:
+        deadline = start + time_budget
+        remaining = max(0.0, deadline - time.perf_counter())
+
+    with threadpool_limits(limits=1):
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = [
+            executor.submit(
+                _evaluate_k, sample, score_sample, k, random_state,
+                metric == "silhouette", deadline,
+            )
+            for k in k_values
+        ]
+        try:
+            for future in as_completed(futures, timeout=remaining):
+                future.result()
+        except FutureTimeoutError:
+            timed_out = True
+        finally:
+            # Bekleyen K'lar iptal edilir; çalışanlar deadline'ı görüp
+            # bir dilim içinde biter ve thread sınırı altında beklenir
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    scores = [
+        f.result() for f in futures
+        if not f.cancelled() and f.result() is not None
+    ]
+    timed_out = timed_out or len(scores) < len(futures)
+    scores.sort(key=lambda s: s["k"])
+    elbow = elbow_k(scores)
+
+    chosen = None
+    if metric == "silhouette":
+        valid = [s for s in scores if s["silhouette"] is not None]
+        if valid:
+            chosen = max(valid, key=lambda s: s["silhouette"])["k"]
+    elif metric == "davies_bouldin":
+        valid = [s for s in scores if s["davies_bouldin"] is not None]
+        if valid:
+            chosen = min(valid, key=lambda s: s["davies_bouldin"])["k"]
+    if chosen is None:
+        chosen = elbow
+    if chosen is None:
+        chosen = fallback_k if fallback_k is not None else k_values[0]
+
+    elapsed = time.perf_counter() - start
+
+    print(f"[OK] Otomatik K seçimi tamamlandı: K = {chosen}")
+    print(f"     Denenen K: {len(scores)}/{len(k_values)}"
+          f"{' (süre bütçesi doldu)' if timed_out else ''}")
+    print(f"     Dirsek K : {elbow}")
+    print(f"     Süre     : {elapsed:.2f} sn")
+
+    return {
+        "k": int(chosen),
+        "metric": metric,
+        "elbow_k": elbow,
+        "scores": scores,
+        "evaluated": len(scores),
+        "timed_out": timed_out,
+        "sample_pixels": len(sample),
+        "elapsed_seconds": round(elapsed, 3),
+    }
@@ -0,0 +1,344 @@
+# ==================================================
+# BATCH - Toplu Görüntü İşleme
+# ==================================================
+# Bir klasördeki (veya glob desenine uyan) tüm görüntüleri
+# bir süreç havuzu (ProcessPoolExecutor) üzerinde işler.
+#
+# Her işçi süreç sklearn, cv2 ve matplotlib'i yalnızca bir
+# kez import eder ve ardından çok sayıda görüntüyü işler.
+# Her görüntünün çıktıları kendi alt klasörüne yazılır,
+# tüm çalıştırmanın özeti ise JSON olarak kaydedilir.
+#
+# pipelined=True ise tek süreçte çalışılır: sıradaki görüntüler
+# arka planda çözülür, çıktılar arka planda yazılır; okuma ve
+# yazma beklemesi K-Means hesaplamasıyla örtüşür (src/io_pipeline.py).
+
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from typing import List, Optional
+
+from config import (
+    IMAGE_EXTENSIONS,
+    BATCH_SUMMARY_FILE,
+    BATCH_PIPELINED,
+    PREFETCH_DEPTH,
+    WRITER_THREADS,
+    WRITER_MAX_PENDING,
+    LOAD_SCALE,
+    LOAD_TARGET_SIZE,
+)
+from src.image_io import load_image
+from src.io_pipeline import BackgroundWriter, prefetch_images
+from src.pipeline import run_pipeline
+
+
+def collect_images(source: str) -> List[str]:
+    """Bir klasördeki veya glob desenine uyan görüntüleri listeler.
+
+    Args:
+        source: Klasör yolu (örn: "data/") veya glob deseni
+            (örn: "data/**/*.jpg").
+
+    Returns:
+        Sıralanmış görüntü yolları listesi.
+
+    Raises:
+        FileNotFoundError: Hiç görüntü bulunamazsa.
+    """
+    if os.path.isdir(source):
+        candidates = [
+            os.path.join(source, name) for name in os.listdir(source)
+        ]
+    else:
+        candidates = glob.glob(source, recursive=True)
+
+    paths = sorted(
+        path for path in candidates
+        if os.path.isfile(path)
+        and os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
+    )
+
+    if not paths:
+        raise FileNotFoundError(f"Görüntü bulunamadı: {source}")
+
+    return paths
+
+
+def _output_subdirs(paths: List[str], output_dir: str) -> List[str]:
+    """Her görüntü için benzersiz bir çıktı alt klasörü belirler.
+
+    Alt klasör adı dosya adından (uzantısız) türetilir. Ad daha önce
+    verilmişse (aynı isimli dosya veya "a_2.png" gibi zaten sonekli
+    bir dosya) sonuna kullanılmayan ilk _2, _3 ... eklenir. Adlar
+    büyük/küçük harf duyarsız karşılaştırılır (macOS/Windows).
+    """
+    assigned = set()
+    subdirs = []
+
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        name, suffix = stem, 1
+        while name.casefold() in assigned:
+            suffix += 1
+            name = f"{stem}_{suffix}"
+        assigned.add(name.casefold())
+        subdirs.append(os.path.join(output_dir, name))
+
+    return subdirs
+
+
+def _init_worker(threads_per_worker: int) -> None:
+    """İşçi süreci bir kez hazırlar.
+
+    Etkileşimsiz Agg backend'i seçer ve her işçinin OpenMP/BLAS
+    thread sayısını sınırlar; böylece N işçi x N thread ile
+    çekirdekler aşırı yüklenmez.
+    """
+    import matplotlib
+    from threadpoolctl import threadpool_limits
+
+    matplotlib.use("Agg")
+    threadpool_limits(limits=threads_per_worker)
+
+
+def _process_one(
+    image_path: str,
+    output_dir: str,
+    k: int,
+    random_state: int,
+    pipeline_options: dict,
+) -> dict:
+    """Tek bir görüntüyü işler; hatayı yakalayıp sonuca yazar.
+
+    Bir görüntüdeki hata tüm toplu çalıştırmayı durdurmaz.
+    """
+    try:
+        result = run_pipeline(
+            image_path, output_dir, k, random_state, **pipeline_options
+        )
+        result["status"] = "ok"
+    except Exception as exc:
+        result = _error_result(image_path, output_dir, exc)
+
+    return result
+
+
+def _error_result(image_path: str, output_dir: str, exc: Exception) -> dict:
+    """Başarısız bir görüntü için özet kaydı oluşturur."""
+    return {
+        "image": image_path,
+        "output_dir": os.path.abspath(output_dir),
+        "status": "error",
+        "error": f"{type(exc).__name__}: {exc}",
+    }
+
+
+def _run_pool(
+    paths: List[str],
+    subdirs: List[str],
+    k: int,
+    random_state: int,
+    workers: int,
+    pipeline_options: dict,
+) -> List[dict]:
+    """Görüntüleri süreç havuzunda paralel işler (her işçi bir görüntü)."""
+    cpu_count = os.cpu_count() or 1
+    threads_per_worker = max(1, cpu_count // workers)
+    results = [None] * len(paths)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(threads_per_worker,),
+    ) as executor:
+        futures = {
+            executor.submit(
+                _process_one, path, subdir, k, random_state, pipeline_options
+            ): i
+            for i, (path, subdir) in enumerate(zip(paths, subdirs))
+        }
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            results[index] = future.result()
+            status = results[index]["status"].upper()
+            print(f"[{status}] ({done}/{len(paths)}) {paths[index]}")
+
+    return results
+
+
+def _run_pipelined(
+    paths: List[str],
+    subdirs: List[str],
+    k: int,
+    random_state: int,
+    pipeline_options: dict,
+) -> List[dict]:
+    """Görüntüleri tek süreçte, okuma/yazmayı örtüştürerek işler.
+
+    Görüntü i kümelenirken i+1..i+PREFETCH_DEPTH arka planda çözülür;
+    PNG kodlama ve grafik kaydetme işleri BackgroundWriter'a verilir.
+    Yazma hataları ilgili görüntünün sonucuna işlenir.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    # Onden okuma, pipeline'in okuma olcegi secenekleriyle yapilir
+    loader = partial(
+        load_image,
+        scale=pipeline_options.get("load_scale", LOAD_SCALE),
+        target_size=pipeline_options.get("load_target_size", LOAD_TARGET_SIZE),
+    )
+
+    results = []
+    with BackgroundWriter(WRITER_THREADS, WRITER_MAX_PENDING) as writer:
+        images = prefetch_images(paths, PREFETCH_DEPTH, loader)
+        for done, (path, image, error) in enumerate(images, start=1):
+            subdir = subdirs[done - 1]
+            if error is None:
+                result = _process_one(
+                    path, subdir, k, random_state,
+                    {**pipeline_options, "image": image, "writer": writer},
+                )
+            else:
+                result = _error_result(path, subdir, error)
+
+            results.append(result)
+            print(f"[{result['status'].upper()}] ({done}/{len(paths)}) {path}")
+
+    for result in results:
+        write_errors = writer.errors.get(result["image"])
+        if write_errors and result["status"] == "ok":
+            result["status"] = "error"
+            result["error"] = "; ".join(write_errors)
+            print(f"[ERROR] Yazma hatası: {result['image']}: {result['error']}")
+
+    return results
+
+
+def _index_results(results: List[dict], index_dir: str) -> int:
+    """Başarılı görüntülerin paletlerini palet indeksine ekler."""
+    from src.palette_index import PaletteIndex, dominant_palette
+
+    items = []
+    for result in results:
+        if result["status"] == "ok" and result.get("dominant_colors"):
+            centers, percentages = dominant_palette(result["dominant_colors"])
+            items.append(
+                (os.path.abspath(result["image"]), centers, percentages)
+            )
+
+    index = PaletteIndex(index_dir)
+    added = index.add_many(items)
+    print(f"[OK] Palet indeksine {added} görüntü eklendi "
+          f"(toplam {len(index)}): {index_dir}")
+    return added
+
+
+def write_batch_summary(summary: dict, output_dir: str) -> str:
+    """Toplu çalıştırma özetini output_dir/BATCH_SUMMARY_FILE'a yazar.
+
+    Returns:
+        Yazılan dosyanın yolu.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    summary_path = os.path.join(output_dir, BATCH_SUMMARY_FILE)
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return summary_path
+
+
+def run_batch(
+    source: str,
+    output_dir: str,
+    k: int,
+    random_state: int,
+    workers: Optional[int] = None,
+    pipelined: bool = BATCH_PIPELINED,
+    index_dir: Optional[str] = None,
+    **pipeline_options,
+) -> dict:
+    """Birden çok görüntüyü süreç havuzunda paralel olarak işler.
+
+    Her görüntü için pipeline (yükleme -> piksel -> K-Means ->
+    seçilen adımlar) bir işçi süreçte çalışır. Sonunda tüm görüntülerin özeti output_dir altına
+    BATCH_SUMMARY_FILE olarak yazılır.
+
+    Args:
+        source: Klasör yolu veya glob deseni.
+        output_dir: Ana çıktı klasörü; her görüntü bir alt klasör alır.
+        k: Küme sayısı (dominant renk sayısı).
+        random_state: Tekrarlanabilirlik için seed değeri.
+        workers: İşçi süreç sayısı. None ise os.cpu_count().
+        pipelined: Süreç havuzu yerine tek süreçte önden okuma ve
+            arka plan yazma ile çalış (workers yok sayılır).
+        index_dir: Verilirse başarılı görüntülerin paletleri bu
+            klasördeki palet indeksine eklenir (bkz. PaletteIndex).
+        **pipeline_options: run_pipeline()'a aynen iletilen seçenekler
+            (stages, kmeans_mode, unique_colors ...).
+
+    Returns:
+        Toplu çalıştırma özeti (JSON'a yazılan sözlük).
+    """
+    paths = collect_images(source)
+    subdirs = _output_subdirs(paths, output_dir)
+
+    if pipelined:
+        workers = 1
+        print(f"[..] Toplu işlem başlatılıyor: {len(paths)} görüntü, "
+              f"önden okuma {PREFETCH_DEPTH}, yazıcı {WRITER_THREADS} thread")
+    else:
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+        print(f"[..] Toplu işlem başlatılıyor: {len(paths)} görüntü, "
+              f"{workers} işçi")
+
+    start = time.perf_counter()
+
+    if pipelined:
+        results = _run_pipelined(
+            paths, subdirs, k, random_state, pipeline_options
+        )
+    else:
+        results = _run_pool(
+            paths, subdirs, k, random_state, workers, pipeline_options
+        )
+
+    elapsed = time.perf_counter() - start
+    indexed = _index_results(results, index_dir) if index_dir else None
+
+    succeeded = sum(1 for r in results if r["status"] == "ok")
+
+    summary = {
+        "source": source,
+        "output_dir": os.path.abspath(output_dir),
+        "k": k,
+        "random_state": random_state,
+        "workers": workers,
+        "executor": "pipelined" if pipelined else "process",
+        "images": len(paths),
+        "succeeded": succeeded,
+        "failed": len(paths) - succeeded,
+        "elapsed_seconds": round(elapsed, 3),
+        "images_per_second": round(len(paths) / elapsed, 3),
+        "indexed": indexed,
+        "results": results,
+    }
+
+    summary_path = write_batch_summary(summary, output_dir)
+
+    print("=" * 45)
+    print("TOPLU İŞLEM ÖZETİ")
+    print("=" * 45)
+    print(f"  Görüntü      : {len(paths)}")
+    print(f"  Başarılı     : {succeeded}")
+    print(f"  Hatalı       : {len(paths) - succeeded}")
+    print(f"  Süre         : {elapsed:.2f} sn")
+    print(f"  Özet dosyası : {summary_path}")
+    print("=" * 45)
+
+    return summary
@@ -2,62 +2,662 @@
 # CLUSTERING - K-Means Renk Kümeleme
 # ==================================================
 
-from typing import List, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Tuple, Union
 
+import cv2
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans, kmeans_plusplus
+from threadpoolctl import threadpool_limits
+
+from config import (
+    KMEANS_INIT,
+    KMEANS_N_INIT,
+    KMEANS_TOL,
+    KMEANS_MAX_ITER,
+    KMEANS_SEED_SAMPLE_SIZE,
+    KMEANS_WORKERS,
+    KMEANS_PROBE_ITER,
+    KMEANS_ABANDON_RATIO,
+    KMEANS_BACKEND,
+)
+from src.kmeans_backends import LloydResult, check_backend, get_backend
+from src.pixel_analysis import iter_pixel_tiles
+
+
+def label_dtype(k: int) -> np.dtype:
+    """K küme için yeterli olan en küçük etiket tipini döndürür.
+
+    K <= 256 için uint8 (piksel başına 1 byte), aksi halde uint16.
+    """
+    return np.dtype(np.uint8) if k <= 256 else np.dtype(np.uint16)
+
+
+def compress_colors(
+    pixels: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pikselleri benzersiz renklerine ve tekrar sayılarına indirger.
+
+    Her piksel 24-bit bir anahtara (R << 16 | G << 8 | B) paketlenir.
+    Fotoğraflarda benzersiz renk sayısı genellikle piksel sayısından
+    çok daha azdır; K-Means bu renkler üzerinde ağırlıklı çalışabilir.
+
+    Args:
+        pixels: (N, 3) boyutunda piksel matrisi (0-255 aralığında),
+            uint8 veya float.
+
+    Returns:
+        colors: Benzersiz renkler (U, 3) - float32.
+        counts: Her benzersiz rengin piksel sayısı (U,).
+        inverse: Her pikselin colors içindeki indeksi (N,).
+    """
+    # Kanal kanal paketleme: (N, 3) uint32 ara kopya olusturulmaz
+    keys = pixels[:, 0].astype(np.uint32) << 16
+    keys |= pixels[:, 1].astype(np.uint32) << 8
+    keys |= pixels[:, 2].astype(np.uint32)
+
+    unique_keys, inverse, counts = np.unique(
+        keys, return_inverse=True, return_counts=True
+    )
+
+    colors = np.empty((len(unique_keys), 3), dtype=np.float32)
+    colors[:, 0] = unique_keys >> 16
+    colors[:, 1] = (unique_keys >> 8) & 0xFF
+    colors[:, 2] = unique_keys & 0xFF
+
+    return colors, counts, inverse.reshape(-1)
+
+
+def restart_seeds(random_state: Optional[int], n_init: int) -> List[int]:
+    """Her restart için random_state'ten bağımsız bir seed türetir.
+
+    Seed'ler restart sırasına bağlıdır, hangi işçide ve hangi
+    sırayla çalıştıklarına bağlı değildir.
+    """
+    sequence = np.random.SeedSequence(random_state)
+    return [int(seed) for seed in sequence.generate_state(n_init)]
+
+
+def _seed_centers(
+    data: np.ndarray,
+    weights: Optional[np.ndarray],
+    k: int,
+    init: str,
+    seed: int,
+    sample_size: Optional[int],
+) -> np.ndarray:
+    """Bir restart'ın başlangıç merkezlerini (örnek üzerinde) seçer.
+
+    k-means++ her merkez için tüm veriyi tarar; sample_size verilirse
+    seçim (ağırlıklıysa ağırlıkla orantılı çekilmiş) bir örnekte yapılır.
+    """
+    rng = np.random.default_rng(seed)
+
+    if sample_size and len(data) > sample_size:
+        p = None if weights is None else weights / weights.sum()
+        data = data[rng.choice(len(data), sample_size, p=p)]
+        weights = None
+
+    if init == "random":
+        return data[rng.choice(len(data), k, replace=False)].copy()
+    if init == "k-means++":
+        centers, _ = kmeans_plusplus(
+            data, k, sample_weight=weights, random_state=seed
+        )
+        return centers
+    raise ValueError(f"Bilinmeyen baslangic yontemi: {init}")
+
+
+def _run_restarts(
+    data: np.ndarray,
+    weights: Optional[np.ndarray],
+    k: int,
+    random_state: Optional[int],
+    init: str,
+    n_init: int,
+    tol: float,
+    max_iter: int,
+    seed_sample_size: Optional[int],
+    workers: Optional[int],
+    probe_iter: int,
+    abandon_ratio: float,
+    backend: str,
+) -> Tuple[LloydResult, dict]:
+    """n_init restart'ı paralel çalıştırır, en düşük inertia'lıyı döndürür.
+
+    1. Yoklama: her restart kendi seed'iyle başlatılır ve probe_iter
+       iterasyon çalışır.
+    2. Erken bırakma: inertia'sı en iyi yoklamanın abandon_ratio
+       katından büyük olan restart'lar bırakılır.
+    3. Kalanlar yoklama merkezlerinden devam edip yakınsar.
+
+    Backend iterasyon sayısı döndürmezse (n_iter None, örn. cv2)
+    yoklamadaki hiçbir restart yakınsamış sayılmaz: bırakılmayanlar
+    yoklama merkezlerinden devam eder ve n_iter istatistiği None olur.
+
+    Tüm kararlar yalnızca restart sonuçlarına bağlıdır; birden çok
+    restart OpenMP'siz (1 thread) çalıştığından sonuç işçi sayısından
+    bağımsızdır. Eşit inertia'da küçük restart numarası kazanır.
+    Bellekte yalnızca o ana kadarki en iyi restart'ın etiketleri tutulur.
+
+    Returns:
+        En iyi restart'ın (labels, centers, inertia, n_iter) sonucu ve
+        restart istatistikleri.
+    """
+    lloyd = get_backend(backend)
+    seeds = restart_seeds(random_state, n_init)
+    workers = max(1, min(n_init, workers or os.cpu_count() or 1))
+    probing = 0 < probe_iter < max_iter and n_init > 1
+
+    def start(index):
+        centers = _seed_centers(
+            data, weights, k, init, seeds[index], seed_sample_size
+        )
+        return lloyd(
+            data, weights, centers, tol, probe_iter if probing else max_iter
+        )
+
+    def resume(centers):
+        return lloyd(data, weights, centers, tol, max_iter - probe_iter)
+
+    best = None
+    total_iter = {}
+
+    def run(pool, jobs, final):
+        # Biten restart'lar en iyiyle karsilastirilir; yoklamada
+        # yakinsamayanlarin yalnizca inertia ve merkezleri dondurulur
+        nonlocal best
+        futures = {pool.submit(fn, arg): index
+                   for index, (fn, arg) in jobs.items()}
+        unfinished = {}
+        for future in as_completed(futures):
+            index = futures[future]
+            result = future.result()
+            _, centers, inertia, n_iter = result
+            if n_iter is None or total_iter.get(index, 0) is None:
+                total_iter[index] = None
+            else:
+                total_iter[index] = total_iter.get(index, 0) + n_iter
+            converged = n_iter is not None and n_iter < probe_iter
+            if final or converged:
+                if best is None or (inertia, index) < best[0]:
+                    best = ((inertia, index), result)
+            else:
+                unfinished[index] = (inertia, centers)
+        return unfinished
+
+    abandoned = 0
+
+    # Tek restart'ta OpenMP paralelligi korunur
+    limits = 1 if n_init > 1 else None
+    with threadpool_limits(limits=limits), ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="kmeans"
+    ) as pool:
+        probes = run(
+            pool, {i: (start, i) for i in range(n_init)}, final=not probing
+        )
+
+        if probes:
+            cutoff = abandon_ratio * min(
+                [inertia for inertia, _ in probes.values()]
+                + ([best[0][0]] if best else [])
+            )
+            survivors = {
+                index: (resume, centers)
+                for index, (inertia, centers) in probes.items()
+                if inertia <= cutoff
+            }
+            abandoned = len(probes) - len(survivors)
+            run(pool, survivors, final=True)
+
+    (inertia, index), result = best
+    return result, {
+        "n_iter": total_iter[index],
+        "inertia": inertia,
+        "restarts": n_init,
+        "abandoned": abandoned,
+        "best_restart": index,
+    }
 
 
 def apply_kmeans(
-    pixels: np.ndarray, k: int, random_state: int
+    pixels: np.ndarray,
+    k: int,
+    random_state: int,
+    unique_colors: bool = False,
+    init: Union[str, np.ndarray] = KMEANS_INIT,
+    n_init: int = KMEANS_N_INIT,
+    stats: Optional[dict] = None,
+    tol: float = KMEANS_TOL,
+    max_iter: int = KMEANS_MAX_ITER,
+    seed_sample_size: Optional[int] = KMEANS_SEED_SAMPLE_SIZE,
+    workers: Optional[int] = KMEANS_WORKERS,
+    probe_iter: int = KMEANS_PROBE_ITER,
+    abandon_ratio: float = KMEANS_ABANDON_RATIO,
+    backend: str = KMEANS_BACKEND,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Pikselleri K-Means algoritması ile K gruba ayırır.
 
     Her piksel, en yakın küme merkezine atanır.
     Sonuçta 16 milyon renk yerine sadece K adet renk kalır.
 
+    unique_colors=True ise K-Means tüm pikseller yerine benzersiz
+    renkler üzerinde, tekrar sayıları sample_weight olarak verilerek
+    çalışır. Etiketler ters indeks ile piksellere geri açılır;
+    dönen labels ve centers aynı boyut ve tiptedir.
+
+    uint8 girdi doğrudan kabul edilir: benzersiz renk modunda hiç
+    float kopya oluşturulmaz, tam modda sklearn'ün float64'e
+    yükseltmesi yerine float32'ye çevrilir. Etiketler K'ya göre
+    uint8/uint16 olarak döner.
+
+    n_init restart'ın her biri random_state'ten türetilen kendi
+    seed'iyle, seed_sample_size'lık bir örnekte başlatılır ve bir
+    thread havuzunda paralel çalışır (bkz. _run_restarts). Yoklama
+    iterasyonlarından sonra açıkça kaybeden restart'lar bırakılır.
+    Sonuç verilen random_state için işçi sayısından bağımsızdır.
+
     Args:
-        pixels: (N, 3) boyutunda float32 piksel matrisi.
+        pixels: (N, 3) boyutunda piksel matrisi (uint8 veya float32).
         k: Küme sayısı (kaç farklı renk istiyoruz).
         random_state: Tekrarlanabilirlik için seed değeri.
+        unique_colors: Benzersiz renk sıkıştırması kullanılsın mı.
+        init: Başlangıç yöntemi ("k-means++", "random") veya (K, 3)
+            başlangıç merkezleri (örn. önceki video karesinin merkezleri).
+        n_init: Farklı başlangıçlarla tekrar sayısı; en iyisi seçilir.
+            init bir dizi ise yok sayılır (tek çalıştırma).
+        stats: Verilirse fit bilgileri (n_iter, inertia, fit_samples,
+            restarts, abandoned) bu sözlüğe yazılır.
+        tol: Yakınsama toleransı (sklearn KMeans tol).
+        max_iter: Bir restart'ın en fazla iterasyon sayısı.
+        seed_sample_size: Başlangıç merkezlerinin seçildiği örnek
+            boyutu (None ise tüm veri).
+        workers: Paralel restart sayısı (None ise CPU sayısı).
+        probe_iter: Erken bırakma öncesi yoklama iterasyonu (0: kapalı).
+        abandon_ratio: Yoklamada en iyi inertia'nın bu katından kötü
+            olan restart'lar bırakılır.
+        backend: Lloyd çalıştırmalarını yapan motor ("sklearn", "cv2",
+            "numba"; bkz. src.kmeans_backends).
 
     Returns:
-        labels: Her pikselin ait olduğu küme indeksi (N,).
+        labels: Her pikselin ait olduğu küme indeksi (N,) - uint8/uint16.
         centers: Küme merkezleri, yani K adet RGB değeri (K, 3).
+
+    Raises:
+        ValueError: Backend bilinmiyorsa veya unique_colors ile
+            uyumsuzsa (örn. "cv2" ağırlık desteklemez).
     """
-    print(f"[..] K-Means başlatılıyor (K={k})...")
+    check_backend(backend, weighted=unique_colors)
 
-    kmeans = KMeans(n_clusters=k, random_state=random_state, n_init=10)
-    kmeans.fit(pixels)
+    print(f"[..] K-Means başlatılıyor (K={k}, {backend})...")
 
-    labels = kmeans.labels_
-    centers = kmeans.cluster_centers_
+    if unique_colors:
+        colors, counts, inverse = compress_colors(pixels)
+        print(f"     Benzersiz renk: {len(colors):,} "
+              f"({len(pixels):,} pikselden)")
+        data, weights = colors, counts.astype(np.float32)
+    else:
+        data, weights = pixels.astype(np.float32, copy=False), None
+
+    if isinstance(init, str):
+        result, restart_stats = _run_restarts(
+            data, weights, k, random_state, init, n_init, tol, max_iter,
+            seed_sample_size, workers, probe_iter, abandon_ratio, backend,
+        )
+    else:
+        result = get_backend(backend)(
+            data, weights, np.asarray(init, dtype=np.float32), tol, max_iter
+        )
+        restart_stats = {
+            "n_iter": result[3],
+            "inertia": result[2],
+            "restarts": 1,
+            "abandoned": 0,
+        }
+
+    labels, centers, _, _ = result
+    labels = labels.astype(label_dtype(k))
+    if unique_colors:
+        labels = labels[inverse]
+    centers = np.asarray(centers, dtype=np.float64)
+
+    if stats is not None:
+        stats.update(fit_samples=len(data), **restart_stats)
 
     print(f"[OK] K-Means tamamlandı.")
     print(f"     Küme sayısı: {k}")
+    if restart_stats["restarts"] > 1:
+        print(f"     Restart: {restart_stats['restarts']} "
+              f"(erken birakilan: {restart_stats['abandoned']})")
+    print(f"     Etiketlenen piksel: {len(labels):,}")
+
+    return labels, centers
+
+
+def apply_streaming_kmeans(
+    image: np.ndarray,
+    k: int,
+    random_state: int,
+    tile_rows: int,
+    n_epochs: int = 1,
+    init_sample_size: int = 100_000,
+    stats: Optional[dict] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Çok büyük görüntüler için akışlı (streaming) MiniBatch K-Means.
+
+    apply_kmeans() tüm (N, 3) float32 matrisini bellekte ister.
+    Bu fonksiyon ise görüntüyü tile'lar halinde iki kez dolaşır:
+
+    1. Her tile ile MiniBatchKMeans.partial_fit çağrılır
+       (n_epochs kez).
+    2. Her tile için en yakın merkez tahmin edilip etiket
+       dizisine yazılır.
+
+    Başlangıç merkezleri, tüm görüntüden adım adım (strided)
+    alınan küçük bir örnek üzerinde k-means++ ile seçilir; böylece
+    ilk tile görüntüyü temsil etmese bile merkezler dengeli başlar.
+    Ek bellek tile boyutu ve uint8/uint16 etiket dizisi ile sınırlıdır.
+
+    Args:
+        image: RGB formatında numpy dizisi (H, W, 3); np.memmap olabilir.
+        k: Küme sayısı (kaç farklı renk istiyoruz).
+        random_state: Tekrarlanabilirlik için seed değeri.
+        tile_rows: Her tile'daki satır sayısı.
+        n_epochs: partial_fit geçişi sayısı.
+        init_sample_size: Başlangıç merkezleri için yaklaşık örnek sayısı.
+        stats: Verilirse fit bilgileri (n_iter = partial_fit adımı,
+            fit_samples) bu sözlüğe yazılır.
+
+    Returns:
+        labels: Her pikselin ait olduğu küme indeksi (N,) - uint8/uint16.
+        centers: Küme merkezleri, yani K adet RGB değeri (K, 3).
+    """
+    height, width = image.shape[0], image.shape[1]
+    total_pixels = height * width
+
+    print(f"[..] Akışlı MiniBatch K-Means başlatılıyor (K={k})...")
+
+    step = max(1, int(np.sqrt(total_pixels / init_sample_size)))
+    sample = image[::step, ::step].reshape(-1, 3).astype(np.float32)
+    init_centers, _ = kmeans_plusplus(sample, k, random_state=random_state)
+
+    kmeans = MiniBatchKMeans(
+        n_clusters=k, init=init_centers, n_init=1, random_state=random_state
+    )
+
+    # 1. gecis: tile tile kademeli ogrenme
+    for _ in range(n_epochs):
+        for tile_pixels in iter_pixel_tiles(image, tile_rows):
+            # partial_fit en az K ornek ister (son kisa tile atlanabilir)
+            if len(tile_pixels) >= k:
+                kmeans.partial_fit(tile_pixels)
+
+    # 2. gecis: tile tile etiket atama
+    labels = np.empty(total_pixels, dtype=label_dtype(k))
+    offset = 0
+    for tile_pixels in iter_pixel_tiles(image, tile_rows):
+        labels[offset:offset + len(tile_pixels)] = kmeans.predict(tile_pixels)
+        offset += len(tile_pixels)
+
+    centers = kmeans.cluster_centers_
+
+    if stats is not None:
+        stats.update(
+            n_iter=int(kmeans.n_steps_),
+            fit_samples=total_pixels * n_epochs,
+        )
+
+    print(f"[OK] Akışlı K-Means tamamlandı.")
+    print(f"     Küme sayısı: {k}")
+    print(f"     Tile: {tile_rows} satır x {width} piksel")
+    print(f"     Etiketlenen piksel: {len(labels):,}")
+
+    return labels, centers
+
+
+def assign_labels(
+    pixels: np.ndarray, centers: np.ndarray, chunk_size: int = 1 << 20
+) -> np.ndarray:
+    """Her pikseli en yakın küme merkezine atar (parça parça, vektörel).
+
+    ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2 açılımında ||x||^2 her
+    satır için sabit olduğundan argmin için yalnızca -2 x.c + ||c||^2
+    hesaplanır. Pikseller chunk_size'lık parçalar halinde float32'ye
+    çevrilir; uint8 girdi için tam float kopya oluşturulmaz.
+
+    Args:
+        pixels: (N, 3) boyutunda piksel matrisi (uint8 veya float).
+        centers: Küme merkezleri (K, 3).
+        chunk_size: Bir seferde işlenecek piksel sayısı.
+
+    Returns:
+        Her pikselin en yakın merkez indeksi (N,) - uint8/uint16.
+    """
+    centers = centers.astype(np.float32)
+    center_norms = (centers ** 2).sum(axis=1)
+    labels = np.empty(len(pixels), dtype=label_dtype(len(centers)))
+
+    for start in range(0, len(pixels), chunk_size):
+        chunk = pixels[start:start + chunk_size].astype(np.float32)
+        distances = center_norms - 2.0 * (chunk @ centers.T)
+        labels[start:start + chunk_size] = distances.argmin(axis=1)
+
+    return labels
+
+
+def sample_pixels(
+    image: np.ndarray, sample_size: int, method: str, random_state: int
+) -> np.ndarray:
+    """Görüntüden yaklaşık sample_size piksellik bir örnek çıkarır.
+
+    İki yöntem desteklenir:
+      "resize"     -> cv2.resize (INTER_AREA) ile küçültülmüş kopya;
+                      her örnek piksel bir bloğun ortalamasıdır.
+      "stratified" -> görüntü ızgaraya bölünür, her hücreden rastgele
+                      bir piksel alınır; renkler ortalanmaz.
+
+    Args:
+        image: RGB formatında numpy dizisi (H, W, 3).
+        sample_size: Hedef örnek piksel sayısı.
+        method: "resize" veya "stratified".
+        random_state: Tekrarlanabilirlik için seed değeri.
+
+    Returns:
+        (M, 3) boyutunda float32 örnek piksel matrisi.
+
+    Raises:
+        ValueError: Bilinmeyen yöntem verilirse.
+    """
+    height, width = image.shape[0], image.shape[1]
+    scale = min(1.0, np.sqrt(sample_size / (height * width)))
+    grid_h = max(1, int(round(height * scale)))
+    grid_w = max(1, int(round(width * scale)))
+
+    if method == "resize":
+        sample = cv2.resize(
+            image, (grid_w, grid_h), interpolation=cv2.INTER_AREA
+        )
+    elif method == "stratified":
+        rng = np.random.default_rng(random_state)
+        row_edges = np.linspace(0, height, grid_h + 1).astype(int)
+        col_edges = np.linspace(0, width, grid_w + 1).astype(int)
+
+        rows = row_edges[:-1] + (
+            rng.random(grid_h) * np.diff(row_edges)
+        ).astype(int)
+        cols = col_edges[:-1] + (
+            rng.random(grid_w) * np.diff(col_edges)
+        ).astype(int)
+        sample = image[np.ix_(rows, cols)]
+    else:
+        raise ValueError(f"Bilinmeyen örnekleme yöntemi: {method}")
+
+    return sample.reshape(-1, 3).astype(np.float32)
+
+
+def apply_downsampled_kmeans(
+    image: np.ndarray,
+    k: int,
+    random_state: int,
+    sample_size: int,
+    method: str = "resize",
+    unique_colors: bool = False,
+    stats: Optional[dict] = None,
+    backend: str = KMEANS_BACKEND,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Merkezleri küçük bir örnekte öğrenir, tam çözünürlükte etiketler.
+
+    En pahalı adım olan K-Means fit işlemi sample_pixels() ile alınan
+    örnek üzerinde yapılır. Ardından tam çözünürlüklü görüntünün her
+    pikseli assign_labels() ile en yakın merkeze atanır. Dönen
+    labels ve centers segment_image() / create_label_map() tarafından
+    değişiklik olmadan kullanılabilir.
+
+    Args:
+        image: RGB formatında numpy dizisi (H, W, 3).
+        k: Küme sayısı (kaç farklı renk istiyoruz).
+        random_state: Tekrarlanabilirlik için seed değeri.
+        sample_size: Fit için kullanılacak yaklaşık piksel sayısı.
+        method: Örnekleme yöntemi ("resize" veya "stratified").
+        unique_colors: Örnek üzerinde benzersiz renk sıkıştırması.
+        stats: Verilirse örnek üzerindeki fit bilgileri bu sözlüğe yazılır.
+        backend: Örnek üzerindeki fit'in K-Means backend'i.
+
+    Returns:
+        labels: Her pikselin ait olduğu küme indeksi (N,) - uint8/uint16.
+        centers: Küme merkezleri, yani K adet RGB değeri (K, 3).
+    """
+    sample = sample_pixels(image, sample_size, method, random_state)
+
+    print(f"[..] Örnek üzerinde fit ({method}): {len(sample):,} piksel")
+    _, centers = apply_kmeans(
+        sample, k, random_state, unique_colors=unique_colors, stats=stats,
+        backend=backend,
+    )
+
+    labels = assign_labels(image.reshape(-1, 3), centers)
+
+    print(f"[OK] Tam çözünürlükte etiketleme tamamlandı.")
     print(f"     Etiketlenen piksel: {len(labels):,}")
 
     return labels, centers
 
 
+def apply_fixed_palette(
+    image: np.ndarray,
+    palette: np.ndarray,
+    levels: int = 256,
+    stats: Optional[dict] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Her pikseli sabit bir paletin LAB'da en yakın rengine atar.
+
+    K-Means çalışmaz: merkezler verilen palettir ve etiketler
+    önbellekteki arama tablosundan (quantize_pixels()) tek bir
+    indekslemeyle okunur. Dönen labels ve centers apply_kmeans()
+    ile aynı sözleşmededir; görüntüde hiç geçmeyen palet renkleri
+    get_dominant_colors() tarafından atlanır.
+
+    Args:
+        image: RGB formatında uint8 numpy dizisi (H, W, 3).
+        palette: (P, 3) RGB palet renkleri (örn. COLOR_DICTIONARY).
+        levels: Arama tablosunun kanal başına boyutu (256: tam tablo,
+            32/64: kaba ızgara + belirsiz hücrelerde kesin eşleme).
+        stats: Verilirse palet bilgileri bu sözlüğe yazılır.
+
+    Returns:
+        labels: Her pikselin palet indeksi (N,) - uint8.
+        centers: Palet renkleri (P, 3).
+    """
+    from src.color_lut import quantize_pixels
+
+    print(f"[..] Sabit palete eşleniyor ({len(palette)} renk, "
+          f"tablo {levels}^3)...")
+
+    labels = quantize_pixels(image, palette, levels)
+    centers = np.asarray(palette, dtype=np.float64)
+
+    if stats is not None:
+        stats.update(
+            palette_size=len(palette),
+            lut_levels=levels,
+            used_colors=int(np.count_nonzero(
+                np.bincount(labels, minlength=len(palette))
+            )),
+        )
+
+    print(f"[OK] Sabit palet eşlemesi tamamlandı.")
+    print(f"     Etiketlenen piksel: {len(labels):,}")
+
+    return labels, centers
+
+
+def palette_drift(
+    reference_centers: np.ndarray, centers: np.ndarray
+) -> dict:
+    """İki palet arasındaki farkı LAB uzayında (Delta-E) ölçer.
+
+    Merkezler Macar algoritması (linear_sum_assignment) ile birebir
+    eşleştirilir, eşleşen çiftler arasındaki CIE76 Delta-E değerleri
+    raporlanır. Örnek boyutunun palete etkisini ölçmek için kullanılır.
+
+    Args:
+        reference_centers: Referans merkezler (K, 3), örn. tam fit.
+        centers: Karşılaştırılacak merkezler (K, 3).
+
+    Returns:
+        {"mean_delta_e": ..., "max_delta_e": ..., "per_color": [...]}
+    """
+    from scipy.optimize import linear_sum_assignment
+
+    def to_lab(rgb: np.ndarray) -> np.ndarray:
+        scaled = (np.clip(rgb, 0, 255) / 255.0).astype(np.float32)
+        return cv2.cvtColor(scaled[np.newaxis], cv2.COLOR_RGB2LAB)[0]
+
+    reference_lab = to_lab(reference_centers)
+    lab = to_lab(centers)
+
+    cost = np.linalg.norm(
+        reference_lab[:, np.newaxis, :] - lab[np.newaxis, :, :], axis=2
+    )
+    rows, cols = linear_sum_assignment(cost)
+    delta_e = cost[rows, cols]
+
+    return {
+        "mean_delta_e": round(float(delta_e.mean()), 3),
+        "max_delta_e": round(float(delta_e.max()), 3),
+        "per_color": [round(float(d), 3) for d in delta_e],
+    }
+
+
 def get_dominant_colors(
-    centers: np.ndarray, labels: np.ndarray
+    centers: np.ndarray,
+    labels: np.ndarray,
+    weights: Optional[np.ndarray] = None,
 ) -> List[dict]:
     """Her kümenin RGB değerini ve görüntüdeki yüzdesini hesaplar.
 
     Dominant renkler yüzdeye göre büyükten küçüğe sıralanır.
     Bu sayede hangi rengin görüntüde ne kadar yer kapladığını görürüz.
 
+    weights verilirse labels her satırın (örn. benzersiz rengin)
+    etiketi, weights ise o satırın piksel sayısı kabul edilir;
+    yüzdeler doğrudan bu ağırlıklardan hesaplanır.
+
     Args:
         centers: Küme merkezleri (K, 3).
         labels: Her pikselin küme etiketi (N,).
+        weights: Opsiyonel satır ağırlıkları (N,), örn. compress_colors()
+            çıktısındaki counts.
 
     Returns:
         Her renk için sözlük listesi:
         [{"color_id": 0, "rgb": [R, G, B], "percentage": 35.2}, ...]
     """
-    total_pixels = len(labels)
-    unique_labels, counts = np.unique(labels, return_counts=True)
+    label_counts = np.bincount(labels, weights=weights, minlength=len(centers))
+    total_pixels = label_counts.sum()
+    unique_labels = np.flatnonzero(label_counts)
+    counts = label_counts[unique_labels]
 
     dominant_colors = []
     for label, count in zip(unique_labels, counts):
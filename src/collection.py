@@ -0,0 +1,265 @@
+# ==================================================
+# COLLECTION - Koleksiyon Genelinde Ortak Palet
+# ==================================================
+# Bir klasördeki (veya glob desenine uyan) tüm görüntüler için tek
+# bir K renkli palet öğrenir ve her görüntüyü bu palete göre
+# segmentler. İki geçişte çalışır:
+#
+#   1. Fit: görüntüler sırayla, küçültülerek çözülür (önden okuma
+#      thread'lerinde); her birinden sabit boyutlu bir örnek alınır,
+#      benzersiz renklerine sıkıştırılır ve MiniBatchKMeans.partial_fit
+#      ile (renk sayıları ağırlık olarak) kademeli öğrenilir.
+#      Bellekte aynı anda yalnızca birkaç görüntü ve başlangıç
+#      tamponu bulunur; tüm pikseller hiçbir zaman birleştirilmez.
+#   2. Eşleme: run_batch() "centers" modunda, öğrenilen merkezler
+#      verilerek çalışır (süreç havuzu veya önden okumalı tek süreç);
+#      her görüntünün çıktıları kendi alt klasörüne yazılır.
+#
+# Mesafe ölçütü her iki geçişte de RGB Öklid mesafesidir: fit
+# MiniBatch K-Means'i RGB'de yapar, eşleme her pikseli RGB'de en
+# yakın merkeze atar (assign_labels, downsample modunun ataması).
+# Böylece bir piksel fit'in verdiği kümeye etiketlenir.
+#
+# Ortak palet ve koleksiyondaki piksel yüzdeleri output_dir altına
+# COLLECTION_PALETTE_FILE olarak yazılır (FIXED_PALETTE ile tekrar
+# kullanılabilir); aynı bilgiler ve fit istatistikleri toplu özetin
+# "collection" anahtarında da bulunur.
+
+import os
+import time
+from functools import partial
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from config import (
+    COLLECTION_SAMPLE_SIZE,
+    COLLECTION_INIT_SAMPLE_SIZE,
+    COLLECTION_FIT_TARGET_SIZE,
+    COLLECTION_EPOCHS,
+    COLLECTION_PALETTE_FILE,
+    DOWNSAMPLE_METHOD,
+    PREFETCH_DEPTH,
+    BATCH_PIPELINED,
+)
+from src.batch import collect_images, run_batch, write_batch_summary
+from src.image_io import load_image
+from src.io_pipeline import prefetch_images
+
+
+def _image_colors(
+    image: np.ndarray, sample_size: int, random_state: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Görüntü örneğinin benzersiz renklerini ve sayılarını döndürür."""
+    from src.clustering import compress_colors, sample_pixels
+
+    sample = sample_pixels(image, sample_size, DOWNSAMPLE_METHOD, random_state)
+    colors, counts, _ = compress_colors(sample)
+    return colors, counts.astype(np.float64)
+
+
+def fit_collection_palette(
+    paths: List[str],
+    k: int,
+    random_state: int,
+    sample_size: int = COLLECTION_SAMPLE_SIZE,
+    init_sample_size: int = COLLECTION_INIT_SAMPLE_SIZE,
+    n_epochs: int = COLLECTION_EPOCHS,
+    target_size: Optional[int] = COLLECTION_FIT_TARGET_SIZE,
+    stats: Optional[dict] = None,
+) -> np.ndarray:
+    """Görüntü koleksiyonu için ortak K renkli paleti akışlı öğrenir.
+
+    Görüntüler sırayla (sabit sırada) okunur; her görüntüden yaklaşık
+    sample_size piksel örneklenir, böylece her görüntü palete eşit
+    katkı verir. İlk görüntülerin örnekleri init_sample_size satıra
+    ulaşana kadar biriktirilir ve başlangıç merkezleri bu tampon
+    üzerinde ağırlıklı k-means++ ile seçilir. Ardından her görüntünün
+    benzersiz renkleri MiniBatchKMeans.partial_fit'e sayılarıyla
+    birlikte verilir.
+
+    Args:
+        paths: Görüntü yolları.
+        k: Palet renk sayısı.
+        random_state: Tekrarlanabilirlik için seed değeri.
+        sample_size: Görüntü başına örnek piksel sayısı.
+        init_sample_size: Başlangıç merkezleri için biriktirilecek
+            en az benzersiz renk sayısı.
+        n_epochs: Koleksiyon üzerinden partial_fit geçişi sayısı
+            (her geçiş görüntüleri yeniden çözer).
+        target_size: Fit geçişinde görüntüler uzun kenarı bu değerin
+            altına düşmeyen en küçük ölçekte çözülür (None: tam boyut).
+        stats: Verilirse fit bilgileri (images, skipped, fit_samples,
+            n_steps) bu sözlüğe yazılır.
+
+    Returns:
+        Ortak palet merkezleri (K, 3) - RGB float.
+
+    Raises:
+        ValueError: Koleksiyonda K'dan az farklı renk varsa.
+    """
+    from sklearn.cluster import MiniBatchKMeans, kmeans_plusplus
+
+    loader = partial(load_image, target_size=target_size)
+    kmeans = None
+    buffer: List[Tuple[np.ndarray, np.ndarray]] = []
+    buffered_rows = 0
+    fitted_images = skipped = 0
+    fit_samples = 0.0
+
+    def start(batches):
+        """Tampondaki renklerle merkezleri başlatır ve ilk adımı atar."""
+        colors = np.concatenate([c for c, _ in batches])
+        counts = np.concatenate([w for _, w in batches])
+        if len(colors) < k:
+            raise ValueError(
+                f"Koleksiyonda {len(colors)} farkli renk var, K={k} icin yetersiz"
+            )
+        centers, _ = kmeans_plusplus(
+            colors, k, sample_weight=counts, random_state=random_state
+        )
+        model = MiniBatchKMeans(
+            n_clusters=k, init=centers, n_init=1, random_state=random_state
+        )
+        return model.partial_fit(colors, sample_weight=counts)
+
+    print(f"[..] Koleksiyon paleti ogreniliyor: {len(paths)} goruntu, "
+          f"K={k}, goruntu basina {sample_size:,} piksel")
+
+    for epoch in range(n_epochs):
+        images = prefetch_images(paths, PREFETCH_DEPTH, loader)
+        for path, image, error in images:
+            if error is not None:
+                if epoch == 0:
+                    skipped += 1
+                    print(f"[HATA] Atlandi: {path}: {error}")
+                continue
+
+            colors, counts = _image_colors(image, sample_size, random_state)
+            if epoch == 0:
+                fitted_images += 1
+                fit_samples += counts.sum()
+
+            if kmeans is None:
+                buffer.append((colors, counts))
+                buffered_rows += len(colors)
+                if buffered_rows >= init_sample_size:
+                    kmeans = start(buffer)
+                    buffer = []
+            elif len(colors) >= k:
+                kmeans.partial_fit(colors, sample_weight=counts)
+
+        # Koleksiyon tamponu dolduramayacak kadar kucukse
+        if kmeans is None and buffer:
+            kmeans = start(buffer)
+            buffer = []
+
+    if kmeans is None:
+        raise ValueError("Koleksiyonda okunabilen goruntu yok")
+
+    if stats is not None:
+        stats.update(
+            images=fitted_images,
+            skipped=skipped,
+            fit_samples=int(fit_samples),
+            n_steps=int(kmeans.n_steps_),
+        )
+
+    print(f"[OK] Koleksiyon paleti ogrenildi ({fitted_images} goruntu, "
+          f"{int(fit_samples):,} ornek piksel).")
+
+    return kmeans.cluster_centers_
+
+
+def _collection_shares(results: List[dict], palette_size: int) -> List[dict]:
+    """Görüntü yüzdelerini piksel sayısıyla ağırlıklandırıp birleştirir."""
+    totals = np.zeros(palette_size)
+    for result in results:
+        if result["status"] != "ok":
+            continue
+        pixels = result["width"] * result["height"]
+        for color in result["dominant_colors"]:
+            totals[color["color_id"]] += color["percentage"] * pixels
+
+    shares = totals / totals.sum() * 100 if totals.sum() else totals
+    return [
+        {"color_id": i, "percentage": round(float(share), 2)}
+        for i, share in enumerate(shares)
+    ]
+
+
+def run_collection(
+    source: str,
+    output_dir: str,
+    k: int,
+    random_state: int,
+    workers: Optional[int] = None,
+    pipelined: bool = BATCH_PIPELINED,
+    **pipeline_options,
+) -> dict:
+    """Koleksiyon için ortak palet öğrenir ve her görüntüyü ona eşler.
+
+    1. geçiş fit_collection_palette(), 2. geçiş run_batch() ile
+    "centers" modunda (RGB'de en yakın merkez) çalışır.
+
+    Args:
+        source: Klasör yolu veya glob deseni.
+        output_dir: Ana çıktı klasörü; her görüntü bir alt klasör alır.
+        k: Ortak palet renk sayısı.
+        random_state: Tekrarlanabilirlik için seed değeri.
+        workers: 2. geçişteki işçi süreç sayısı. None ise tüm çekirdekler.
+        pipelined: 2. geçişi tek süreçte önden okuma ile çalıştır.
+        **pipeline_options: run_batch() / run_pipeline()'a iletilen
+            seçenekler (stages, renderer, index_dir ...). kmeans_mode
+            ve auto_k yok sayılır.
+
+    Returns:
+        run_batch() özeti; "collection" anahtarında ortak palet,
+        koleksiyon yüzdeleri ve fit bilgileri.
+    """
+    from src.color_categorization import categorize_centers
+    from src.image_io import save_palette_json
+
+    paths = collect_images(source)
+
+    start = time.perf_counter()
+    fit_stats = {}
+    centers = fit_collection_palette(paths, k, random_state, stats=fit_stats)
+    fit_seconds = time.perf_counter() - start
+
+    options = {
+        **pipeline_options,
+        "kmeans_mode": "centers",
+        "auto_k": False,
+        "fixed_centers": centers,
+    }
+    summary = run_batch(
+        source, output_dir, len(centers), random_state, workers, pipelined,
+        **options,
+    )
+
+    shares = _collection_shares(summary["results"], len(centers))
+    color_names = categorize_centers(centers)
+    palette_path = save_palette_json(
+        centers, shares, color_names, output_dir, COLLECTION_PALETTE_FILE
+    )
+
+    rgb = np.clip(centers, 0, 255).astype(int)
+    summary["collection"] = {
+        "palette_file": os.path.abspath(palette_path),
+        "colors": [
+            {
+                "color_id": i,
+                "rgb": rgb[i].tolist(),
+                "center": [round(float(v), 4) for v in centers[i]],
+                "percentage": shares[i]["percentage"],
+                "name": color_names[i]["name"],
+            }
+            for i in range(len(centers))
+        ],
+        "fit_seconds": round(fit_seconds, 3),
+        **fit_stats,
+    }
+    # run_batch() özeti koleksiyon bilgisi olmadan yazdı; güncelle
+    write_batch_summary(summary, output_dir)
+    return summary
@@ -8,8 +8,13 @@
 # LAB uzayinda Euclidean mesafe ile bulur.
 # LAB uzayi insan gozu algisindan tasarlandigindan
 # mesafe hesabi perceputal (algisal) olarak dogrudur.
+#
+# Sozlugun LAB karsiliklari ilk kullanimda bir kez hesaplanip
+# onbellege alinir; isimlendirme (M, 3) renk dizileri icin tek
+# bir toplu cvtColor ve vektorel mesafe hesabi ile yapilir.
 
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -100,12 +105,105 @@ def _rgb_to_lab(r: int, g: int, b: int) -> np.ndarray:
     return lab_pixel[0][0].astype(np.float32)
 
 
+def rgb_to_lab_array(colors: np.ndarray) -> np.ndarray:
+    """(M, 3) RGB renk dizisini tek seferde LAB uzayina cevirir.
+
+    _rgb_to_lab() ile ayni 8-bit OpenCV LAB olcegini kullanir,
+    ancak her renk icin ayri cvtColor cagrisi yerine tum diziyi
+    tek bir (1, M, 3) goruntu olarak donusturur.
+
+    Args:
+        colors: (M, 3) RGB degerleri (0-255). Float degerler
+            int() gibi asagi yuvarlanir.
+
+    Returns:
+        (M, 3) LAB degerleri - float32.
+    """
+    rgb = np.clip(np.asarray(colors), 0, 255).astype(np.uint8)
+    lab = cv2.cvtColor(rgb.reshape(1, -1, 3), cv2.COLOR_RGB2LAB)
+    return lab.reshape(-1, 3).astype(np.float32)
+
+
+@lru_cache(maxsize=4)
+def _dictionary_lab(
+    items: Tuple[Tuple[str, Tuple[int, int, int]], ...]
+) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Sozluk iceriginin LAB karsiliklarini hesaplar (onbellekli).
+
+    Anahtar sozlugun icerigi oldugundan COLOR_DICTIONARY
+    degistirilirse tablo otomatik olarak yeniden hesaplanir.
+    """
+    names = tuple(name for name, _ in items)
+    lab = rgb_to_lab_array(np.array([rgb for _, rgb in items]))
+    lab.setflags(write=False)
+    return names, lab
+
+
+def get_dictionary_lab() -> Tuple[Tuple[str, ...], np.ndarray]:
+    """COLOR_DICTIONARY'nin isimlerini ve LAB degerlerini dondurur.
+
+    Returns:
+        names: Renk isimleri (D,).
+        lab: Her ismin LAB degeri (D, 3) - float32, salt okunur.
+    """
+    return _dictionary_lab(tuple(COLOR_DICTIONARY.items()))
+
+
+def classify_colors(
+    colors: np.ndarray,
+    chunk_size: int = 1 << 18,
+    palette_lab: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """(M, 3) RGB renklerini en yakin sozluk rengine esler.
+
+    Renkler tek bir toplu donusumle LAB'a cevrilir ve onbellekteki
+    sozluk LAB tablosuna olan mesafeler vektorel olarak hesaplanir.
+    Milyonlarca piksel/bolge rengi icin bellek chunk_size ile sinirlanir.
+
+    Args:
+        colors: (M, 3) RGB degerleri (0-255).
+        chunk_size: Bir seferde islenecek renk sayisi.
+        palette_lab: Verilirse sozluk yerine bu (P, 3) LAB paletine
+            (rgb_to_lab_array() ciktisi) gore eslenir.
+
+    Returns:
+        Her rengin COLOR_DICTIONARY (veya palette_lab) icindeki sira
+        indeksi (M,) - int64.
+    """
+    if palette_lab is None:
+        _, palette_lab = get_dictionary_lab()
+    palette_norms = (palette_lab ** 2).sum(axis=1)
+    colors = np.asarray(colors).reshape(-1, 3)
+    indices = np.empty(len(colors), dtype=np.int64)
+
+    # ||x - d||^2 = ||x||^2 - 2 x.d + ||d||^2; ||x||^2 argmin'i etkilemez.
+    # 8-bit LAB degerleri tam sayi oldugundan float32 hesap kesindir.
+    for start in range(0, len(colors), chunk_size):
+        lab = rgb_to_lab_array(colors[start:start + chunk_size])
+        distances = palette_norms - 2.0 * (lab @ palette_lab.T)
+        indices[start:start + chunk_size] = distances.argmin(axis=1)
+
+    return indices
+
+
+def name_colors(colors: np.ndarray) -> List[str]:
+    """(M, 3) RGB renklerinin her biri icin en yakin renk ismini dondurur.
+
+    Args:
+        colors: (M, 3) RGB degerleri (0-255).
+
+    Returns:
+        M adet renk ismi.
+    """
+    names, _ = get_dictionary_lab()
+    return [names[i] for i in classify_colors(colors)]
+
+
 def classify_color(r: int, g: int, b: int) -> str:
     """Bir RGB degerini en yakin bilinen renk ismine donusturur.
 
-    COLOR_DICTIONARY'deki tum renkleri LAB uzayina cevirir,
-    girdi rengini de LAB'a cevirir ve Euclidean mesafe ile
-    en yakin rengi bulur.
+    Girdi rengini LAB'a cevirir ve onbellekteki sozluk LAB
+    tablosu uzerinde Euclidean mesafe ile en yakin rengi bulur.
 
     Args:
         r: Kirmizi kanal (0-255).
@@ -115,20 +213,7 @@ def classify_color(r: int, g: int, b: int) -> str:
     Returns:
         En yakin bilinen rengin ismi.
     """
-    input_lab = _rgb_to_lab(r, g, b)
-
-    min_distance = float("inf")
-    closest_name = "Bilinmeyen"
-
-    for name, (cr, cg, cb) in COLOR_DICTIONARY.items():
-        candidate_lab = _rgb_to_lab(cr, cg, cb)
-        distance = np.linalg.norm(input_lab - candidate_lab)
-
-        if distance < min_distance:
-            min_distance = distance
-            closest_name = name
-
-    return closest_name
+    return name_colors(np.array([[r, g, b]]))[0]
 
 
 def categorize_centers(centers: np.ndarray) -> List[dict]:
@@ -145,14 +230,14 @@ def categorize_centers(centers: np.ndarray) -> List[dict]:
         [{"color_id": 0, "rgb": (R,G,B), "name": "..."}, ...]
     """
     results = []
+    names = name_colors(centers)
 
     print("=" * 50)
     print("RENK KATEGORIZASYONU (LAB mesafe)")
     print("=" * 50)
 
-    for i, center in enumerate(centers):
+    for i, (center, name) in enumerate(zip(centers, names)):
         r, g, b = int(center[0]), int(center[1]), int(center[2])
-        name = classify_color(r, g, b)
 
         results.append({
             "color_id": i,
@@ -0,0 +1,400 @@
+# ==================================================
+# COLOR LUT - 24-bit Renk Arama Tabloları
+# ==================================================
+# Tüm 256^3 RGB değerleri için önceden hesaplanmış tablolar:
+#
+#   name LUT -> her RGB için COLOR_DICTIONARY indeksi (uint8, 16 MB)
+#   lab LUT  -> her RGB için 8-bit OpenCV LAB değeri (uint8, 48 MB)
+#   palette LUT -> her RGB için sabit bir paletteki en yakın rengin
+#              indeksi; tam (256^3) veya kaba ızgara (örn. 64^3)
+#
+# Tablolar bir kez hesaplanıp diske yazılır ve np.memmap ile
+# salt okunur açılır. Böylece aynı makinedeki tüm işçi süreçler
+# aynı dosyayı işletim sisteminin sayfa önbelleği üzerinden
+# paylaşır. Bir görüntünün tüm piksellerini isimlendirmek tek bir
+# indeksleme işlemine dönüşür.
+#
+# Dosya adı sözlüğün içeriğinden türetilen bir hash içerir;
+# COLOR_DICTIONARY değişirse tablo otomatik olarak yeniden üretilir.
+
+import hashlib
+import json
+import os
+from typing import Callable, Dict, Tuple
+
+import cv2
+import numpy as np
+
+from config import COLOR_LUT_CACHE_DIR
+from src.color_categorization import (
+    COLOR_DICTIONARY,
+    classify_colors,
+    rgb_to_lab_array,
+)
+
+
+# Tablo formatı değişirse eski önbellek dosyalarını geçersiz kılar
+_LUT_VERSION = 1
+
+# Tablo boyutu: her kanal için 256 değer
+_LEVELS = 256
+
+# Bir seferde işlenecek R düzlemi sayısı (16 x 65536 renk)
+_PLANES_PER_CHUNK = 16
+
+# Kaba ızgarada tek bir palet rengine karar verilemeyen hücre
+_AMBIGUOUS = 255
+
+# Kaba ızgara hücre yarıçapına eklenen pay (8-bit LAB yuvarlaması);
+# tüm 2^24 renk üzerinde tam tabloyla birebir aynı sonucu verir
+_GRID_SLACK = 1.0
+
+# Süreç içinde açılmış memmap'ler: yol -> dizi
+_OPEN_LUTS: Dict[str, np.ndarray] = {}
+
+
+def dictionary_hash() -> str:
+    """COLOR_DICTIONARY içeriğinin kısa hash'ini döndürür.
+
+    Hash'e OpenCV sürümü ve tablo formatı da dahildir; LAB
+    dönüşümü veya format değişirse yeni bir tablo üretilir.
+    """
+    payload = json.dumps(
+        {
+            "colors": list(COLOR_DICTIONARY.items()),
+            "cv2": cv2.__version__,
+            "version": _LUT_VERSION,
+        },
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _plane_colors(r_start: int, r_stop: int) -> np.ndarray:
+    """R değeri [r_start, r_stop) aralığındaki tüm renkleri üretir.
+
+    Sıralama R << 16 | G << 8 | B anahtarının sırasıyla aynıdır.
+    """
+    r, g, b = np.meshgrid(
+        np.arange(r_start, r_stop, dtype=np.uint8),
+        np.arange(_LEVELS, dtype=np.uint8),
+        np.arange(_LEVELS, dtype=np.uint8),
+        indexing="ij",
+    )
+    return np.stack([r, g, b], axis=-1).reshape(-1, 3)
+
+
+def _open_or_build(
+    path: str,
+    shape: Tuple[int, ...],
+    fill_chunk: Callable[[int, int], np.ndarray],
+) -> np.ndarray:
+    """Tabloyu diskten açar; yoksa oluşturup atomik olarak kaydeder.
+
+    Tablo önce geçici bir dosyaya parça parça yazılır, sonra
+    os.replace ile yerine taşınır. Aynı anda çalışan süreçler
+    hiçbir zaman yarım yazılmış bir dosya görmez.
+
+    Args:
+        path: Tablo dosyasının yolu.
+        shape: Tablonun boyutu (ilk eksen R düzlemleri).
+        fill_chunk: [r_start, r_stop) R düzlemlerinin tablo
+            değerlerini döndüren fonksiyon.
+
+    Returns:
+        Salt okunur np.memmap.
+    """
+    if path in _OPEN_LUTS:
+        return _OPEN_LUTS[path]
+
+    expected_bytes = int(np.prod(shape))
+
+    if not (os.path.exists(path) and os.path.getsize(path) == expected_bytes):
+        print(f"[..] Renk tablosu oluşturuluyor: {path}")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        table = np.memmap(tmp_path, dtype=np.uint8, mode="w+", shape=shape)
+
+        for r_start in range(0, shape[0], _PLANES_PER_CHUNK):
+            r_stop = min(r_start + _PLANES_PER_CHUNK, shape[0])
+            values = fill_chunk(r_start, r_stop)
+            table[r_start:r_stop] = values.reshape(
+                (r_stop - r_start,) + shape[1:]
+            )
+
+        table.flush()
+        del table
+        os.replace(tmp_path, path)
+        print(f"[OK] Renk tablosu kaydedildi: {path}")
+
+    lut = np.memmap(path, dtype=np.uint8, mode="r", shape=shape)
+    _OPEN_LUTS[path] = lut
+    return lut
+
+
+def get_name_lut(cache_dir: str = COLOR_LUT_CACHE_DIR) -> np.ndarray:
+    """RGB -> COLOR_DICTIONARY indeksi tablosunu döndürür.
+
+    lut[r, g, b], get_dictionary_lab() isim listesindeki indekstir ve
+    classify_colors() ile birebir aynı sonucu verir.
+
+    Args:
+        cache_dir: Tablo dosyalarının tutulduğu klasör.
+
+    Returns:
+        (256, 256, 256) uint8 salt okunur np.memmap.
+
+    Raises:
+        ValueError: Sözlükte 256'dan fazla renk varsa.
+    """
+    if len(COLOR_DICTIONARY) > _LEVELS:
+        raise ValueError(
+            f"Renk sözlüğü uint8 tablo için çok büyük: {len(COLOR_DICTIONARY)}"
+        )
+
+    path = os.path.join(cache_dir, f"name_lut_{dictionary_hash()}.u8")
+    return _open_or_build(
+        path,
+        (_LEVELS, _LEVELS, _LEVELS),
+        lambda r_start, r_stop: classify_colors(
+            _plane_colors(r_start, r_stop)
+        ).astype(np.uint8),
+    )
+
+
+def get_lab_lut(cache_dir: str = COLOR_LUT_CACHE_DIR) -> np.ndarray:
+    """RGB -> 8-bit LAB tablosunu döndürür.
+
+    Değerler cv2.COLOR_RGB2LAB'ın uint8 çıktısıdır
+    (L: 0-255, a/b: 128 merkezli).
+
+    Args:
+        cache_dir: Tablo dosyalarının tutulduğu klasör.
+
+    Returns:
+        (256, 256, 256, 3) uint8 salt okunur np.memmap.
+    """
+    key = hashlib.sha1(
+        f"{cv2.__version__}/{_LUT_VERSION}".encode("utf-8")
+    ).hexdigest()[:16]
+    path = os.path.join(cache_dir, f"lab_lut_{key}.u8")
+
+    def to_lab(r_start: int, r_stop: int) -> np.ndarray:
+        colors = _plane_colors(r_start, r_stop)
+        return cv2.cvtColor(colors.reshape(1, -1, 3), cv2.COLOR_RGB2LAB)
+
+    return _open_or_build(path, (_LEVELS, _LEVELS, _LEVELS, 3), to_lab)
+
+
+def _rgb_keys(image: np.ndarray) -> np.ndarray:
+    """(..., 3) uint8 RGB dizisini 24-bit düz anahtarlara çevirir."""
+    rgb = image.reshape(-1, 3)
+    keys = rgb[:, 0].astype(np.uint32) << 16
+    keys |= rgb[:, 1].astype(np.uint32) << 8
+    keys |= rgb[:, 2]
+    return keys
+
+
+def name_pixels(
+    image: np.ndarray, cache_dir: str = COLOR_LUT_CACHE_DIR
+) -> np.ndarray:
+    """Görüntünün her pikselini tek bir indekslemeyle isimlendirir.
+
+    Args:
+        image: RGB formatında uint8 numpy dizisi (H, W, 3).
+        cache_dir: Tablo dosyalarının tutulduğu klasör.
+
+    Returns:
+        (H, W) uint8 dizi; her değer get_dictionary_lab() isim
+        listesindeki indekstir.
+    """
+    lut = get_name_lut(cache_dir).reshape(-1)
+    return lut[_rgb_keys(image)].reshape(image.shape[:-1])
+
+
+def lut_rgb_to_lab(
+    image: np.ndarray, cache_dir: str = COLOR_LUT_CACHE_DIR
+) -> np.ndarray:
+    """Görüntüyü LAB tablosu üzerinden 8-bit LAB'a çevirir.
+
+    Args:
+        image: RGB formatında uint8 numpy dizisi (H, W, 3).
+        cache_dir: Tablo dosyalarının tutulduğu klasör.
+
+    Returns:
+        (H, W, 3) uint8 LAB görüntü.
+    """
+    lut = get_lab_lut(cache_dir).reshape(-1, 3)
+    return lut[_rgb_keys(image)].reshape(image.shape)
+
+
+def palette_hash(palette: np.ndarray) -> str:
+    """Sabit paletin (P, 3) RGB değerlerinden kısa bir hash üretir."""
+    payload = json.dumps(
+        {
+            "palette": np.asarray(palette).astype(int).tolist(),
+            "cv2": cv2.__version__,
+            "version": _LUT_VERSION,
+        }
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _grid_bits(levels: int) -> int:
+    """Izgara boyutunun kanal başına bit sayısı (levels = 2^bits)."""
+    bits = int(levels).bit_length() - 1
+    if levels < 2 or levels > _LEVELS or 1 << bits != levels:
+        raise ValueError(f"Izgara boyutu 2..256 arası 2'nin kuvveti olmalı: "
+                         f"{levels}")
+    return bits
+
+
+def _grid_cells(
+    r_start: int, r_stop: int, levels: int, palette_lab: np.ndarray
+) -> np.ndarray:
+    """Kaba ızgara hücrelerinin palet indekslerini hesaplar.
+
+    Her hücre için köşe, kenar ortası ve merkezden oluşan 3x3x3
+    örnek LAB'a çevrilir. Merkezin en yakın iki palet rengine
+    uzaklıkları d1, d2 ve hücrenin LAB yarıçapı r ise, d2 - d1 > 2r
+    olduğunda hücredeki her renk aynı palet rengine düşer (üçgen
+    eşitsizliği; r'ye _GRID_SLACK eklenir). Aksi halde hücre _AMBIGUOUS olarak işaretlenir;
+    bu hücrelerdeki pikseller sorguda tek tek kesin olarak eşlenir.
+    """
+    if len(palette_lab) == 1:
+        return np.zeros((r_stop - r_start) * levels * levels, dtype=np.uint8)
+
+    step = _LEVELS // levels
+    offsets = np.array([0, step // 2, step - 1])
+
+    cells = np.stack(np.meshgrid(
+        np.arange(r_start, r_stop), np.arange(levels), np.arange(levels),
+        indexing="ij",
+    ), axis=-1).reshape(-1, 1, 3) * step
+    corners = np.stack(np.meshgrid(
+        offsets, offsets, offsets, indexing="ij"
+    ), axis=-1).reshape(1, -1, 3)
+    samples = (cells + corners).astype(np.uint8)
+
+    lab = cv2.cvtColor(
+        samples.reshape(1, -1, 3), cv2.COLOR_RGB2LAB
+    ).reshape(samples.shape).astype(np.float32)
+    center = lab[:, len(corners[0]) // 2]
+
+    # 8-bit LAB yuvarlaması için yarıçapa _GRID_SLACK eklenir
+    radius = np.sqrt(((lab - center[:, np.newaxis]) ** 2).sum(axis=2)).max(
+        axis=1
+    ) + _GRID_SLACK
+    distances = np.sqrt(((
+        center[:, np.newaxis, :] - palette_lab[np.newaxis, :, :]
+    ) ** 2).sum(axis=2))
+    order = np.argsort(distances, axis=1)[:, :2]
+    nearest = np.take_along_axis(distances, order, axis=1)
+
+    certain = nearest[:, 1] - nearest[:, 0] > 2.0 * radius
+    return np.where(certain, order[:, 0], _AMBIGUOUS).astype(np.uint8)
+
+
+def get_palette_lut(
+    palette: np.ndarray,
+    levels: int = _LEVELS,
+    cache_dir: str = COLOR_LUT_CACHE_DIR,
+) -> np.ndarray:
+    """RGB -> sabit palet indeksi tablosunu döndürür.
+
+    levels=256 tam tablodur (16 MB): lut[r, g, b], rengin LAB'da en
+    yakın palet renginin indeksidir. Daha küçük levels (örn. 32, 64)
+    her kanalı 256 / levels genişliğinde hücrelere böler; hücre
+    değeri ya kesin palet indeksi ya da _AMBIGUOUS'tur (bkz.
+    _grid_cells). 64^3 tablo 256 KB'tır ve saniyeler yerine
+    milisaniyelerde üretilir.
+
+    Args:
+        palette: (P, 3) RGB palet renkleri.
+        levels: Kanal başına tablo boyutu (2'nin kuvveti, <= 256).
+        cache_dir: Tablo dosyalarının tutulduğu klasör.
+
+    Returns:
+        (levels, levels, levels) uint8 salt okunur np.memmap.
+
+    Raises:
+        ValueError: Palet uint8 tablo için çok büyükse veya levels
+            geçersizse.
+    """
+    _grid_bits(levels)
+    max_size = _LEVELS if levels == _LEVELS else _AMBIGUOUS
+    if len(palette) > max_size:
+        raise ValueError(f"Palet uint8 tablo için çok büyük: {len(palette)}")
+
+    palette_lab = rgb_to_lab_array(palette)
+    path = os.path.join(
+        cache_dir, f"palette_lut_{palette_hash(palette)}_{levels}.u8"
+    )
+
+    if levels == _LEVELS:
+        def fill(r_start: int, r_stop: int) -> np.ndarray:
+            return classify_colors(
+                _plane_colors(r_start, r_stop), palette_lab=palette_lab
+            ).astype(np.uint8)
+    else:
+        def fill(r_start: int, r_stop: int) -> np.ndarray:
+            return _grid_cells(r_start, r_stop, levels, palette_lab)
+
+    return _open_or_build(path, (levels, levels, levels), fill)
+
+
+def quantize_pixels(
+    image: np.ndarray,
+    palette: np.ndarray,
+    levels: int = _LEVELS,
+    cache_dir: str = COLOR_LUT_CACHE_DIR,
+) -> np.ndarray:
+    """Her pikseli LAB'da en yakın sabit palet rengine eşler.
+
+    Tam tabloda (levels=256) tek bir indeksleme yeterlidir. Kaba
+    ızgarada pikseller önce hücrelerine indekslenir; yalnızca
+    belirsiz hücrelere düşen pikseller classify_colors() ile kesin
+    olarak eşlenir. İki yol da classify_colors() ile aynı sonucu verir.
+
+    Args:
+        image: RGB formatında uint8 dizi (H, W, 3) veya (N, 3).
+        palette: (P, 3) RGB palet renkleri.
+        levels: Kanal başına tablo boyutu (bkz. get_palette_lut()).
+        cache_dir: Tablo dosyalarının tutulduğu klasör.
+
+    Returns:
+        Her pikselin palet indeksi (N,) - uint8.
+    """
+    lut = get_palette_lut(palette, levels, cache_dir).reshape(-1)
+    bits = _grid_bits(levels)
+
+    if bits == 8:
+        return lut[_rgb_keys(image)]
+
+    rgb = image.reshape(-1, 3)
+    shift = 8 - bits
+    keys = (rgb[:, 0] >> shift).astype(np.uint32) << (2 * bits)
+    keys |= (rgb[:, 1] >> shift).astype(np.uint32) << bits
+    keys |= rgb[:, 2] >> shift
+    labels = lut[keys]
+
+    ambiguous = np.flatnonzero(labels == _AMBIGUOUS)
+    if len(ambiguous):
+        # Belirsiz piksellerin benzersiz renkleri bir kez eşlenir:
+        # geçici 2^24 maske sıralamasız tekilleştirme sağlar
+        keys = _rgb_keys(rgb[ambiguous])
+        present = np.zeros(_LEVELS ** 3, dtype=bool)
+        present[keys] = True
+        colors = np.flatnonzero(present).astype(np.uint32)
+        del present
+
+        exact = np.zeros(_LEVELS ** 3, dtype=np.uint8)
+        exact[colors] = classify_colors(
+            np.stack([colors >> 16, (colors >> 8) & 255, colors & 255],
+                     axis=1).astype(np.uint8),
+            palette_lab=rgb_to_lab_array(palette),
+        )
+        labels[ambiguous] = exact[keys]
+
+    return labels
@@ -2,25 +2,119 @@
 # HISTOGRAM - Renk Dağılımı Analizi
 # ==================================================
 
+import json
 import os
+from typing import Optional
 
+import cv2
 import numpy as np
-import matplotlib.pyplot as plt
 
 
-def plot_rgb_histogram(image: np.ndarray, output_dir: str) -> str:
+# Histogram kutu sinirlari: 0, 1, ..., 256
+_BIN_EDGES = np.arange(257)
+
+
+def _pyplot():
+    """matplotlib.pyplot'u etkileşimsiz Agg backend ile yükler.
+
+    compute_histograms() matplotlib gerektirmez; pyplot yalnızca
+    bir grafik çizileceği zaman import edilir.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def compute_histograms(image: np.ndarray) -> np.ndarray:
+    """Üç kanalın 256 kutulu histogramını hesaplar.
+
+    Sayım cv2.calcHist ile C++ tarafında yapılır; matplotlib'in
+    genel amaçlı kutulamasına göre çok daha hızlıdır. calcHist
+    float32 döndürdüğünden görüntü en fazla 2^24 piksellik satır
+    bantları halinde sayılır ve sonuçlar int64 olarak toplanır;
+    böylece çok büyük görüntülerde de sayımlar kesin kalır.
+
+    Args:
+        image: RGB formatında uint8 numpy dizisi (H, W, 3).
+
+    Returns:
+        (3, 256) boyutunda int64 sayım dizisi (R, G, B sırasıyla).
+    """
+    height, width = image.shape[0], image.shape[1]
+    chunk_rows = max(1, (1 << 24) // max(1, width))
+    counts = np.zeros((3, 256), dtype=np.int64)
+
+    for top in range(0, height, chunk_rows):
+        chunk = np.ascontiguousarray(image[top:top + chunk_rows])
+        for i in range(3):
+            hist = cv2.calcHist([chunk], [i], None, [256], [0, 256])
+            counts[i] += hist.reshape(-1).astype(np.int64)
+
+    return counts
+
+
+def save_histograms(
+    histograms: np.ndarray, output_dir: str, fmt: str = "json"
+) -> str:
+    """Histogram sayımlarını JSON veya NPY olarak kaydeder.
+
+    Args:
+        histograms: compute_histograms() çıktısı (3, 256).
+        output_dir: Çıktı klasörünün yolu.
+        fmt: "json" veya "npy".
+
+    Returns:
+        Kaydedilen dosyanın tam yolu.
+
+    Raises:
+        ValueError: Bilinmeyen format verilirse.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    if fmt == "json":
+        filepath = os.path.join(output_dir, "histograms.json")
+        data = {
+            name: histograms[i].tolist()
+            for i, name in enumerate(["red", "green", "blue"])
+        }
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    elif fmt == "npy":
+        filepath = os.path.join(output_dir, "histograms.npy")
+        np.save(filepath, histograms)
+    else:
+        raise ValueError(f"Bilinmeyen histogram formatı: {fmt}")
+
+    print(f"[OK] Histogram sayımları kaydedildi: {filepath}")
+    return filepath
+
+
+def plot_rgb_histogram(
+    image: np.ndarray,
+    output_dir: str,
+    histograms: Optional[np.ndarray] = None,
+) -> str:
     """Her RGB kanalının histogramını ayrı alt grafiklerde çizer.
 
     Görüntüdeki kırmızı, yeşil ve mavi piksel yoğunluklarının
     0-255 aralığındaki dağılımını 3 ayrı grafik olarak gösterir.
+    Grafik önceden hesaplanmış sayımlardan (stairs) çizilir.
 
     Args:
         image: RGB formatında numpy dizisi (H, W, 3).
         output_dir: Çıktı klasörünün yolu.
+        histograms: compute_histograms() çıktısı. None ise hesaplanır.
 
     Returns:
         Kaydedilen dosyanın tam yolu.
     """
+    if histograms is None:
+        histograms = compute_histograms(image)
+
+    plt = _pyplot()
     channel_names = ["Red", "Green", "Blue"]
     channel_colors = ["red", "green", "blue"]
 
@@ -28,10 +122,10 @@ def plot_rgb_histogram(image: np.ndarray, output_dir: str) -> str:
     fig.suptitle("RGB Kanal Histogramları", fontsize=14, fontweight="bold")
 
     for i, ax in enumerate(axes):
-        ax.hist(
-            image[:, :, i].ravel(),
-            bins=256,
-            range=(0, 256),
+        ax.stairs(
+            histograms[i],
+            _BIN_EDGES,
+            fill=True,
             color=channel_colors[i],
             alpha=0.7,
         )
@@ -51,7 +145,11 @@ def plot_rgb_histogram(image: np.ndarray, output_dir: str) -> str:
     return filepath
 
 
-def plot_combined_histogram(image: np.ndarray, output_dir: str) -> str:
+def plot_combined_histogram(
+    image: np.ndarray,
+    output_dir: str,
+    histograms: Optional[np.ndarray] = None,
+) -> str:
     """Üç renk kanalını tek grafikte üst üste çizer.
 
     R, G, B dağılımlarını aynı eksende göstererek
@@ -60,10 +158,15 @@ def plot_combined_histogram(image: np.ndarray, output_dir: str) -> str:
     Args:
         image: RGB formatında numpy dizisi (H, W, 3).
         output_dir: Çıktı klasörünün yolu.
+        histograms: compute_histograms() çıktısı. None ise hesaplanır.
 
     Returns:
         Kaydedilen dosyanın tam yolu.
     """
+    if histograms is None:
+        histograms = compute_histograms(image)
+
+    plt = _pyplot()
     channel_names = ["Red", "Green", "Blue"]
     channel_colors = ["red", "green", "blue"]
 
@@ -71,10 +174,10 @@ def plot_combined_histogram(image: np.ndarray, output_dir: str) -> str:
     plt.title("Birleşik RGB Histogramı", fontsize=14, fontweight="bold")
 
     for i in range(3):
-        plt.hist(
-            image[:, :, i].ravel(),
-            bins=256,
-            range=(0, 256),
+        plt.stairs(
+            histograms[i],
+            _BIN_EDGES,
+            fill=True,
             color=channel_colors[i],
             alpha=0.4,
             label=channel_names[i],
@@ -2,46 +2,153 @@
 # IMAGE I/O - Görüntü Yükleme ve Kaydetme
 # ==================================================
 
+import io
+import json
 import os
+from typing import Optional
 
 import cv2
 import numpy as np
 
 
-def load_image(path: str) -> np.ndarray:
+# Küçültme oranı -> OpenCV okuma bayrağı. JPEG'de küçültme
+# çözümleme sırasında (DCT ölçekleme) yapılır; tam boyutlu
+# görüntü hiç oluşturulmaz.
+_REDUCED_READ_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+def read_scale_for(path: str, target_size: int) -> int:
+    """Uzun kenarı target_size'ın altına düşürmeyen en büyük küçültme oranı.
+
+    Görüntü boyutu yalnızca dosya başlığından okunur (Pillow),
+    pikseller çözülmez.
+
+    Args:
+        path: Görüntü dosyasının yolu.
+        target_size: Uzun kenar için istenen en küçük piksel sayısı.
+
+    Returns:
+        1, 2, 4 veya 8.
+    """
+    from PIL import Image
+
+    with Image.open(path) as header:
+        long_side = max(header.size)
+
+    scale = 1
+    for candidate in sorted(_REDUCED_READ_FLAGS):
+        if long_side // candidate >= target_size:
+            scale = candidate
+    return scale
+
+
+def load_image(
+    path: str,
+    scale: int = 1,
+    target_size: Optional[int] = None,
+    to_rgb: bool = True,
+) -> np.ndarray:
     """Görüntüyü diskten yükler ve RGB formatında döndürür.
 
     OpenCV varsayılan olarak BGR formatında okur.
     Bu fonksiyon otomatik olarak RGB'ye çevirir,
-    böylece matplotlib ile uyumlu hale gelir.
+    böylece matplotlib ile uyumlu hale gelir. Çevirme
+    ikinci bir tam boyutlu dizi ayırmadan yerinde yapılır.
+
+    scale > 1 veya target_size verilirse görüntü OpenCV'nin
+    IMREAD_REDUCED_COLOR_2/4/8 bayraklarıyla küçültülerek çözülür.
+    Palet çıkarma ve önizleme için tam çözünürlük gerekmez; JPEG'i
+    1/8 ölçekte çözmek hem çok daha hızlı hem de çok daha az bellek
+    kullanır.
 
     Args:
         path: Görüntü dosyasının yolu.
+        scale: Küçültme oranı (1, 2, 4 veya 8).
+        target_size: Verilirse scale yok sayılır; uzun kenarı
+            target_size'ın altına düşürmeyen en büyük oran seçilir.
+        to_rgb: False ise OpenCV'nin BGR dizisi çevrilmeden döner.
 
     Returns:
-        RGB formatında numpy dizisi (H, W, 3).
+        RGB (veya to_rgb=False ise BGR) formatında numpy dizisi (H, W, 3).
 
     Raises:
         FileNotFoundError: Dosya bulunamazsa.
-        ValueError: Görüntü okunamazsa.
+        ValueError: Görüntü okunamazsa veya scale geçersizse.
     """
     if not os.path.exists(path):
         raise FileNotFoundError(f"Görüntü bulunamadı: {path}")
 
-    image = cv2.imread(path)
+    if target_size is not None:
+        try:
+            scale = read_scale_for(path, target_size)
+        except OSError:
+            # Pillow'un tanımadığı formatlarda tam çözünürlükte okunur
+            scale = 1
+
+    if scale not in _REDUCED_READ_FLAGS:
+        raise ValueError(
+            f"Geçersiz küçültme oranı: {scale} "
+            f"(desteklenen: {sorted(_REDUCED_READ_FLAGS)})"
+        )
+
+    image = cv2.imread(path, _REDUCED_READ_FLAGS[scale])
 
     if image is None:
         raise ValueError(f"Görüntü okunamadı: {path}")
 
-    # BGR -> RGB dönüşümü
-    image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    # BGR -> RGB dönüşümü (yerinde, ek kopya yok)
+    if to_rgb:
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
 
     print(f"[OK] Görüntü yüklendi: {path}")
-    print(f"     Boyut: {image_rgb.shape[1]}x{image_rgb.shape[0]} piksel")
-    print(f"     Kanal sayısı: {image_rgb.shape[2]}")
-    print(f"     Dtype: {image_rgb.dtype}")
+    print(f"     Boyut: {image.shape[1]}x{image.shape[0]} piksel"
+          f"{f' (1/{scale} ölçek)' if scale > 1 else ''}")
+    print(f"     Kanal sayısı: {image.shape[2]}")
+    print(f"     Dtype: {image.dtype}")
 
-    return image_rgb
+    return image
+
+
+def decode_image(
+    data: bytes, scale: int = 1, to_rgb: bool = True
+) -> np.ndarray:
+    """Bellekteki görüntü dosyası içeriğini (JPEG, PNG ...) çözer.
+
+    load_image() ile aynı küçültme ve renk sırası seçeneklerini
+    destekler; HTTP isteği gibi diske yazılmamış veriler içindir.
+
+    Args:
+        data: Dosyanın byte içeriği.
+        scale: Küçültme oranı (1, 2, 4 veya 8).
+        to_rgb: False ise BGR dizisi döner.
+
+    Returns:
+        RGB (veya BGR) formatında numpy dizisi (H, W, 3).
+
+    Raises:
+        ValueError: Veri çözülemezse veya scale geçersizse.
+    """
+    if scale not in _REDUCED_READ_FLAGS:
+        raise ValueError(
+            f"Geçersiz küçültme oranı: {scale} "
+            f"(desteklenen: {sorted(_REDUCED_READ_FLAGS)})"
+        )
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    image = cv2.imdecode(buffer, _REDUCED_READ_FLAGS[scale]) if len(buffer) else None
+
+    if image is None:
+        raise ValueError("Görüntü verisi çözülemedi")
+
+    if to_rgb:
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+
+    return image
 
 
 def save_image(image: np.ndarray, filename: str, output_dir: str) -> str:
@@ -69,3 +176,233 @@ def save_image(image: np.ndarray, filename: str, output_dir: str) -> str:
     print(f"[OK] Görüntü kaydedildi: {full_path}")
 
     return full_path
+
+
+def _indexed_image(label_map: np.ndarray, palette: np.ndarray):
+    """Etiket haritası ve paletten PIL "P" modunda görüntü oluşturur."""
+    from PIL import Image
+
+    if len(palette) > 256:
+        raise ValueError(
+            f"Paletli PNG en fazla 256 renk destekler: {len(palette)}"
+        )
+
+    indexed = Image.fromarray(label_map.astype(np.uint8, copy=False), mode="P")
+    indexed.putpalette(
+        np.clip(palette, 0, 255).astype(np.uint8).reshape(-1).tolist()
+    )
+    return indexed
+
+
+def save_indexed_png(
+    label_map: np.ndarray,
+    palette: np.ndarray,
+    filename: str,
+    output_dir: str,
+) -> str:
+    """Segmented görüntüyü 8-bit paletli (indexed) PNG olarak kaydeder.
+
+    Segmented görüntüde yalnızca K renk bulunduğundan her piksel
+    için 3 byte RGB yerine 1 byte palet indeksi yazılır; palet
+    (PLTE) dosyanın içinde saklanır. Görüntüleyiciler dosyayı
+    normal RGB görüntü gibi açar, etiketler ise palet
+    indeksleri olarak doğrudan okunabilir (PIL "P" modu).
+
+    Args:
+        label_map: (H, W) küme etiketleri (create_label_map() çıktısı).
+        palette: Küme merkezleri (K, 3) - RGB değerleri, K <= 256.
+        filename: Kaydedilecek dosya adı (örn: "segmented.png").
+        output_dir: Çıktı klasörünün yolu.
+
+    Returns:
+        Kaydedilen dosyanın tam yolu.
+
+    Raises:
+        ValueError: K 256'dan büyükse (8-bit palete sığmaz).
+    """
+    indexed = _indexed_image(label_map, palette)
+
+    os.makedirs(output_dir, exist_ok=True)
+    full_path = os.path.join(output_dir, filename)
+    indexed.save(full_path, format="PNG")
+
+    print(f"[OK] Paletli görüntü kaydedildi: {full_path} "
+          f"({len(palette)} renk)")
+
+    return full_path
+
+
+def encode_indexed_png(label_map: np.ndarray, palette: np.ndarray) -> bytes:
+    """save_indexed_png() ile aynı paletli PNG'yi bellekte üretir.
+
+    Args:
+        label_map: (H, W) küme etiketleri.
+        palette: Küme merkezleri (K, 3), K <= 256.
+
+    Returns:
+        PNG dosyasının byte içeriği.
+
+    Raises:
+        ValueError: K 256'dan büyükse.
+    """
+    buffer = io.BytesIO()
+    _indexed_image(label_map, palette).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def save_label_map(
+    label_map: np.ndarray, output_dir: str, fmt: str = "npz"
+) -> str:
+    """Etiket haritasını sıkıştırılmış olarak kaydeder.
+
+    "npz" -> labels.npz (np.savez_compressed, anahtar "labels")
+    "png" -> labels.png (tek kanallı gri PNG; K > 256 ise 16-bit)
+
+    Args:
+        label_map: (H, W) küme etiketleri (uint8 / uint16).
+        output_dir: Çıktı klasörünün yolu.
+        fmt: "npz" veya "png".
+
+    Returns:
+        Kaydedilen dosyanın tam yolu.
+
+    Raises:
+        ValueError: Bilinmeyen format verilirse.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    if fmt == "npz":
+        full_path = os.path.join(output_dir, "labels.npz")
+        np.savez_compressed(full_path, labels=label_map)
+    elif fmt == "png":
+        full_path = os.path.join(output_dir, "labels.png")
+        cv2.imwrite(full_path, label_map)
+    else:
+        raise ValueError(f"Bilinmeyen etiket haritası formatı: {fmt}")
+
+    print(f"[OK] Etiket haritası kaydedildi: {full_path}")
+
+    return full_path
+
+
+def load_label_map(path: str) -> np.ndarray:
+    """save_label_map() veya save_indexed_png() çıktısını okur.
+
+    Paletli PNG'de palet indeksleri, gri PNG'de piksel değerleri,
+    NPZ'de "labels" dizisi etiket olarak döner; yeniden kümeleme
+    gerekmez.
+
+    Args:
+        path: .npz veya .png dosyasının yolu.
+
+    Returns:
+        (H, W) etiket haritası.
+
+    Raises:
+        FileNotFoundError: Dosya bulunamazsa.
+        ValueError: Dosya etiket haritası olarak okunamazsa.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Etiket haritası bulunamadı: {path}")
+
+    if path.endswith(".npz"):
+        with np.load(path) as data:
+            return data["labels"]
+
+    from PIL import Image
+
+    with Image.open(path) as image:
+        if image.mode not in ("P", "L", "I;16"):
+            raise ValueError(f"Etiket haritası değil ({image.mode}): {path}")
+        return np.asarray(image)
+
+
+def save_palette_json(
+    centers: np.ndarray,
+    dominant_colors: list,
+    color_names: list,
+    output_dir: str,
+    filename: str,
+    files: Optional[dict] = None,
+) -> str:
+    """Palet bilgilerini (merkezler, yüzdeler, isimler) JSON olarak yazar.
+
+    Paletli PNG ve etiket haritasının yanındaki sidecar dosyasıdır;
+    etiket i, "colors" listesinde color_id == i olan renktir.
+
+    Args:
+        centers: Küme merkezleri (K, 3).
+        dominant_colors: get_dominant_colors() çıktısı.
+        color_names: categorize_centers() çıktısı (boş olabilir).
+        output_dir: Çıktı klasörünün yolu.
+        filename: JSON dosyasının adı.
+        files: Eşlik eden dosyaların adları (örn. {"labels": "labels.npz"}).
+
+    Returns:
+        Kaydedilen dosyanın tam yolu.
+    """
+    percentages = {c["color_id"]: c["percentage"] for c in dominant_colors}
+    names = {c["color_id"]: c["name"] for c in color_names}
+
+    payload = {
+        "k": int(len(centers)),
+        "files": files or {},
+        "colors": [
+            {
+                "color_id": i,
+                "rgb": np.clip(center, 0, 255).astype(int).tolist(),
+                "center": [round(float(v), 4) for v in center],
+                "percentage": percentages.get(i, 0.0),
+                "name": names.get(i),
+            }
+            for i, center in enumerate(centers)
+        ],
+    }
+
+    os.makedirs(output_dir, exist_ok=True)
+    full_path = os.path.join(output_dir, filename)
+    with open(full_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
+    print(f"[OK] Palet bilgisi kaydedildi: {full_path}")
+
+    return full_path
+
+
+def load_palette(path: str) -> np.ndarray:
+    """Sabit palet dosyasını (P, 3) RGB dizisi olarak okur.
+
+    Desteklenen JSON biçimleri:
+        {"Kirmizi": [255, 0, 0], ...}          -> isim: RGB sözlüğü
+        [[255, 0, 0], [0, 0, 255], ...]        -> RGB listesi
+        save_palette_json() çıktısı           -> "colors" içindeki "rgb"
+
+    Args:
+        path: JSON dosyasının yolu.
+
+    Returns:
+        (P, 3) uint8 RGB palet.
+
+    Raises:
+        FileNotFoundError: Dosya bulunamazsa.
+        ValueError: İçerik (P, 3) RGB palet değilse.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Palet dosyası bulunamadı: {path}")
+
+    with open(path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+
+    if isinstance(payload, dict) and "colors" in payload:
+        colors = [color["rgb"] for color in payload["colors"]]
+    elif isinstance(payload, dict):
+        colors = list(payload.values())
+    else:
+        colors = payload
+
+    palette = np.asarray(colors)
+    if (palette.ndim != 2 or palette.shape[1] != 3 or len(palette) == 0
+            or palette.min() < 0 or palette.max() > 255):
+        raise ValueError(f"Geçersiz palet (P, 3 RGB olmalı): {path}")
+
+    return palette.astype(np.uint8)
@@ -0,0 +1,188 @@
+# ==================================================
+# INSTRUMENTATION - Aşama Ölçümü ve Çalıştırma Raporu
+# ==================================================
+# Pipeline'ın her adımını bir context manager ile sarar ve
+# şu bilgileri kaydeder:
+#
+#   - duvar saati süresi (wall) ve CPU süresi: cpu_seconds yalnızca
+#     adımı çalıştıran thread'in CPU'sudur (time.thread_time);
+#     process_cpu_seconds ise aynı aralıkta tüm süreç thread'lerinin
+#     (paralel restart'lar, bölge thread'leri, arka plan yazıcısı)
+#     toplamıdır ve örtüşen başka işleri de içerebilir
+#   - süreç tepe RSS'i ve adımın tepe RSS'e etkisi
+#   - opsiyonel: tracemalloc ile adım içi tepe bellek
+#   - opsiyonel: adım başına cProfile çıktısı (.prof)
+#   - girdi boyutları (piksel sayısı, K, iterasyon ...)
+#   - arka plan yazıcısına verilen işlerin yazıcı thread'inde
+#     ölçülen süreleri (writer_*_seconds, bkz. BackgroundWriter)
+#
+# Sonuçlar çıktıların yanına JSON rapor olarak yazılır.
+
+import cProfile
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Sürecin şimdiye kadarki tepe RSS değerini byte olarak döndürür.
+
+    Windows'ta (resource modülü yok) None döner.
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS byte cinsinden raporlar
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def new_report(**meta) -> dict:
+    """Boş bir çalıştırma raporu oluşturur.
+
+    Args:
+        **meta: Rapora eklenecek genel bilgiler (görüntü yolu, K ...).
+
+    Returns:
+        {"meta": {...}, "environment": {...}, "stages": []}
+    """
+    return {
+        "meta": {
+            **meta,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "stages": [],
+    }
+
+
+@contextmanager
+def measure_stage(
+    report: dict,
+    name: str,
+    profile_dir: Optional[str] = None,
+    trace_memory: bool = False,
+    **info,
+) -> Iterator[dict]:
+    """Bir pipeline adımının süresini ve bellek kullanımını ölçer.
+
+    cpu_seconds çağıran thread'in CPU süresidir; adımın kendi açtığı
+    thread'ler ve aynı anda çalışan diğer işler dahil süreç geneli
+    CPU süresi process_cpu_seconds alanındadır.
+
+    Kullanım:
+        with measure_stage(report, "kmeans", k=8) as stage:
+            ...
+            stage["n_iter"] = 12   # adım içinden ek bilgi
+
+    Args:
+        report: new_report() ile oluşturulan rapor.
+        name: Adım adı (örn: "load_image").
+        profile_dir: Verilirse adım cProfile ile profillenir ve
+            "<sıra>_<ad>.prof" dosyasına yazılır.
+        trace_memory: tracemalloc ile adım içi tepe Python/NumPy
+            bellek artışını ölç (yavaşlatır).
+        **info: Kayda eklenecek girdi bilgileri (pixels, k ...).
+
+    Yields:
+        Adım kaydı sözlüğü; adım içinde ek alan yazılabilir.
+    """
+    record = {"stage": name, **info}
+
+    rss_before = _peak_rss_bytes()
+    if trace_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        traced_before = tracemalloc.get_traced_memory()[0]
+
+    profiler = cProfile.Profile() if profile_dir else None
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    process_cpu_start = time.process_time()
+
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield record
+    finally:
+        if profiler is not None:
+            profiler.disable()
+
+        record["wall_seconds"] = round(time.perf_counter() - wall_start, 4)
+        record["cpu_seconds"] = round(time.thread_time() - cpu_start, 4)
+        record["process_cpu_seconds"] = round(
+            time.process_time() - process_cpu_start, 4
+        )
+
+        rss_after = _peak_rss_bytes()
+        record["peak_rss_bytes"] = rss_after
+        record["peak_rss_delta_bytes"] = (
+            rss_after - rss_before if rss_after is not None else None
+        )
+
+        if trace_memory:
+            record["traced_peak_bytes"] = (
+                tracemalloc.get_traced_memory()[1] - traced_before
+            )
+
+        if profiler is not None:
+            os.makedirs(profile_dir, exist_ok=True)
+            index = len(report["stages"]) + 1
+            profile_path = os.path.join(profile_dir, f"{index:02d}_{name}.prof")
+            profiler.dump_stats(profile_path)
+            record["profile"] = profile_path
+
+        report["stages"].append(record)
+
+
+def write_report(report: dict, output_dir: str, filename: str) -> str:
+    """Raporu toplam sürelerle birlikte JSON olarak kaydeder.
+
+    Args:
+        report: new_report() ile oluşturulup doldurulan rapor.
+        output_dir: Çıktı klasörü.
+        filename: Rapor dosyasının adı.
+
+    Returns:
+        Kaydedilen dosyanın tam yolu.
+    """
+    report["totals"] = {
+        "wall_seconds": round(
+            sum(s["wall_seconds"] for s in report["stages"]), 4
+        ),
+        "cpu_seconds": round(
+            sum(s["cpu_seconds"] for s in report["stages"]), 4
+        ),
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+    writer_stages = [s for s in report["stages"] if "writer_jobs" in s]
+    if writer_stages:
+        for name in ("writer_wall_seconds", "writer_cpu_seconds"):
+            report["totals"][name] = round(
+                sum(s[name] for s in writer_stages), 4
+            )
+
+    os.makedirs(output_dir, exist_ok=True)
+    filepath = os.path.join(output_dir, filename)
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"[OK] Çalıştırma raporu kaydedildi: {filepath}")
+    return filepath
@@ -0,0 +1,247 @@
+# ==================================================
+# IO PIPELINE - Okuma / Hesaplama / Yazma Örtüşmesi
+# ==================================================
+# Çok sayıda görüntü işlenirken disk (özellikle ağ üzerindeki
+# depolama) beklemesini hesaplamayla örtüştürmek için:
+#
+#   prefetch_images  -> sıradaki N görüntüyü bir thread havuzunda
+#                       önceden çözer (cv2.imread GIL'i bırakır)
+#   BackgroundWriter -> PNG kodlama / dosya yazma işlerini sınırlı
+#                       bir kuyrukla arka plan thread'lerine verir
+#
+# pyplot thread-safe olmadığından matplotlib işleri ayrı, tek
+# thread'lik bir kuyrukta sırayla çalışır.
+#
+# Yazıcı işlerinin süreleri (kuyrukta bekleme, duvar saati, CPU)
+# yazıcı thread'inde ölçülür ve istenirse bir kayda (örn. pipeline
+# aşama kaydı) eklenir; when_done() bir anahtarın tüm işleri
+# bittiğinde çalışır (örn. çalıştırma raporunu yazmak için).
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+)
+
+import numpy as np
+
+from src.image_io import load_image
+
+
+def prefetch_images(
+    paths: Iterable[str],
+    depth: int,
+    loader: Callable[[str], np.ndarray] = load_image,
+) -> Iterator[Tuple[str, Optional[np.ndarray], Optional[Exception]]]:
+    """Görüntüleri sırayla üretir; sıradaki depth tanesini önceden çözer.
+
+    Çağıran taraf bir görüntüyü işlerken sonraki görüntüler arka
+    planda okunur. Sıra korunur; okunamayan görüntü için hata
+    döndürülür, akış durmaz.
+
+    Args:
+        paths: Görüntü yolları.
+        depth: Aynı anda çözülen (önden okunan) görüntü sayısı.
+        loader: Bir yolu RGB diziye çeviren fonksiyon.
+
+    Yields:
+        (yol, görüntü, hata): Başarılıysa hata None, değilse görüntü None.
+    """
+    depth = max(1, depth)
+    path_iter = iter(paths)
+
+    with ThreadPoolExecutor(
+        max_workers=depth, thread_name_prefix="decode"
+    ) as pool:
+        pending = deque(
+            (path, pool.submit(loader, path))
+            for path in islice(path_iter, depth)
+        )
+
+        while pending:
+            path, future = pending.popleft()
+
+            next_path = next(path_iter, None)
+            if next_path is not None:
+                pending.append((next_path, pool.submit(loader, next_path)))
+
+            try:
+                image, error = future.result(), None
+            except Exception as exc:
+                image, error = None, exc
+
+            yield path, image, error
+
+
+class BackgroundWriter:
+    """Çıktı yazma işlerini arka planda, sınırlı kuyrukla çalıştırır.
+
+    Kuyrukta bekleyen iş sayısı max_pending'e ulaştığında submit()
+    bloklanır; böylece hesaplama yazmadan çok öne geçip belleği
+    bekleyen görüntülerle doldurmaz. Her iş bir anahtarla (örn.
+    görüntü yolu) kaydedilir, hatalar close() ile anahtar bazında
+    döndürülür.
+
+    Kullanım:
+        with BackgroundWriter(workers=2, max_pending=16) as writer:
+            writer.submit(save_image, segmented, "a.png", out, key=path,
+                          record=stage_record)
+            writer.submit(plot_summary, ..., key=path, plot=True)
+            writer.when_done(path, write_report, report, out, "run.json")
+        errors = writer.errors
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 16):
+        """
+        Args:
+            workers: Kodlama / yazma thread sayısı.
+            max_pending: Aynı anda kuyrukta olabilecek en fazla iş.
+        """
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="writer"
+        )
+        # matplotlib (pyplot) işleri tek thread'de sırayla çalışır
+        self._plot_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="plot"
+        )
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._jobs: List[Tuple[Hashable, Future]] = []
+        self._lock = threading.Lock()
+        # Anahtar başına bitmemiş iş sayısı ve bitince çalışacaklar
+        self._pending: Dict[Hashable, int] = {}
+        self._waiting: Dict[Hashable, List[Callable[[], Any]]] = {}
+        self.errors: Dict[Hashable, List[str]] = {}
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        key: Hashable = None,
+        plot: bool = False,
+        record: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """Bir yazma işini kuyruğa ekler; kuyruk doluysa bekler.
+
+        Args:
+            fn: Çalıştırılacak fonksiyon (örn. save_image).
+            *args, **kwargs: fn'in argümanları. Diziler iş bitene
+                kadar değiştirilmemelidir.
+            key: Hataların ilişkilendirileceği anahtar.
+            plot: matplotlib kullanan iş ise True (tek thread).
+            record: Verilirse işin yazıcı thread'inde ölçülen süreleri
+                bu sözlüğe eklenir (writer_jobs, writer_queue_seconds,
+                writer_wall_seconds, writer_cpu_seconds; aynı kayda
+                verilen işler toplanır).
+
+        Returns:
+            İşin Future nesnesi.
+        """
+        self._slots.acquire()
+        pool = self._plot_pool if plot else self._pool
+        submitted = time.perf_counter()
+
+        def timed() -> Any:
+            wall_start = time.perf_counter()
+            cpu_start = time.thread_time()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                if record is not None:
+                    self._add_timing(
+                        record,
+                        wall_start - submitted,
+                        time.perf_counter() - wall_start,
+                        time.thread_time() - cpu_start,
+                    )
+
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + 1
+        try:
+            future = pool.submit(timed)
+        except BaseException:
+            with self._lock:
+                self._pending[key] -= 1
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._finish(key))
+        self._jobs.append((key, future))
+        return future
+
+    def _add_timing(
+        self, record: dict, queue: float, wall: float, cpu: float
+    ) -> None:
+        """Bir işin sürelerini kayda ekler (aynı kayıttakiler toplanır)."""
+        with self._lock:
+            record["writer_jobs"] = record.get("writer_jobs", 0) + 1
+            for name, seconds in (
+                ("writer_queue_seconds", queue),
+                ("writer_wall_seconds", wall),
+                ("writer_cpu_seconds", cpu),
+            ):
+                record[name] = round(record.get(name, 0.0) + seconds, 4)
+
+    def _finish(self, key: Hashable) -> None:
+        """Slotu bırakır; anahtarın son işiyse bekleyenleri çalıştırır."""
+        self._slots.release()
+        with self._lock:
+            self._pending[key] -= 1
+            callbacks = []
+            if self._pending[key] == 0:
+                del self._pending[key]
+                callbacks = self._waiting.pop(key, [])
+        for callback in callbacks:
+            self._run_callback(key, callback)
+
+    def _run_callback(
+        self, key: Hashable, callback: Callable[[], Any]
+    ) -> None:
+        """when_done() işini çalıştırır; hatasını anahtara kaydeder."""
+        try:
+            callback()
+        except Exception as exc:
+            with self._lock:
+                self.errors.setdefault(key, []).append(
+                    f"{type(exc).__name__}: {exc}"
+                )
+
+    def when_done(
+        self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> None:
+        """Anahtarın şimdiye kadar verilen tüm işleri bitince fn'i çalıştırır.
+
+        fn, anahtarın son işini bitiren yazıcı thread'inde (bekleyen
+        iş yoksa hemen, çağıran thread'de) çalışır; kuyruğa girmez.
+        Hatası close() sonucunda anahtarın hatalarına eklenir.
+        """
+        callback = lambda: fn(*args, **kwargs)  # noqa: E731
+        with self._lock:
+            if key in self._pending:
+                self._waiting.setdefault(key, []).append(callback)
+                return
+        self._run_callback(key, callback)
+
+    def close(self) -> Dict[Hashable, List[str]]:
+        """Tüm işlerin bitmesini bekler ve hataları anahtar bazında döndürür."""
+        self._pool.shutdown(wait=True)
+        self._plot_pool.shutdown(wait=True)
+
+        for key, future in self._jobs:
+            exc = future.exception()
+            if exc is not None:
+                self.errors.setdefault(key, []).append(
+                    f"{type(exc).__name__}: {exc}"
+                )
+        self._jobs.clear()
+
+        return self.errors
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,282 @@
+# ==================================================
+# KMEANS BACKENDS - Değiştirilebilir K-Means Motorları
+# ==================================================
+# apply_kmeans() başlangıç seçimi, paralel restart'lar ve erken
+# bırakmayı kendisi yönetir; tek bir Lloyd çalıştırmasını (verilen
+# merkezlerden yakınsamaya kadar) ise burada kayıtlı bir backend'e
+# verir. Her backend aynı sözleşmeyi uygular:
+#
+#   run(data, weights, centers, tol, max_iter)
+#       -> (labels, centers, inertia, n_iter)
+#
+#   "sklearn" -> sklearn.cluster.KMeans (varsayılan, ağırlık destekli)
+#   "cv2"     -> cv2.kmeans (float32 RGB'de çoğu zaman daha hızlı;
+#                örnek ağırlığı desteklemez)
+#   "numba"   -> Numba ile derlenen atama / güncelleme çekirdekleri
+#                (isteğe bağlı bağımlılık: pip install numba)
+#
+# n_iter bilinmiyorsa (cv2) None döner; çağıranlar iterasyon sayısına
+# dayalı kararları (örn. yoklamada yakınsama) bu durumda atlar.
+#
+# Backend'ler KMEANS_BACKEND / --backend ile seçilir; hız ve inertia
+# karşılaştırması için: python -m benchmarks.backends
+
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+LloydResult = Tuple[np.ndarray, np.ndarray, float, Optional[int]]
+
+# Çekirdeklerdeki satır döngüsü; numba derlenirken numba.prange olur
+# (saf Python'da ikisi de range gibi davranır)
+_prange = range
+
+
+def _absolute_tol(data: np.ndarray, tol: float) -> float:
+    """sklearn ile aynı ölçek: tol x kanal varyanslarının ortalaması."""
+    return float(tol * data.var(axis=0).mean())
+
+
+def _nearest(
+    data: np.ndarray, centers: np.ndarray, chunk_size: int = 1 << 20
+) -> np.ndarray:
+    """Her satırın en yakın merkezini (int32) parça parça bulur."""
+    centers = centers.astype(np.float32)
+    center_norms = (centers ** 2).sum(axis=1)
+    labels = np.empty(len(data), dtype=np.int32)
+
+    for start in range(0, len(data), chunk_size):
+        chunk = data[start:start + chunk_size]
+        distances = center_norms - 2.0 * (chunk @ centers.T)
+        labels[start:start + chunk_size] = distances.argmin(axis=1)
+
+    return labels
+
+
+def sklearn_lloyd(
+    data: np.ndarray,
+    weights: Optional[np.ndarray],
+    centers: np.ndarray,
+    tol: float,
+    max_iter: int,
+) -> LloydResult:
+    """sklearn.cluster.KMeans ile verilen merkezlerden tek çalıştırma."""
+    from sklearn.cluster import KMeans
+
+    kmeans = KMeans(
+        n_clusters=len(centers), init=centers, n_init=1,
+        tol=tol, max_iter=max_iter,
+    ).fit(data, sample_weight=weights)
+
+    return (
+        kmeans.labels_, kmeans.cluster_centers_,
+        float(kmeans.inertia_), int(kmeans.n_iter_),
+    )
+
+
+def cv2_lloyd(
+    data: np.ndarray,
+    weights: Optional[np.ndarray],
+    centers: np.ndarray,
+    tol: float,
+    max_iter: int,
+) -> LloydResult:
+    """cv2.kmeans ile verilen merkezlerden tek çalıştırma.
+
+    cv2.kmeans başlangıç merkezi değil başlangıç etiketi alır; etiketler
+    merkezlere en yakın atamadan üretilir (KMEANS_USE_INITIAL_LABELS).
+    Durma ölçütü sklearn tol'ünden türetilen merkez kayması eşiğidir.
+    cv2 iterasyon sayısını döndürmediğinden n_iter None döner.
+
+    Raises:
+        ValueError: weights verilirse (cv2.kmeans ağırlık desteklemez).
+    """
+    if weights is not None:
+        raise ValueError(
+            "cv2 backend'i ornek agirligi desteklemez "
+            "(unique_colors icin sklearn veya numba kullanin)"
+        )
+
+    import cv2
+
+    data = np.ascontiguousarray(data, dtype=np.float32)
+    labels = _nearest(data, centers).reshape(-1, 1)
+    criteria = (
+        cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_MAX_ITER,
+        max_iter,
+        np.sqrt(_absolute_tol(data, tol)),
+    )
+
+    compactness, labels, centers = cv2.kmeans(
+        data, len(centers), labels, criteria, 1,
+        cv2.KMEANS_USE_INITIAL_LABELS,
+    )
+    return labels.reshape(-1), centers, float(compactness), None
+
+
+def _assign_kernel(data, centers, labels, distances):
+    """Her satırı en yakın merkeze atar; uzaklığı distances'a yazar."""
+    for i in _prange(data.shape[0]):
+        best = np.inf
+        best_j = 0
+        for j in range(centers.shape[0]):
+            d = 0.0
+            for c in range(data.shape[1]):
+                diff = data[i, c] - centers[j, c]
+                d += diff * diff
+            if d < best:
+                best = d
+                best_j = j
+        labels[i] = best_j
+        distances[i] = best
+
+
+def _update_kernel(data, weights, labels, old_centers):
+    """Ağırlıklı ortalamayla yeni merkezleri hesaplar (boş küme korunur)."""
+    k, channels = old_centers.shape
+    sums = np.zeros((k, channels))
+    totals = np.zeros(k)
+    for i in range(data.shape[0]):
+        j = labels[i]
+        totals[j] += weights[i]
+        for c in range(channels):
+            sums[j, c] += weights[i] * data[i, c]
+
+    centers = old_centers.copy()
+    for j in range(k):
+        if totals[j] > 0:
+            for c in range(channels):
+                centers[j, c] = sums[j, c] / totals[j]
+    return centers
+
+
+@lru_cache(maxsize=1)
+def _numba_kernels() -> Tuple[Callable, Callable]:
+    """Çekirdekleri ilk kullanımda derler (atama paralel, güncelleme sıralı).
+
+    Güncelleme toplamları sıralı yapılır; böylece sonuç Numba thread
+    sayısından bağımsızdır.
+
+    Raises:
+        ImportError: numba kurulu değilse.
+    """
+    global _prange
+
+    try:
+        import numba
+    except ImportError as exc:
+        raise ImportError(
+            "numba backend'i icin numba gerekli: pip install numba"
+        ) from exc
+
+    _prange = numba.prange
+    assign = numba.njit(parallel=True, cache=True)(_assign_kernel)
+    update = numba.njit(cache=True)(_update_kernel)
+    return assign, update
+
+
+def lloyd_loop(
+    data: np.ndarray,
+    weights: Optional[np.ndarray],
+    centers: np.ndarray,
+    tol: float,
+    max_iter: int,
+    assign: Callable = _assign_kernel,
+    update: Callable = _update_kernel,
+) -> LloydResult:
+    """Atama / güncelleme çekirdekleriyle Lloyd iterasyonları.
+
+    Merkez kaymalarının kareleri toplamı sklearn ölçeğindeki tol'ün
+    altına düşünce durur; son merkezlere göre etiketler yeniden atanır.
+    """
+    data = np.ascontiguousarray(data, dtype=np.float32)
+    weights = (
+        np.ones(len(data)) if weights is None
+        else np.asarray(weights, dtype=np.float64)
+    )
+    centers = np.asarray(centers, dtype=np.float64).copy()
+    threshold = _absolute_tol(data, tol)
+
+    labels = np.empty(len(data), dtype=np.int32)
+    distances = np.empty(len(data), dtype=np.float32)
+
+    n_iter = 0
+    for n_iter in range(1, max_iter + 1):
+        assign(data, centers, labels, distances)
+        new_centers = update(data, weights, labels, centers)
+        shift = float(((new_centers - centers) ** 2).sum())
+        centers = new_centers
+        if shift <= threshold:
+            break
+
+    assign(data, centers, labels, distances)
+    inertia = float(np.dot(weights, distances.astype(np.float64)))
+    return labels, centers, inertia, n_iter
+
+
+def numba_lloyd(
+    data: np.ndarray,
+    weights: Optional[np.ndarray],
+    centers: np.ndarray,
+    tol: float,
+    max_iter: int,
+) -> LloydResult:
+    """Numba ile derlenmiş çekirdeklerle tek çalıştırma (bkz. lloyd_loop)."""
+    assign, update = _numba_kernels()
+    return lloyd_loop(data, weights, centers, tol, max_iter, assign, update)
+
+
+# Backend adı -> tek Lloyd çalıştırması
+KMEANS_BACKENDS: Dict[str, Callable[..., LloydResult]] = {
+    "sklearn": sklearn_lloyd,
+    "cv2": cv2_lloyd,
+    "numba": numba_lloyd,
+}
+
+
+# Örnek ağırlığı (unique_colors) desteklemeyen backend'ler
+WEIGHTLESS_BACKENDS = ("cv2",)
+
+
+def check_backend(name: str, weighted: bool = False) -> None:
+    """Backend adını ve ağırlıklı veriyle uyumunu çalıştırmadan doğrular.
+
+    Raises:
+        ValueError: Bilinmeyen backend adı verilirse veya backend
+            örnek ağırlığını desteklemiyorsa ve weighted True ise.
+    """
+    get_backend(name)
+    if weighted and name in WEIGHTLESS_BACKENDS:
+        raise ValueError(
+            f"{name} backend'i ornek agirligi desteklemez; "
+            f"unique_colors icin sklearn veya numba kullanin"
+        )
+
+
+def get_backend(name: str) -> Callable[..., LloydResult]:
+    """Adı verilen backend'in çalıştırma fonksiyonunu döndürür.
+
+    Raises:
+        ValueError: Bilinmeyen backend adı verilirse.
+    """
+    if name not in KMEANS_BACKENDS:
+        raise ValueError(
+            f"Bilinmeyen K-Means backend'i: {name} "
+            f"({', '.join(KMEANS_BACKENDS)})"
+        )
+    return KMEANS_BACKENDS[name]
+
+
+def available_backends() -> List[str]:
+    """Bağımlılıkları kurulu olan backend'lerin adları."""
+    names = []
+    for name in KMEANS_BACKENDS:
+        if name == "numba":
+            try:
+                _numba_kernels()
+            except ImportError:
+                continue
+        names.append(name)
+    return names
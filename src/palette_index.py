@@ -0,0 +1,461 @@
+# ==================================================
+# PALETTE INDEX - Palet İmzası ile Benzer Görüntü Arama
+# ==================================================
+# Her görüntünün paleti (dominant renklerin CIE LAB merkezleri +
+# yüzdeleri) iki sabit boyutlu kayıt olarak diske eklenir:
+#
+#   signatures.f32 -> (N, D) imza: paletin LAB ızgarasındaki yumuşak
+#                     histogramının karekökü (birim uzunlukta)
+#   palettes.f32   -> (N, MAX_COLORS, 4) [L, a, b, ağırlık] (sıfır dolgulu)
+#   ids.txt        -> her satır bir görüntü kimliği (yol)
+#
+# İki imzanın iç çarpımı Bhattacharyya benzerliğidir; sorgu tüm
+# katalogda tek bir vektörize matris-vektör çarpımıdır (parça parça,
+# thread'lerde). En iyi adaylar gerçek palet mesafesiyle (ağırlıklı
+# en yakın renk Delta-E'si) yeniden sıralanır.
+#
+# Dosyalar np.memmap ile açılır; ekleme dosya sonuna yazmaktır
+# (yeniden oluşturma yok). ids.txt en son yazılır ve kayıt sayısını
+# belirler; yarım kalmış bir eklemenin fazlası açılışta kesilir.
+# Aynı anda tek bir yazıcı varsayılır (toplu modda ana süreç).
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from config import (
+    PALETTE_INDEX_MAX_COLORS,
+    PALETTE_INDEX_TOP_K,
+    PALETTE_INDEX_CANDIDATES,
+)
+
+
+# Dosya formatı değişirse eski indeksler açılmaz
+_INDEX_VERSION = 1
+
+# İmza ızgarasının kanal merkezleri (CIE LAB): 4 x 4 x 4 = 64 boyut.
+# a / b fotoğraflarda nadiren +-60'ı aşar; uçtaki renkler en yakın
+# merkezlere yumuşak olarak dağılır.
+_L_CENTERS = np.linspace(10.0, 90.0, 4)
+_AB_CENTERS = np.linspace(-45.0, 45.0, 4)
+
+# Yumuşak atamanın genişliği (ızgara aralığı cinsinden)
+_SOFTNESS = 0.4
+
+# Sorguda tek seferde çarpılan imza satırı
+_SEARCH_CHUNK_ROWS = 1 << 17
+
+# İmza üretimi ve eklemede tek seferde işlenen palet sayısı; ara
+# (satır, renk, D, 3) dizisi parça başına ~50 MB ile sınırlı kalır
+_SIGNATURE_CHUNK_ROWS = 4096
+
+
+def _grid_centers() -> Tuple[np.ndarray, np.ndarray]:
+    """Izgara merkezlerini (D, 3) ve eksen başına genişliği döndürür."""
+    l, a, b = np.meshgrid(_L_CENTERS, _AB_CENTERS, _AB_CENTERS, indexing="ij")
+    centers = np.stack([l, a, b], axis=-1).reshape(-1, 3)
+    widths = _SOFTNESS * np.array([
+        _L_CENTERS[1] - _L_CENTERS[0],
+        _AB_CENTERS[1] - _AB_CENTERS[0],
+        _AB_CENTERS[1] - _AB_CENTERS[0],
+    ])
+    return centers, widths
+
+
+_GRID_CENTERS, _GRID_WIDTHS = _grid_centers()
+
+SIGNATURE_DIM = len(_GRID_CENTERS)
+
+
+def rgb_to_cielab(colors: np.ndarray) -> np.ndarray:
+    """(M, 3) RGB değerlerini float CIE LAB'a çevirir (L 0-100).
+
+    palette_drift() ile aynı dönüşüm; Delta-E doğrudan Öklid mesafesidir.
+    """
+    scaled = (np.clip(colors, 0, 255) / 255.0).astype(np.float32)
+    return cv2.cvtColor(scaled.reshape(1, -1, 3), cv2.COLOR_RGB2LAB)[0]
+
+
+def pack_palette(
+    centers: np.ndarray,
+    percentages: np.ndarray,
+    max_colors: int = PALETTE_INDEX_MAX_COLORS,
+) -> np.ndarray:
+    """RGB merkezleri ve yüzdeleri sabit boyutlu palet kaydına çevirir.
+
+    En büyük max_colors renk tutulur, ağırlıklar toplamı 1 olacak
+    şekilde normalize edilir; boş satırlar sıfır ağırlıklıdır.
+
+    Args:
+        centers: (M, 3) RGB merkezler.
+        percentages: (M,) yüzdeler veya piksel sayıları.
+        max_colors: Kayıttaki renk yuvası sayısı.
+
+    Returns:
+        (max_colors, 4) float32 [L, a, b, ağırlık].
+
+    Raises:
+        ValueError: Palet boşsa veya ağırlıkların toplamı 0 ise.
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+    weights = np.asarray(percentages, dtype=np.float64).reshape(-1)
+    if len(centers) == 0 or len(centers) != len(weights):
+        raise ValueError("Palet bos veya merkez / yuzde sayisi uyusmuyor")
+
+    order = np.argsort(-weights, kind="stable")[:max_colors]
+    weights = weights[order]
+    if weights.sum() <= 0:
+        raise ValueError("Palet agirliklarinin toplami 0")
+
+    packed = np.zeros((max_colors, 4), dtype=np.float32)
+    packed[:len(order), :3] = rgb_to_cielab(centers[order])
+    packed[:len(order), 3] = weights / weights.sum()
+    return packed
+
+
+def palette_signatures(palettes: np.ndarray) -> np.ndarray:
+    """Palet kayıtlarından (N, max_colors, 4) imzaları (N, D) üretir.
+
+    Her renk ağırlığı kadar kütleyi ızgara merkezlerine Gauss
+    çekirdeğiyle dağıtır; sonuç histogramın karekökü olduğundan
+    birim uzunluktadır ve iç çarpım Bhattacharyya katsayısıdır.
+    Ara diziler _SIGNATURE_CHUNK_ROWS'luk parçalar halinde hesaplanır.
+    """
+    palettes = np.asarray(palettes, dtype=np.float32)
+    signatures = np.empty((len(palettes), SIGNATURE_DIM), dtype=np.float32)
+
+    for start in range(0, len(palettes), _SIGNATURE_CHUNK_ROWS):
+        chunk = palettes[start:start + _SIGNATURE_CHUNK_ROWS]
+        offsets = (
+            chunk[:, :, np.newaxis, :3] - _GRID_CENTERS
+        ) / _GRID_WIDTHS
+        kernel = np.exp(-0.5 * (offsets ** 2).sum(axis=-1))
+        kernel /= kernel.sum(axis=-1, keepdims=True)
+
+        histogram = np.einsum("nk,nkd->nd", chunk[:, :, 3], kernel)
+        signatures[start:start + len(chunk)] = np.sqrt(
+            np.maximum(histogram, 0.0)
+        )
+
+    return signatures
+
+
+def palette_distances(query: np.ndarray, palettes: np.ndarray) -> np.ndarray:
+    """Sorgu paletinin adaylara gerçek mesafesi (Delta-E).
+
+    Her yöndeki renklerin en yakın karşı renge uzaklığının ağırlıklı
+    ortalaması alınır, iki yön ortalanır (simetrik). Boş yuvalar
+    mesafeye katılmaz.
+
+    Args:
+        query: (max_colors, 4) sorgu kaydı.
+        palettes: (C, max_colors, 4) aday kayıtları.
+
+    Returns:
+        (C,) mesafeler.
+    """
+    q_used = query[:, 3] > 0
+    q_lab, q_weights = query[q_used, :3], query[q_used, 3]
+    lab, weights = palettes[:, :, :3], palettes[:, :, 3]
+
+    # (C, Q, K) renk çiftleri arası Delta-E; boş aday yuvaları sonsuz
+    delta_e = np.linalg.norm(
+        q_lab[np.newaxis, :, np.newaxis, :] - lab[:, np.newaxis, :, :],
+        axis=-1,
+    )
+    delta_e = np.where(weights[:, np.newaxis, :] > 0, delta_e, np.inf)
+
+    forward = (delta_e.min(axis=2) * q_weights).sum(axis=1)
+    nearest_back = delta_e.min(axis=1)
+    backward = np.where(weights > 0, nearest_back, 0.0)
+    backward = (backward * weights).sum(axis=1)
+    return 0.5 * (forward + backward)
+
+
+def dominant_palette(
+    dominant_colors: Sequence[dict],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """get_dominant_colors() / palette.json renklerini (merkez, yüzde) yapar."""
+    colors = [c for c in dominant_colors if c.get("percentage", 0) > 0]
+    centers = np.array(
+        [c.get("center", c["rgb"]) for c in colors], dtype=np.float64
+    )
+    percentages = np.array([c["percentage"] for c in colors], dtype=np.float64)
+    return centers, percentages
+
+
+class PaletteIndex:
+    """Diskteki palet imzası indeksi: ekleme ve benzer palet arama.
+
+    Kullanım:
+        index = PaletteIndex("outputs/palette_index")
+        index.add("a.jpg", centers, percentages)
+        index.search(centers, percentages, top_k=10)
+    """
+
+    def __init__(
+        self,
+        index_dir: str,
+        max_colors: int = PALETTE_INDEX_MAX_COLORS,
+        workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            index_dir: İndeks klasörü (yoksa oluşturulur).
+            max_colors: Yeni indeksin palet yuvası sayısı; var olan
+                indeks kendi değeriyle açılır.
+            workers: Aramadaki thread sayısı (None: tüm çekirdekler).
+
+        Raises:
+            ValueError: Klasördeki indeks başka bir format sürümündeyse.
+        """
+        self.index_dir = index_dir
+        self.workers = workers or os.cpu_count() or 1
+        os.makedirs(index_dir, exist_ok=True)
+
+        meta_path = os.path.join(index_dir, "meta.json")
+        meta = {
+            "version": _INDEX_VERSION,
+            "signature_dim": SIGNATURE_DIM,
+            "max_colors": max_colors,
+        }
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if (stored.get("version") != _INDEX_VERSION
+                    or stored.get("signature_dim") != SIGNATURE_DIM):
+                raise ValueError(
+                    f"Palet indeksi farkli bir surumde: {index_dir} "
+                    f"(yeniden olusturun)"
+                )
+            meta = stored
+        else:
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f, indent=2)
+
+        self.max_colors = int(meta["max_colors"])
+        self._signature_path = os.path.join(index_dir, "signatures.f32")
+        self._palette_path = os.path.join(index_dir, "palettes.f32")
+        self._ids_path = os.path.join(index_dir, "ids.txt")
+
+        self._ids: List[str] = []
+        if os.path.exists(self._ids_path):
+            with open(self._ids_path, "r", encoding="utf-8") as f:
+                self._ids = f.read().splitlines()
+
+        # Kimlik -> en son satır (tekrar eklenen görüntünün eski kaydı
+        # aramada atlanır)
+        self._latest = {image_id: row for row, image_id in enumerate(self._ids)}
+        self._truncate_partial()
+        self._signatures = None
+        self._palettes = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _row_bytes(self) -> Tuple[int, int]:
+        return SIGNATURE_DIM * 4, self.max_colors * 4 * 4
+
+    def _truncate_partial(self) -> None:
+        """Yarım kalmış eklemeden kalan fazla byte'ları keser."""
+        for path, row_bytes in zip(
+            (self._signature_path, self._palette_path), self._row_bytes()
+        ):
+            expected = len(self._ids) * row_bytes
+            if not os.path.exists(path):
+                open(path, "wb").close()
+            elif os.path.getsize(path) > expected:
+                os.truncate(path, expected)
+            elif os.path.getsize(path) < expected:
+                raise ValueError(f"Palet indeksi bozuk: {path}")
+
+    def _open(self) -> Tuple[np.ndarray, np.ndarray]:
+        """İmza ve palet dosyalarını salt okunur memmap olarak açar."""
+        if self._signatures is None:
+            count = len(self._ids)
+            self._signatures = np.memmap(
+                self._signature_path, dtype=np.float32, mode="r",
+                shape=(count, SIGNATURE_DIM),
+            )
+            self._palettes = np.memmap(
+                self._palette_path, dtype=np.float32, mode="r",
+                shape=(count, self.max_colors, 4),
+            )
+        return self._signatures, self._palettes
+
+    def add_many(
+        self, items: Iterable[Tuple[str, np.ndarray, np.ndarray]]
+    ) -> int:
+        """Birden çok paleti indekse ekler.
+
+        Paletler _SIGNATURE_CHUNK_ROWS'luk parçalar halinde paketlenip
+        imzalanır ve her parça doğrudan dosya sonuna yazılır; bellek
+        kullanımı eklenen kayıt sayısından bağımsızdır. Kimlikler tüm
+        parçalar yazıldıktan sonra eklenir; hata olursa yazılan
+        parçalar geri alınır.
+
+        Args:
+            items: (görüntü kimliği, RGB merkezler, yüzdeler) üçlüleri.
+
+        Returns:
+            Eklenen kayıt sayısı.
+
+        Raises:
+            ValueError: Kimlik satır sonu içeriyorsa veya palet geçersizse.
+        """
+        ids: List[str] = []
+        chunk = np.empty(
+            (_SIGNATURE_CHUNK_ROWS, self.max_colors, 4), dtype=np.float32
+        )
+        filled = 0
+
+        def flush(signature_file, palette_file) -> None:
+            palette_file.write(chunk[:filled].tobytes())
+            signature_file.write(palette_signatures(chunk[:filled]).tobytes())
+
+        # Önce diziler, en son kimlikler: ids.txt kayıt sayısını belirler
+        try:
+            with open(self._signature_path, "ab") as signature_file, \
+                    open(self._palette_path, "ab") as palette_file:
+                for image_id, centers, percentages in items:
+                    if "\n" in image_id or "\r" in image_id:
+                        raise ValueError(
+                            f"Gecersiz goruntu kimligi: {image_id!r}"
+                        )
+                    chunk[filled] = pack_palette(
+                        centers, percentages, self.max_colors
+                    )
+                    ids.append(image_id)
+                    filled += 1
+                    if filled == _SIGNATURE_CHUNK_ROWS:
+                        flush(signature_file, palette_file)
+                        filled = 0
+                if filled:
+                    flush(signature_file, palette_file)
+        except BaseException:
+            self._truncate_partial()
+            raise
+
+        if not ids:
+            return 0
+
+        with open(self._ids_path, "a", encoding="utf-8") as f:
+            f.write("".join(f"{image_id}\n" for image_id in ids))
+
+        for image_id in ids:
+            self._latest[image_id] = len(self._ids)
+            self._ids.append(image_id)
+
+        self._signatures = self._palettes = None
+        return len(ids)
+
+    def add(
+        self, image_id: str, centers: np.ndarray, percentages: np.ndarray
+    ) -> None:
+        """Tek bir görüntünün paletini indekse ekler (bkz. add_many)."""
+        self.add_many([(image_id, centers, percentages)])
+
+    def _similarities(self, signature: np.ndarray) -> np.ndarray:
+        """Sorgu imzasının tüm kayıtlarla iç çarpımı (thread'lerde)."""
+        signatures, _ = self._open()
+        scores = np.empty(len(signatures), dtype=np.float32)
+
+        def score(start: int) -> None:
+            stop = start + _SEARCH_CHUNK_ROWS
+            np.dot(signatures[start:stop], signature, out=scores[start:stop])
+
+        starts = range(0, len(signatures), _SEARCH_CHUNK_ROWS)
+        if self.workers > 1 and len(starts) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                list(executor.map(score, starts))
+        else:
+            for start in starts:
+                score(start)
+        return scores
+
+    def search(
+        self,
+        centers: np.ndarray,
+        percentages: np.ndarray,
+        top_k: int = PALETTE_INDEX_TOP_K,
+        candidates: int = PALETTE_INDEX_CANDIDATES,
+    ) -> List[dict]:
+        """Paleti verilen görüntüye en benzer kayıtları bulur.
+
+        İmza benzerliğine göre en iyi max(candidates, top_k) kayıt
+        seçilir, bunlar gerçek palet mesafesiyle yeniden sıralanır.
+
+        Args:
+            centers: (M, 3) sorgu RGB merkezleri.
+            percentages: (M,) yüzdeler.
+            top_k: Döndürülecek sonuç sayısı.
+            candidates: Yeniden sıralanacak aday sayısı.
+
+        Returns:
+            Mesafeye göre artan sırada:
+            [{"image": ..., "distance": Delta-E, "similarity": 0-1}, ...]
+        """
+        if not self._ids or top_k <= 0:
+            return []
+
+        query = pack_palette(centers, percentages, self.max_colors)
+        signature = palette_signatures(query[np.newaxis])[0]
+        scores = self._similarities(signature)
+
+        # Tekrar eklenmiş kimliklerin eski satırları aday olmaz
+        if len(self._latest) < len(self._ids):
+            stale = np.ones(len(self._ids), dtype=bool)
+            stale[list(self._latest.values())] = False
+            scores[stale] = -np.inf
+
+        count = min(max(candidates, top_k), len(scores))
+        rows = np.argpartition(-scores, count - 1)[:count]
+        rows = rows[np.isfinite(scores[rows])]
+        rows.sort()
+
+        _, palettes = self._open()
+        distances = palette_distances(query, np.asarray(palettes[rows]))
+        order = np.lexsort((rows, distances))[:top_k]
+
+        return [
+            {
+                "image": self._ids[rows[i]],
+                "distance": round(float(distances[i]), 3),
+                "similarity": round(float(scores[rows[i]]), 4),
+            }
+            for i in order
+        ]
+
+
+def query_palette(
+    path: str, k: int, random_state: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorgu paletini okur: palette.json ise dosyadan, değilse görüntüden.
+
+    Görüntüden çıkarırken downsample K-Means kullanılır (hızlı).
+
+    Args:
+        path: palette.json veya görüntü dosyası.
+        k: Görüntüden çıkarılacak renk sayısı.
+        random_state: Tekrarlanabilirlik için seed değeri.
+
+    Returns:
+        (merkezler (M, 3), yüzdeler (M,)).
+    """
+    if path.lower().endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            return dominant_palette(json.load(f)["colors"])
+
+    from src.clustering import get_dominant_colors
+    from src.image_io import load_image
+    from src.pipeline import cluster_image
+
+    image = load_image(path)
+    labels, centers = cluster_image(
+        image, None, k, random_state, "downsample", False
+    )
+    return dominant_palette(get_dominant_colors(centers, labels))
@@ -0,0 +1,663 @@
+# ==================================================
+# PIPELINE - Tek Görüntü Akışı
+# ==================================================
+# Bir görüntü için tüm adımları sırasıyla çalıştırır.
+# main.py tek görüntü modunda, src/batch.py ise her
+# işçi süreçte bu fonksiyonu çağırır.
+#
+# Ağır kütüphaneler (cv2, sklearn, matplotlib) yalnızca onlara
+# ihtiyaç duyan adım çalışırken import edilir. Örneğin sadece
+# palet çıkaran bir çalıştırma matplotlib'i hiç yüklemez.
+
+import os
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from config import (
+    KMEANS_UNIQUE_COLORS,
+    KMEANS_MODE,
+    STREAMING_TILE_ROWS,
+    STREAMING_EPOCHS,
+    DOWNSAMPLE_METHOD,
+    KMEANS_BACKEND,
+    KMEANS_INIT,
+    KMEANS_N_INIT,
+    KMEANS_TOL,
+    KMEANS_MAX_ITER,
+    KMEANS_SEED_SAMPLE_SIZE,
+    KMEANS_PROBE_ITER,
+    KMEANS_ABANDON_RATIO,
+    FIXED_PALETTE,
+    PALETTE_LUT_LEVELS,
+    DOWNSAMPLE_SIZE,
+    REPORT_PALETTE_DRIFT,
+    HISTOGRAM_EXPORT_FORMAT,
+    STAGE_CACHE_ENABLED,
+    STAGE_CACHE_DIR,
+    STAGE_CACHE_MAX_BYTES,
+    RUN_REPORT_FILE,
+    PROFILE_STAGES,
+    TRACE_MEMORY,
+    PIPELINE_STAGES,
+    REGION_CONNECTIVITY,
+    REGION_MIN_AREA,
+    REGIONS_FILE,
+    AUTO_K,
+    AUTO_K_RANGE,
+    AUTO_K_METRIC,
+    AUTO_K_SAMPLE_SIZE,
+    AUTO_K_SCORE_SAMPLE_SIZE,
+    AUTO_K_TIME_BUDGET,
+    AUTO_K_WORKERS,
+    RENDER_BACKEND,
+    LOAD_SCALE,
+    LOAD_TARGET_SIZE,
+    SEGMENTED_FORMAT,
+    LABEL_MAP_FORMAT,
+    PALETTE_SIDECAR_FILE,
+)
+
+from src.instrumentation import new_report, measure_stage, write_report
+from src.stage_cache import (
+    image_hash,
+    stage_key,
+    load_arrays,
+    save_arrays,
+    load_json,
+    save_json,
+)
+
+
+# Istege bagli adimlar; yukleme ve K-Means her zaman calisir.
+# "plots" adimi segmentasyon ve isimlendirme sonuclarina, "regions"
+# adimi segmentasyonun etiket haritasina ihtiyac duyar.
+STAGES = ("histogram", "segmentation", "regions", "naming", "plots")
+
+# --only ile kullanilabilecek hazir adim gruplari
+STAGE_PRESETS = {
+    "all": STAGES,
+    "palette": ("naming",),
+    "segment": ("segmentation",),
+}
+
+
+def resolve_stages(names) -> frozenset:
+    """Adım / hazır grup isimlerini bağımlılıklarıyla birlikte çözer.
+
+    Args:
+        names: STAGES veya STAGE_PRESETS içinden isimler.
+
+    Returns:
+        Çalıştırılacak adımların kümesi.
+
+    Raises:
+        ValueError: Bilinmeyen bir isim verilirse.
+    """
+    stages = set()
+    for name in names:
+        if name in STAGE_PRESETS:
+            stages.update(STAGE_PRESETS[name])
+        elif name in STAGES:
+            stages.add(name)
+        else:
+            raise ValueError(f"Bilinmeyen adim: {name}")
+
+    if "plots" in stages:
+        stages.update(("segmentation", "naming"))
+    if "regions" in stages:
+        stages.add("segmentation")
+
+    return frozenset(stages)
+
+
+def cluster_image(
+    image, pixels, k, random_state, kmeans_mode, unique_colors, stats=None,
+    backend=KMEANS_BACKEND, centers=None,
+):
+    """Seçilen kümeleme moduna göre (labels, centers) üretir.
+
+    pixels yalnızca "full" modunda kullanılır; None ise görüntüden
+    kopyasız olarak çıkarılır. "palette" ve "centers" modlarında k
+    kullanılmaz. "centers" modunda K-Means çalışmaz: her piksel verilen
+    centers'ın RGB'de en yakınına atanır (downsample modunun ataması).
+    """
+    from src.clustering import (
+        apply_kmeans,
+        apply_streaming_kmeans,
+        apply_downsampled_kmeans,
+        apply_fixed_palette,
+    )
+
+    if kmeans_mode == "palette":
+        return apply_fixed_palette(
+            image, _fixed_palette(), PALETTE_LUT_LEVELS, stats=stats
+        )
+    if kmeans_mode == "centers":
+        from src.clustering import assign_labels
+
+        if centers is None:
+            raise ValueError("'centers' modu icin merkezler verilmeli")
+        centers = np.asarray(centers, dtype=np.float64)
+        return assign_labels(image.reshape(-1, 3), centers), centers
+    if kmeans_mode == "streaming":
+        return apply_streaming_kmeans(
+            image, k, random_state, STREAMING_TILE_ROWS, STREAMING_EPOCHS,
+            stats=stats,
+        )
+    if kmeans_mode == "downsample":
+        return apply_downsampled_kmeans(
+            image, k, random_state, DOWNSAMPLE_SIZE, DOWNSAMPLE_METHOD,
+            unique_colors=unique_colors, stats=stats, backend=backend,
+        )
+    if kmeans_mode == "full":
+        if pixels is None:
+            from src.pixel_analysis import extract_pixels
+
+            pixels = extract_pixels(image, np.uint8)
+        return apply_kmeans(
+            pixels, k, random_state, unique_colors=unique_colors, stats=stats,
+            backend=backend,
+        )
+    raise ValueError(f"Bilinmeyen kumeleme modu: {kmeans_mode}")
+
+
+def _fixed_palette():
+    """Sabit palet modunun renklerini döndürür (FIXED_PALETTE, (P, 3) RGB)."""
+    if FIXED_PALETTE is None:
+        from src.color_categorization import COLOR_DICTIONARY
+
+        return np.array(list(COLOR_DICTIONARY.values()), dtype=np.uint8)
+
+    from src.image_io import load_palette
+
+    return load_palette(FIXED_PALETTE)
+
+
+def _clustering_key(
+    image, k, random_state, kmeans_mode, unique_colors, backend,
+    centers=None,
+):
+    """K-Means aşamasının önbellek anahtarı (görüntü + parametreler)."""
+    if kmeans_mode == "palette":
+        from src.color_lut import palette_hash
+
+        return stage_key(
+            "kmeans", image=image_hash(image), mode=kmeans_mode,
+            palette=palette_hash(_fixed_palette()),
+        )
+    if kmeans_mode == "centers":
+        return stage_key(
+            "kmeans", image=image_hash(image), mode=kmeans_mode,
+            centers=np.asarray(centers, dtype=np.float64).round(6).tolist(),
+        )
+
+    params = {"k": k, "random_state": random_state, "mode": kmeans_mode}
+    if kmeans_mode in ("full", "downsample"):
+        params["kmeans"] = {
+            "backend": backend, "init": KMEANS_INIT,
+            "n_init": KMEANS_N_INIT, "tol": KMEANS_TOL,
+            "max_iter": KMEANS_MAX_ITER,
+            "seed_sample_size": KMEANS_SEED_SAMPLE_SIZE,
+            "probe_iter": KMEANS_PROBE_ITER,
+            "abandon_ratio": KMEANS_ABANDON_RATIO,
+        }
+
+    if kmeans_mode == "streaming":
+        params["tile_rows"] = STREAMING_TILE_ROWS
+        params["epochs"] = STREAMING_EPOCHS
+    else:
+        params["unique_colors"] = unique_colors
+    if kmeans_mode == "downsample":
+        params["sample_size"] = DOWNSAMPLE_SIZE
+        params["sample_method"] = DOWNSAMPLE_METHOD
+
+    return stage_key("kmeans", image=image_hash(image), **params)
+
+
+def _select_k(image, fallback_k, random_state, use_cache):
+    """AUTO_K_* ayarlarıyla K seçer; use_cache ise sonucu önbellekten okur."""
+    params = {
+        "k_range": list(AUTO_K_RANGE),
+        "metric": AUTO_K_METRIC,
+        "sample_size": AUTO_K_SAMPLE_SIZE,
+        "score_sample_size": AUTO_K_SCORE_SAMPLE_SIZE,
+        "sample_method": DOWNSAMPLE_METHOD,
+        "random_state": random_state,
+    }
+
+    if use_cache:
+        auto_k_key = stage_key("auto_k", image=image_hash(image), **params)
+        selection = load_json(STAGE_CACHE_DIR, auto_k_key)
+        if selection is not None:
+            print(f"[OK] K secimi onbellekten yuklendi: K = {selection['k']}")
+            return selection
+
+    from src.auto_k import select_k
+
+    low, high = AUTO_K_RANGE
+    selection = select_k(
+        image, range(low, high + 1), random_state,
+        AUTO_K_SAMPLE_SIZE, AUTO_K_SCORE_SAMPLE_SIZE, AUTO_K_METRIC,
+        AUTO_K_TIME_BUDGET, AUTO_K_WORKERS, DOWNSAMPLE_METHOD, fallback_k,
+    )
+
+    # Sure butcesi dolan secim tekrar edilebilir degildir; saklanmaz
+    if use_cache and not selection["timed_out"]:
+        save_json(STAGE_CACHE_DIR, auto_k_key, selection, STAGE_CACHE_MAX_BYTES)
+
+    return selection
+
+
+def _renderers(renderer):
+    """Seçilen backend'in (palet, karşılaştırma, özet) fonksiyonlarını döndürür."""
+    if renderer == "matplotlib":
+        from src.visualization import (
+            plot_color_palette,
+            plot_comparison,
+            plot_summary,
+        )
+
+        return plot_color_palette, plot_comparison, plot_summary
+    if renderer == "cv2":
+        from src.render import (
+            render_color_palette,
+            render_comparison,
+            render_summary,
+        )
+
+        return render_color_palette, render_comparison, render_summary
+    raise ValueError(f"Bilinmeyen cizim backend'i: {renderer}")
+
+
+def _named_centers(centers, kmeans_key):
+    """Merkezleri isimlendirir; kmeans_key verilirse önbelleği kullanır."""
+    from src.color_categorization import categorize_centers
+
+    if kmeans_key is None:
+        return categorize_centers(centers)
+
+    from src.color_lut import dictionary_hash
+
+    names_key = stage_key(
+        "names", kmeans=kmeans_key, dictionary=dictionary_hash()
+    )
+    color_names = load_json(STAGE_CACHE_DIR, names_key)
+    if color_names is None:
+        color_names = categorize_centers(centers)
+        save_json(STAGE_CACHE_DIR, names_key, color_names, STAGE_CACHE_MAX_BYTES)
+
+    return color_names
+
+
+def run_pipeline(
+    image_path: str,
+    output_dir: str,
+    k: int,
+    random_state: int,
+    unique_colors: bool = KMEANS_UNIQUE_COLORS,
+    kmeans_mode: str = KMEANS_MODE,
+    report_drift: bool = REPORT_PALETTE_DRIFT,
+    use_cache: bool = STAGE_CACHE_ENABLED,
+    write_run_report: bool = bool(RUN_REPORT_FILE),
+    profile: bool = PROFILE_STAGES,
+    trace_memory: bool = TRACE_MEMORY,
+    stages=PIPELINE_STAGES,
+    auto_k: bool = AUTO_K,
+    renderer: str = RENDER_BACKEND,
+    kmeans_backend: str = KMEANS_BACKEND,
+    fixed_centers=None,
+    image=None,
+    writer=None,
+    load_scale: int = LOAD_SCALE,
+    load_target_size=LOAD_TARGET_SIZE,
+) -> dict:
+    """Tek bir görüntü için pipeline'ın tüm adımlarını çalıştırır.
+
+    Yükleme, piksel analizi, histogram, K-Means, segmentasyon,
+    renk isimlendirme ve görselleştirme adımlarını sırasıyla
+    uygular. Tüm çıktılar output_dir klasörüne yazılır.
+
+    Her adım measure_stage() ile ölçülür; süre, CPU ve bellek
+    bilgileri output_dir altındaki çalıştırma raporuna yazılır.
+
+    Args:
+        image_path: Girdi görüntüsünün yolu.
+        output_dir: Çıktıların yazılacağı klasör.
+        k: Küme sayısı (dominant renk sayısı).
+        random_state: Tekrarlanabilirlik için seed değeri.
+        unique_colors: K-Means benzersiz renkler üzerinde mi çalışsın.
+        kmeans_mode: "full" (tüm pikseller), "streaming" (tile tile
+            MiniBatch K-Means), "downsample" (örnekte fit, tam
+            çözünürlükte etiketleme), "palette" (K-Means yok,
+            FIXED_PALETTE'e arama tablosuyla eşleme; k yok sayılır) veya
+            "centers" (K-Means yok, fixed_centers'a RGB'de en yakın atama).
+        report_drift: Streaming / downsample modunda tam fit ile palet
+            farkını hesapla; sonuç özete ve çalıştırma raporundaki
+            "palette_drift" aşama kaydına yazılır.
+        use_cache: K-Means, dominant renk ve isimlendirme sonuçlarını
+            aşama önbelleğinden oku / önbelleğe yaz.
+        write_run_report: Aşama ölçümlerini JSON rapor olarak yaz.
+        profile: Her adım için output_dir/profiles altına cProfile
+            çıktısı yaz.
+        trace_memory: tracemalloc ile adım içi tepe belleği ölç.
+        stages: Çalıştırılacak isteğe bağlı adımlar (STAGES veya
+            STAGE_PRESETS isimleri). Yükleme ve K-Means her zaman çalışır.
+        auto_k: k yerine AUTO_K_RANGE aralığından otomatik K seç
+            (select_k); k yalnızca seçim başarısız olursa kullanılır.
+        renderer: Palet / karşılaştırma / özet çıktıları için
+            "matplotlib" veya "cv2" (bkz. _renderers).
+        kmeans_backend: K-Means motoru ("sklearn", "cv2", "numba").
+        fixed_centers: "centers" modunun (K, 3) RGB merkezleri (örn.
+            run_collection() ortak paleti); pikseller RGB'de en yakın
+            merkeze atanır.
+        image: Önceden çözülmüş RGB görüntü (örn. prefetch_images());
+            verilirse image_path okunmaz.
+        writer: BackgroundWriter verilirse tüm dosya yazma ve çizim
+            işleri arka plana verilir; fonksiyon yazmaların bitmesini
+            beklemeden döner (hatalar writer.close() ile alınır). Aşama
+            kayıtlarına yazıcı thread'lerinde ölçülen kodlama / yazma
+            süreleri (writer_*_seconds) eklenir; çalıştırma raporu bu
+            görüntünün tüm yazma işleri bittikten sonra yazılır.
+        load_scale: Okuma küçültme oranı (1, 2, 4, 8); bkz. load_image().
+        load_target_size: Verilirse uzun kenarı bu değerin altına
+            düşürmeyen en büyük küçültme oranıyla okunur.
+
+    Returns:
+        Çalıştırma özeti:
+        {"image": ..., "output_dir": ..., "width": W, "height": H,
+         "k": K, "auto_k": {...}, "dominant_colors": [...],
+         "palette_drift": {...}, "regions": R,
+         "stages": [...], "elapsed_seconds": 1.23}
+    """
+    start = time.perf_counter()
+    stages = resolve_stages(stages)
+
+    report = new_report(
+        image=image_path, k=k, random_state=random_state,
+        kmeans_mode=kmeans_mode, unique_colors=unique_colors,
+        kmeans_backend=kmeans_backend, stages=sorted(stages), auto_k=auto_k,
+        load_scale=load_scale, load_target_size=load_target_size,
+    )
+    profile_dir = os.path.join(output_dir, "profiles") if profile else None
+
+    # Acik asamanin kaydi; arka plan islerinin sureleri buna eklenir
+    current_record = None
+
+    @contextmanager
+    def stage(name, **info):
+        nonlocal current_record
+        with measure_stage(
+            report, name, profile_dir, trace_memory, **info
+        ) as record:
+            current_record = record
+            yield record
+
+    def emit(fn, *args, plot=False, **kwargs):
+        # Yazma/cizim isi: writer varsa arka plana, yoksa hemen calisir.
+        # Arka planda asama suresi yalnizca kuyruga verme suresidir;
+        # kodlama/yazma suresi yazici thread'inde olculup kayda eklenir.
+        if writer is None:
+            return fn(*args, **kwargs)
+        return writer.submit(
+            fn, *args, key=image_path, plot=plot, record=current_record,
+            **kwargs,
+        )
+
+    # 1. Goruntu yukleme
+    print("\n[ADIM 1] Goruntu yukleniyor...")
+    with stage("load_image", prefetched=image is not None) as record:
+        if image is None:
+            from src.image_io import load_image
+
+            image = load_image(
+                image_path, scale=load_scale, target_size=load_target_size
+            )
+        total_pixels = image.shape[0] * image.shape[1]
+        record["pixels"] = total_pixels
+
+    # Otomatik K secimi (ornek uzerinde, paralel)
+    selection = None
+    if auto_k and kmeans_mode not in ("palette", "centers"):
+        print("\n[..] Otomatik K secimi yapiliyor...")
+        with stage("auto_k", pixels=total_pixels) as record:
+            selection = _select_k(image, k, random_state, use_cache)
+            k = selection["k"]
+            record["k"] = k
+            record["evaluated"] = selection["evaluated"]
+            record["timed_out"] = selection["timed_out"]
+        report["meta"]["k"] = k
+
+    cached = None
+    if use_cache:
+        with stage("cache_lookup"):
+            kmeans_key = _clustering_key(
+                image, k, random_state, kmeans_mode, unique_colors,
+                kmeans_backend, fixed_centers,
+            )
+            cached = load_arrays(STAGE_CACHE_DIR, kmeans_key)
+
+    # 2. Piksel analizi
+    print("\n[ADIM 2] Piksel analizi yapiliyor...")
+    with stage("pixel_analysis", pixels=total_pixels):
+        from src.pixel_analysis import get_image_info, extract_pixels
+
+        get_image_info(image)
+        # Streaming/downsample modlari ve onbellek isabeti tam piksel
+        # matrisine ihtiyac duymaz (drift raporu tam fit icin ister)
+        needs_pixels = (
+            (kmeans_mode == "full" and cached is None) or report_drift
+        )
+        pixels = extract_pixels(image, np.uint8) if needs_pixels else None
+
+    # 3. Histogram
+    if "histogram" in stages:
+        print("\n[ADIM 3] Histogramlar olusturuluyor...")
+        with stage("histogram", pixels=total_pixels):
+            from src.histogram import compute_histograms, save_histograms
+
+            histograms = compute_histograms(image)
+            if HISTOGRAM_EXPORT_FORMAT:
+                emit(
+                    save_histograms,
+                    histograms, output_dir, HISTOGRAM_EXPORT_FORMAT,
+                )
+
+        if "plots" in stages:
+            from src.histogram import (
+                plot_rgb_histogram,
+                plot_combined_histogram,
+            )
+
+            with stage("plot_rgb_histogram"):
+                emit(plot_rgb_histogram, image, output_dir, histograms,
+                     plot=True)
+            with stage("plot_combined_histogram"):
+                emit(plot_combined_histogram, image, output_dir, histograms,
+                     plot=True)
+
+    # 4. K-Means kumeleme
+    print("\n[ADIM 4] K-Means kumeleme basliyor...")
+    with stage("kmeans", pixels=total_pixels, k=k, mode=kmeans_mode,
+               backend=kmeans_backend) as record:
+        from src.clustering import (
+            apply_kmeans,
+            palette_drift,
+            get_dominant_colors,
+            label_dtype,
+        )
+
+        record["cache_hit"] = cached is not None
+        if cached is not None:
+            labels, centers = cached["labels"], cached["centers"]
+            print(f"[OK] K-Means sonucu onbellekten yuklendi: {kmeans_key}")
+        else:
+            labels, centers = cluster_image(
+                image, pixels, k, random_state, kmeans_mode, unique_colors,
+                stats=record, backend=kmeans_backend, centers=fixed_centers,
+            )
+            if use_cache:
+                save_arrays(
+                    STAGE_CACHE_DIR, kmeans_key,
+                    {"labels": labels.astype(label_dtype(k)),
+                     "centers": centers},
+                    STAGE_CACHE_MAX_BYTES,
+                )
+
+    with stage("dominant_colors", pixels=total_pixels, k=k):
+        dominant_colors = None
+        if use_cache:
+            dominant_key = stage_key("dominant", kmeans=kmeans_key)
+            dominant_colors = load_json(STAGE_CACHE_DIR, dominant_key)
+        if dominant_colors is None:
+            dominant_colors = get_dominant_colors(centers, labels)
+            if use_cache:
+                save_json(
+                    STAGE_CACHE_DIR, dominant_key, dominant_colors,
+                    STAGE_CACHE_MAX_BYTES,
+                )
+
+    # Sabit palette K = palet boyu (kullanilmayan renkler dahil)
+    if kmeans_mode in ("palette", "centers"):
+        k = len(centers)
+        report["meta"]["k"] = k
+
+    drift = None
+    if report_drift and kmeans_mode in ("streaming", "downsample"):
+        print("\n[..] Palet farki icin tam fit yapiliyor...")
+        with stage("palette_drift", pixels=total_pixels, k=k) as record:
+            _, full_centers = apply_kmeans(
+                pixels, k, random_state, unique_colors=unique_colors,
+                backend=kmeans_backend,
+            )
+            drift = palette_drift(full_centers, centers)
+            # Ornek boyutu secimi icin kanit: calistirma raporuna yazilir
+            if kmeans_mode == "downsample":
+                record["sample_size"] = DOWNSAMPLE_SIZE
+            record["drift"] = drift
+        print(f"[OK] Palet farki (Delta-E): ortalama {drift['mean_delta_e']}, "
+              f"maksimum {drift['max_delta_e']}")
+
+    # 5. Segmentasyon
+    output_files = {}
+    if "segmentation" in stages:
+        print("\n[ADIM 5] Segmentasyon yapiliyor...")
+        # Paletli PNG 8-bit indeks tutar; K > 256 ise RGB'ye duser
+        indexed = SEGMENTED_FORMAT == "indexed" and len(centers) <= 256
+
+        with stage("segmentation", pixels=total_pixels, k=k):
+            from src.segmentation import segment_image, create_label_map
+
+            label_map = create_label_map(labels, image.shape)
+            # RGB segmented goruntu sadece RGB cikti ve grafikler icin gerekli
+            segmented = None
+            if not indexed or "plots" in stages:
+                segmented = segment_image(labels, centers, image.shape)
+
+        with stage("save_segmented", indexed=indexed):
+            from src.image_io import (
+                save_image,
+                save_indexed_png,
+                save_label_map,
+            )
+
+            if indexed:
+                emit(save_indexed_png,
+                     label_map, centers, "segmented.png", output_dir)
+            else:
+                emit(save_image, segmented, "segmented.png", output_dir)
+            output_files["segmented"] = "segmented.png"
+
+            if LABEL_MAP_FORMAT:
+                emit(save_label_map, label_map, output_dir, LABEL_MAP_FORMAT)
+                output_files["labels"] = f"labels.{LABEL_MAP_FORMAT}"
+
+    # Baglantili bolgeler (sayilarla boyama numaralari)
+    region_count = None
+    if "regions" in stages:
+        print("\n[..] Bolgeler cikariliyor...")
+        with stage("regions", pixels=total_pixels,
+                   min_area=REGION_MIN_AREA) as record:
+            from src.regions import extract_regions, save_regions
+
+            region_map, regions = extract_regions(
+                label_map, REGION_MIN_AREA, REGION_CONNECTIVITY
+            )
+            region_count = len(regions["area"])
+            record["regions"] = region_count
+
+        if REGIONS_FILE:
+            with stage("save_regions", regions=region_count):
+                emit(save_regions, region_map, regions, output_dir,
+                     REGIONS_FILE)
+                output_files["regions"] = REGIONS_FILE
+
+    # 6. Renk kategorizasyonu
+    color_names = []
+    if "naming" in stages:
+        print("\n[ADIM 6] Renkler isimlendiriliyor...")
+        with stage("naming", k=k):
+            color_names = _named_centers(
+                centers, kmeans_key if use_cache else None
+            )
+
+    if PALETTE_SIDECAR_FILE:
+        with stage("save_palette", k=k):
+            from src.image_io import save_palette_json
+
+            emit(
+                save_palette_json,
+                centers, dominant_colors, color_names, output_dir,
+                PALETTE_SIDECAR_FILE, output_files,
+            )
+
+    # 7. Gorsellestirme
+    if "plots" in stages:
+        print("\n[ADIM 7] Gorsellestirmeler olusturuluyor...")
+        plot_color_palette, plot_comparison, plot_summary = _renderers(
+            renderer
+        )
+        # cv2 ciziciler thread-safe; pyplot isleri tek thread'de calismali
+        uses_pyplot = renderer == "matplotlib"
+
+        with stage("plot_color_palette", renderer=renderer):
+            emit(plot_color_palette, dominant_colors, color_names, output_dir,
+                 plot=uses_pyplot)
+        with stage("plot_comparison", renderer=renderer):
+            emit(plot_comparison, image, segmented, output_dir,
+                 k=len(dominant_colors), plot=uses_pyplot)
+        with stage("plot_summary", renderer=renderer):
+            emit(plot_summary,
+                 image, segmented, dominant_colors, color_names, output_dir,
+                 plot=uses_pyplot)
+
+    if write_run_report:
+        if writer is None:
+            write_report(report, output_dir, RUN_REPORT_FILE)
+        else:
+            # Rapor, yazici sureleri kayitlara eklendikten sonra yazilir
+            writer.when_done(
+                image_path, write_report, report, output_dir, RUN_REPORT_FILE
+            )
+
+    name_map = {c["color_id"]: c["name"] for c in color_names}
+
+    return {
+        "image": image_path,
+        "output_dir": os.path.abspath(output_dir),
+        "width": int(image.shape[1]),
+        "height": int(image.shape[0]),
+        "k": k,
+        "auto_k": selection,
+        "dominant_colors": [
+            {**color, "name": name_map.get(color["color_id"], "?")}
+            for color in dominant_colors
+        ],
+        "palette_drift": drift,
+        "regions": region_count,
+        "stages": {
+            s["stage"]: s["wall_seconds"] for s in report["stages"]
+        },
+        "elapsed_seconds": round(time.perf_counter() - start, 3),
+    }
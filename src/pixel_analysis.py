@@ -2,6 +2,8 @@
 # PIXEL ANALYSIS - Piksel Matris Analizi
 # ==================================================
 
+from typing import Iterator
+
 import numpy as np
 
 
@@ -45,7 +47,9 @@ def get_image_info(image: np.ndarray) -> dict:
     return info
 
 
-def extract_pixels(image: np.ndarray) -> np.ndarray:
+def extract_pixels(
+    image: np.ndarray, dtype: np.dtype = np.float32
+) -> np.ndarray:
     """Görüntüyü 2D piksel matrisine dönüştürür.
 
     (H, W, 3) boyutundaki görüntüyü (H*W, 3) boyutuna
@@ -54,11 +58,17 @@ def extract_pixels(image: np.ndarray) -> np.ndarray:
 
     Her satır bir pikselin [R, G, B] değerlerini temsil eder.
 
+    dtype=np.uint8 verilirse kopya oluşturulmaz, görüntünün
+    düzleştirilmiş görünümü (view) döner (piksel başına 3 byte,
+    float32'de 12 byte). uint8 kabul eden kümeleme yolları
+    gerekirse parça parça float'a kendileri çevirir.
+
     Args:
         image: RGB formatında numpy dizisi (H, W, 3).
+        dtype: Çıktı tipi (varsayılan float32).
 
     Returns:
-        (H*W, 3) boyutunda 2D numpy dizisi (float32).
+        (H*W, 3) boyutunda 2D numpy dizisi.
     """
     height, width, channels = image.shape
 
@@ -66,11 +76,37 @@ def extract_pixels(image: np.ndarray) -> np.ndarray:
     pixels = image.reshape(-1, channels)
 
     # K-Means float bekler, uint8'den çeviriyoruz
-    pixels = pixels.astype(np.float32)
+    # (uint8 istenirse kopya yapılmaz)
+    pixels = pixels.astype(dtype, copy=False)
 
     print(f"[OK] Piksel matrisi oluşturuldu: {pixels.shape}")
     print(f"     Orijinal: ({height}, {width}, {channels})")
     print(f"     Düzleştirilmiş: ({pixels.shape[0]}, {pixels.shape[1]})")
+    print(f"     Veri tipi: {pixels.dtype} ({pixels.nbytes:,} byte)")
     print(f"     İlk 3 piksel (RGB): {pixels[:3].astype(int).tolist()}")
 
     return pixels
+
+
+def iter_pixel_tiles(image: np.ndarray, tile_rows: int) -> Iterator[np.ndarray]:
+    """Görüntüyü satır bantları (tile) halinde piksel matrislerine böler.
+
+    extract_pixels() tüm görüntünün float32 kopyasını tek seferde
+    oluşturur (uint8 görüntünün 4 katı). Bu generator ise her adımda
+    yalnızca tile_rows satırlık bir bandı (tile_rows*W, 3) float32
+    matrisine çevirir; bellek kullanımı görüntüye değil tile
+    boyutuna bağlı kalır. np.memmap ile açılmış görüntülerle de çalışır.
+
+    Args:
+        image: RGB formatında numpy dizisi (H, W, 3).
+        tile_rows: Her tile'daki satır sayısı.
+
+    Yields:
+        (tile_rows*W, 3) boyutunda float32 piksel matrisleri
+        (son tile daha kısa olabilir).
+    """
+    height, width, channels = image.shape
+
+    for top in range(0, height, tile_rows):
+        tile = image[top:top + tile_rows]
+        yield tile.reshape(-1, channels).astype(np.float32)
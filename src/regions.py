@@ -0,0 +1,337 @@
+# ==================================================
+# REGIONS - Bağlantılı Bölge Çıkarma (Sayılarla Boyama)
+# ==================================================
+# Etiket haritasındaki her renk için bağlantılı bileşenler
+# (cv2.connectedComponentsWithStats) bulunur. Her bileşen bir
+# "bölge"dir; sayılarla boyama şablonunda bir numara alır.
+#
+# Çok küçük bölgeler boyanamaz; bu yüzden alanı eşiğin altındaki
+# her bölge, en uzun ortak sınıra sahip (ve kendinden büyük)
+# komşusuna birleştirilir. Birleştirme görüntü üzerinde değil,
+# bölge komşuluk grafiği üzerinde vektörel union-find ile yapılır;
+# bölge başına Python döngüsü yoktur.
+#
+# Her bölge için alan, sınırlayıcı kutu, ağırlık merkezi ve
+# numaranın yazılacağı nokta (sınırdan en uzak iç piksel,
+# tek bir distanceTransform ile) hesaplanır.
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+def _components(
+    label_map: np.ndarray, connectivity: int, workers: Optional[int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Her etiket için bağlantılı bileşenleri tek bir bölge haritasında toplar.
+
+    Etiketler bir thread havuzunda paralel işlenir (cv2 GIL'i
+    bırakır). Her etiket kendi piksellerine yerel bileşen numarasını
+    yazar; etiket ofsetleri en sonda tek bir geçişte eklenir.
+
+    Returns:
+        region_map: (H, W) int32 bölge numaraları (0..R-1).
+        region_labels: Her bölgenin renk etiketi (R,).
+        stats: cv2 istatistikleri (R, 5): x, y, w, h, alan.
+        centroids: Bileşen ağırlık merkezleri (R, 2): x, y.
+    """
+    region_map = np.empty(label_map.shape, dtype=np.int32)
+    labels = np.unique(label_map)
+
+    def label_components(label):
+        mask = label_map == label
+        count, components, stats, centroids = cv2.connectedComponentsWithStats(
+            mask.view(np.uint8), connectivity=connectivity, ltype=cv2.CV_32S
+        )
+        # 0 arka plandır; yerel bileşen i -> i - 1
+        components -= 1
+        np.copyto(region_map, components, where=mask)
+        return count - 1, stats[1:], centroids[1:]
+
+    # Her iş tam boyutlu bir maske ve bileşen haritası tutar
+    workers = min(len(labels), workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(label_components, labels))
+
+    counts = np.array([count for count, _, _ in results], dtype=np.int64)
+    offsets = np.zeros(int(labels.max()) + 1, dtype=np.int32)
+    offsets[labels] = np.cumsum(counts) - counts
+    region_map += offsets[label_map]
+
+    return (
+        region_map,
+        np.repeat(labels, counts),
+        np.concatenate([stats for _, stats, _ in results]),
+        np.concatenate([centroids for _, _, centroids in results]),
+    )
+
+
+def _adjacency(region_map: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Komşu bölge çiftlerini ve ortak sınır uzunluklarını bulur (4-komşuluk).
+
+    Returns:
+        pairs: (E, 2) bölge çiftleri, her çift iki yönde de yer alır.
+        lengths: Her çiftin ortak sınır uzunluğu (piksel kenarı).
+    """
+    firsts = []
+    seconds = []
+
+    for a, b in (
+        (region_map[:, :-1], region_map[:, 1:]),
+        (region_map[:-1, :], region_map[1:, :]),
+    ):
+        differ = a != b
+        firsts.append(a[differ])
+        seconds.append(b[differ])
+
+    first = np.concatenate(firsts).astype(np.int64)
+    second = np.concatenate(seconds).astype(np.int64)
+    return _aggregate_edges(
+        np.concatenate([first, second]),
+        np.concatenate([second, first]),
+        np.ones(2 * len(first), dtype=np.int64),
+    )
+
+
+def _aggregate_edges(
+    first: np.ndarray, second: np.ndarray, lengths: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Aynı çiftin kenarlarını toplar, kendine bağlanan kenarları atar."""
+    keep = first != second
+    first, second, lengths = first[keep], second[keep], lengths[keep]
+    if len(first) == 0:
+        return np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    size = int(max(first.max(), second.max())) + 1
+    keys, inverse = np.unique(first * size + second, return_inverse=True)
+    totals = np.bincount(inverse.reshape(-1), weights=lengths).astype(np.int64)
+    return np.stack([keys // size, keys % size], axis=1), totals
+
+
+def _merge_small(
+    areas: np.ndarray,
+    pairs: np.ndarray,
+    lengths: np.ndarray,
+    min_area: int,
+    max_rounds: int = 64,
+) -> np.ndarray:
+    """Küçük bölgeleri baskın komşularına birleştiren kök dizisini döndürür.
+
+    Her turda alanı min_area'dan küçük bölge, kendinden büyük
+    (alan, numara sırasına göre) komşuları arasında en uzun ortak
+    sınıra sahip olana bağlanır. Hedef her zaman daha büyük
+    olduğundan döngü oluşmaz; zincirler işaretçi atlama ile
+    köklere indirgenir. Alanlar ve kenarlar köklere göre yeniden
+    toplanır, birleşecek bölge kalmayana kadar tekrar edilir.
+
+    Returns:
+        root: Her orijinal bölgenin birleştiği kök bölge (R,).
+    """
+    n = len(areas)
+    root = np.arange(n)
+    areas = areas.astype(np.int64)
+
+    for _ in range(max_rounds):
+        if len(pairs) == 0:
+            break
+
+        small, target = pairs[:, 0], pairs[:, 1]
+        # Hedef, (alan, numara) sıralamasında daha büyük olmalı
+        bigger = (areas[target] > areas[small]) | (
+            (areas[target] == areas[small]) & (target > small)
+        )
+        candidate = (areas[small] < min_area) & bigger
+        if not candidate.any():
+            break
+
+        small = small[candidate]
+        target = target[candidate]
+        shared = lengths[candidate]
+
+        # Her küçük bölge için en uzun ortak sınırlı komşu:
+        # (bölge, sınır) sırasına göre dizip her bölgenin sonuncusu
+        order = np.lexsort((shared, small))
+        last = np.r_[small[order][1:] != small[order][:-1], True]
+        parent = np.arange(n)
+        parent[small[order][last]] = target[order][last]
+
+        # İşaretçi atlama: zincirleri köke indir
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+        root = parent[root]
+        areas = np.bincount(parent, weights=areas, minlength=n).astype(np.int64)
+        pairs, lengths = _aggregate_edges(
+            parent[pairs[:, 0]], parent[pairs[:, 1]], lengths
+        )
+
+    return root
+
+
+def _anchors(region_map: np.ndarray, n_regions: int) -> np.ndarray:
+    """Her bölgenin sınırdan en uzak iç pikselini bulur (numara yeri).
+
+    Bölge sınırları ve görüntü kenarı sıfır kabul edilerek tek bir
+    distanceTransform çalıştırılır; her bölgenin en büyük uzaklığa
+    sahip ilk pikseli seçilir. Ağırlık merkezinin aksine bu nokta
+    her zaman bölgenin içindedir (U şekilli bölgelerde de).
+
+    Returns:
+        (R, 2) x, y koordinatları.
+    """
+    interior = np.ones(region_map.shape, dtype=np.uint8)
+
+    horizontal = region_map[:, 1:] != region_map[:, :-1]
+    interior[:, 1:][horizontal] = 0
+    interior[:, :-1][horizontal] = 0
+    vertical = region_map[1:, :] != region_map[:-1, :]
+    interior[1:, :][vertical] = 0
+    interior[:-1, :][vertical] = 0
+    interior[[0, -1], :] = 0
+    interior[:, [0, -1]] = 0
+
+    distance = cv2.distanceTransform(interior, cv2.DIST_L2, 3).reshape(-1)
+    regions = region_map.reshape(-1)
+
+    peak = np.zeros(n_regions, dtype=np.float32)
+    np.maximum.at(peak, regions, distance)
+
+    candidates = np.flatnonzero(distance == peak[regions])
+    _, first = np.unique(regions[candidates], return_index=True)
+    positions = candidates[first]
+
+    width = region_map.shape[1]
+    return np.stack([positions % width, positions // width], axis=1)
+
+
+def extract_regions(
+    label_map: np.ndarray,
+    min_area: int = 0,
+    connectivity: int = 4,
+    workers: Optional[int] = None,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Etiket haritasından numaralandırılabilir bağlantılı bölgeleri çıkarır.
+
+    Args:
+        label_map: (H, W) küme etiketleri (create_label_map() çıktısı).
+        min_area: Bu alandan (piksel) küçük bölgeler baskın
+            komşularına birleştirilir. 0 ise birleştirme yapılmaz.
+        connectivity: Bileşen komşuluğu (4 veya 8). Birleştirme
+            komşuluğu her zaman 4'tür.
+        workers: Etiketleri paralel işleyen thread sayısı (None ise
+            CPU sayısı). Her thread tam boyutlu bir geçici harita tutar.
+
+    Returns:
+        region_map: (H, W) int32 bölge numaraları (0..R-1), büyükten
+            küçüğe alan sırasına göre numaralı.
+        regions: Bölge başına diziler:
+            "label"    -> renk etiketi (R,)
+            "area"     -> piksel sayısı (R,)
+            "bbox"     -> x, y, genişlik, yükseklik (R, 4)
+            "centroid" -> ağırlık merkezi x, y (R, 2)
+            "anchor"   -> numaranın yazılacağı iç nokta x, y (R, 2)
+    """
+    region_map, region_labels, stats, centroids = _components(
+        label_map, connectivity, workers
+    )
+    areas = stats[:, cv2.CC_STAT_AREA].astype(np.int64)
+    n_components = len(areas)
+    height, width = label_map.shape
+
+    if min_area > 0 and n_components > 1:
+        pairs, lengths = _adjacency(region_map)
+        root = _merge_small(areas, pairs, lengths, min_area)
+    else:
+        root = np.arange(n_components)
+
+    # Kökleri alan sırasına göre 0..R-1'e yeniden numarala
+    roots, compact = np.unique(root, return_inverse=True)
+    merged_areas = np.bincount(compact, weights=areas).astype(np.int64)
+    order = np.argsort(-merged_areas, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    new_id = rank[compact]
+
+    n_regions = len(roots)
+    region_map = new_id.astype(np.int32)[region_map]
+
+    x0 = stats[:, cv2.CC_STAT_LEFT]
+    y0 = stats[:, cv2.CC_STAT_TOP]
+    x1 = x0 + stats[:, cv2.CC_STAT_WIDTH]
+    y1 = y0 + stats[:, cv2.CC_STAT_HEIGHT]
+
+    left = np.full(n_regions, width, dtype=np.int64)
+    top = np.full(n_regions, height, dtype=np.int64)
+    right = np.zeros(n_regions, dtype=np.int64)
+    bottom = np.zeros(n_regions, dtype=np.int64)
+    np.minimum.at(left, new_id, x0)
+    np.minimum.at(top, new_id, y0)
+    np.maximum.at(right, new_id, x1)
+    np.maximum.at(bottom, new_id, y1)
+
+    # Birleşen bölgenin ağırlık merkezi: bileşen merkezlerinin alan ağırlıklı ortalaması
+    area = np.bincount(new_id, weights=areas, minlength=n_regions)
+    centroid = np.stack([
+        np.bincount(new_id, weights=centroids[:, 0] * areas,
+                    minlength=n_regions) / area,
+        np.bincount(new_id, weights=centroids[:, 1] * areas,
+                    minlength=n_regions) / area,
+    ], axis=1)
+
+    # Birleşen bölge, kökün (büyük komşunun) rengini alır
+    labels = np.empty(n_regions, dtype=region_labels.dtype)
+    labels[rank[np.arange(len(roots))]] = region_labels[roots]
+
+    regions = {
+        "label": labels,
+        "area": area.astype(np.int64),
+        "bbox": np.stack([left, top, right - left, bottom - top], axis=1),
+        "centroid": centroid.astype(np.float32),
+        "anchor": _anchors(region_map, n_regions),
+    }
+
+    print(f"[OK] Bölgeler çıkarıldı: {n_regions:,} bölge "
+          f"({n_components:,} bileşenden)")
+    if min_area > 0:
+        print(f"     En küçük alan: {int(area.min()) if n_regions else 0} "
+              f"piksel (eşik: {min_area})")
+
+    return region_map, regions
+
+
+def save_regions(
+    region_map: np.ndarray,
+    regions: Dict[str, np.ndarray],
+    output_dir: str,
+    filename: str,
+) -> str:
+    """Bölge haritasını ve bölge bilgilerini sıkıştırılmış NPZ olarak kaydeder.
+
+    Args:
+        region_map: extract_regions() çıktısı (H, W).
+        regions: extract_regions() bölge dizileri.
+        output_dir: Çıktı klasörü.
+        filename: Dosya adı (örn: "regions.npz").
+
+    Returns:
+        Kaydedilen dosyanın tam yolu.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    filepath = os.path.join(output_dir, filename)
+
+    # Bölge sayısına göre en küçük tamsayı tipi
+    n_regions = len(regions["area"])
+    map_dtype = np.uint16 if n_regions <= np.iinfo(np.uint16).max else np.int32
+    np.savez_compressed(
+        filepath, region_map=region_map.astype(map_dtype, copy=False),
+        **regions,
+    )
+
+    print(f"[OK] Bölgeler kaydedildi: {filepath}")
+    return filepath
@@ -0,0 +1,270 @@
+# ==================================================
+# RENDER - NumPy / OpenCV ile Hafif Çıktı Üretimi
+# ==================================================
+# visualization.py'deki palet, karşılaştırma ve özet çıktılarının
+# matplotlib kullanmayan karşılıkları. Figür, eksen ve font
+# motoru kurulmaz: görüntüler NumPy ile yan yana birleştirilir,
+# renk blokları dizi dilimlerine yazılır, etiketler cv2.putText
+# ile çizilir. Dosya adları ve dönüş değerleri visualization.py
+# ile aynıdır; pipeline RENDER_BACKEND ile ikisinden birini seçer.
+
+import os
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+from config import RENDER_MAX_WIDTH
+
+
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_TEXT_COLOR = (0, 0, 0)
+_BACKGROUND = 255
+_MARGIN = 10
+
+# Başlık ve etiket şeritlerinin yüksekliği (piksel)
+_TITLE_HEIGHT = 40
+_LABEL_HEIGHT = 28
+
+# Palet bloklarının boyutu ve özet grafiğinin çizim alanı yüksekliği
+_SWATCH_WIDTH = 160
+_SWATCH_HEIGHT = 200
+_CHART_HEIGHT = 300
+
+
+def _canvas(height: int, width: int) -> np.ndarray:
+    """Beyaz arka planlı (H, W, 3) uint8 tuval oluşturur."""
+    return np.full((height, width, 3), _BACKGROUND, dtype=np.uint8)
+
+
+def _put_text(
+    canvas: np.ndarray,
+    text: str,
+    center_x: float,
+    baseline_y: float,
+    scale: float = 0.5,
+    thickness: int = 1,
+) -> None:
+    """Metni yatayda center_x'e ortalayarak tuvale yazar."""
+    (width, _), _ = cv2.getTextSize(text, _FONT, scale, thickness)
+    cv2.putText(
+        canvas, text, (int(center_x - width / 2), int(baseline_y)),
+        _FONT, scale, _TEXT_COLOR, thickness, cv2.LINE_AA,
+    )
+
+
+def _fit_width(image: np.ndarray, max_width: int) -> np.ndarray:
+    """Görüntüyü en-boy oranını koruyarak max_width'e küçültür."""
+    height, width = image.shape[0], image.shape[1]
+    if width <= max_width:
+        return image
+
+    new_height = max(1, int(round(height * max_width / width)))
+    return cv2.resize(
+        image, (max_width, new_height), interpolation=cv2.INTER_AREA
+    )
+
+
+def _with_title(body: np.ndarray, title: str) -> np.ndarray:
+    """Gövdenin üstüne başlık şeridi ekler."""
+    strip = _canvas(_TITLE_HEIGHT, body.shape[1])
+    _put_text(strip, title, body.shape[1] / 2, _TITLE_HEIGHT - 12,
+              scale=0.8, thickness=2)
+    return np.vstack([strip, body])
+
+
+def _image_row(
+    images: List[np.ndarray], titles: List[str], max_width: int
+) -> np.ndarray:
+    """Görüntüleri başlıklarıyla birlikte yan yana birleştirir.
+
+    Her görüntü (max_width - boşluklar) / adet genişliğe sığdırılır;
+    yükseklikler farklıysa kısa olanın altı boş bırakılır.
+    """
+    panel_width = (max_width - _MARGIN * (len(images) + 1)) // len(images)
+    panels = [_fit_width(image, panel_width) for image in images]
+    panel_height = max(panel.shape[0] for panel in panels)
+
+    width = sum(p.shape[1] for p in panels) + _MARGIN * (len(panels) + 1)
+    row = _canvas(_LABEL_HEIGHT + panel_height, width)
+
+    x = _MARGIN
+    for panel, title in zip(panels, titles):
+        _put_text(row, title, x + panel.shape[1] / 2, _LABEL_HEIGHT - 8)
+        row[_LABEL_HEIGHT:_LABEL_HEIGHT + panel.shape[0],
+            x:x + panel.shape[1]] = panel
+        x += panel.shape[1] + _MARGIN
+
+    return row
+
+
+def _save(canvas: np.ndarray, filename: str, output_dir: str) -> str:
+    """RGB tuvali BGR'ye çevirip PNG olarak kaydeder."""
+    os.makedirs(output_dir, exist_ok=True)
+    filepath = os.path.join(output_dir, filename)
+    cv2.imwrite(filepath, cv2.cvtColor(canvas, cv2.COLOR_RGB2BGR))
+    return filepath
+
+
+def render_color_palette(
+    dominant_colors: List[dict],
+    color_names: List[dict],
+    output_dir: str,
+) -> str:
+    """Dominant renklerin paletini yatay bloklar halinde çizer.
+
+    plot_color_palette() ile aynı içerik: her blokun üstünde
+    yüzdesi, altında renk ismi ve RGB değeri yazar.
+
+    Args:
+        dominant_colors: get_dominant_colors() çıktısı.
+        color_names: categorize_centers() çıktısı.
+        output_dir: Çıktı klasörü.
+
+    Returns:
+        Kaydedilen dosyanın tam yolu.
+    """
+    name_map = {c["color_id"]: c["name"] for c in color_names}
+
+    k = len(dominant_colors)
+    body = _canvas(_LABEL_HEIGHT + _SWATCH_HEIGHT + 2 * _LABEL_HEIGHT,
+                   max(1, k) * _SWATCH_WIDTH)
+
+    for i, color_info in enumerate(dominant_colors):
+        rgb = color_info["rgb"]
+        name = name_map.get(color_info["color_id"], "?")
+        x0 = i * _SWATCH_WIDTH
+        center_x = x0 + _SWATCH_WIDTH / 2
+
+        _put_text(body, f"%{color_info['percentage']}",
+                  center_x, _LABEL_HEIGHT - 8)
+        body[_LABEL_HEIGHT:_LABEL_HEIGHT + _SWATCH_HEIGHT,
+             x0 + 4:x0 + _SWATCH_WIDTH - 4] = rgb
+
+        text_y = _LABEL_HEIGHT + _SWATCH_HEIGHT
+        _put_text(body, name, center_x, text_y + 20, scale=0.45)
+        _put_text(body, f"({rgb[0]},{rgb[1]},{rgb[2]})",
+                  center_x, text_y + 42, scale=0.4)
+
+    filepath = _save(
+        _with_title(body, "Dominant Renk Paleti"),
+        "color_palette.png", output_dir,
+    )
+
+    print(f"[OK] Renk paleti kaydedildi: {filepath}")
+    return filepath
+
+
+def render_comparison(
+    original: np.ndarray,
+    segmented: np.ndarray,
+    output_dir: str,
+    k: Optional[int] = None,
+    max_width: int = RENDER_MAX_WIDTH,
+) -> str:
+    """Orijinal ve segmented görüntüyü yan yana birleştirir.
+
+    Args:
+        original: Orijinal RGB görüntü.
+        segmented: Segmented RGB görüntü.
+        output_dir: Çıktı klasörü.
+        k: Başlıkta gösterilecek renk sayısı (None ise gösterilmez).
+        max_width: Çıktının en fazla genişliği; görüntüler küçültülür.
+
+    Returns:
+        Kaydedilen dosyanın tam yolu.
+    """
+    segmented_title = "Segmented" if k is None else f"Segmented (K={k} renk)"
+    row = _image_row(
+        [original, segmented], ["Orijinal", segmented_title], max_width
+    )
+
+    filepath = _save(
+        _with_title(row, "Orijinal vs Segmented"),
+        "comparison.png", output_dir,
+    )
+
+    print(f"[OK] Karsilastirma kaydedildi: {filepath}")
+    return filepath
+
+
+def _bar_chart(
+    dominant_colors: List[dict], name_map: dict, width: int
+) -> np.ndarray:
+    """Renk dağılımını çubuk grafik olarak çizer."""
+    n = max(1, len(dominant_colors))
+    chart = _canvas(_LABEL_HEIGHT + _CHART_HEIGHT + 2 * _LABEL_HEIGHT, width)
+    _put_text(chart, "Dominant Renk Dagilimi", width / 2, _LABEL_HEIGHT - 8)
+
+    slot = (width - 2 * _MARGIN) / n
+    bar_width = int(slot * 0.8)
+    max_percentage = max(
+        (c["percentage"] for c in dominant_colors), default=0
+    ) or 1.0
+    # Çubuk üstündeki yüzde yazısı için boşluk bırakılır
+    plot_height = _CHART_HEIGHT - _LABEL_HEIGHT
+    baseline = _LABEL_HEIGHT + _CHART_HEIGHT
+
+    for i, color_info in enumerate(dominant_colors):
+        rgb = color_info["rgb"]
+        pct = color_info["percentage"]
+        name = name_map.get(color_info["color_id"], "?")
+
+        center_x = _MARGIN + slot * (i + 0.5)
+        x0 = int(center_x - bar_width / 2)
+        top = baseline - int(round(plot_height * pct / max_percentage))
+
+        chart[top:baseline, x0:x0 + bar_width] = rgb
+        cv2.rectangle(chart, (x0, top), (x0 + bar_width - 1, baseline - 1),
+                      _TEXT_COLOR, 1)
+
+        _put_text(chart, f"%{pct}", center_x, top - 6, scale=0.4)
+        _put_text(chart, name, center_x, baseline + 20, scale=0.4)
+        _put_text(chart, f"({rgb[0]},{rgb[1]},{rgb[2]})",
+                  center_x, baseline + 40, scale=0.35)
+
+    cv2.line(chart, (_MARGIN, baseline), (width - _MARGIN, baseline),
+             _TEXT_COLOR, 1)
+    return chart
+
+
+def render_summary(
+    original: np.ndarray,
+    segmented: np.ndarray,
+    dominant_colors: List[dict],
+    color_names: List[dict],
+    output_dir: str,
+    max_width: int = RENDER_MAX_WIDTH,
+) -> str:
+    """Tüm sonuçları tek bir panelde özetler.
+
+    Üst satır: Orijinal ve segmented görüntü.
+    Alt satır: Renk dağılımı çubuk grafiği.
+
+    Args:
+        original: Orijinal RGB görüntü.
+        segmented: Segmented RGB görüntü.
+        dominant_colors: get_dominant_colors() çıktısı.
+        color_names: categorize_centers() çıktısı.
+        output_dir: Çıktı klasörü.
+        max_width: Çıktının en fazla genişliği; görüntüler küçültülür.
+
+    Returns:
+        Kaydedilen dosyanın tam yolu.
+    """
+    name_map = {c["color_id"]: c["name"] for c in color_names}
+
+    row = _image_row(
+        [original, segmented],
+        ["Orijinal Goruntu", "Segmented Goruntu"],
+        max_width,
+    )
+    chart = _bar_chart(dominant_colors, name_map, row.shape[1])
+
+    filepath = _save(
+        _with_title(np.vstack([row, chart]), "Vision Color Pipeline - Ozet"),
+        "summary.png", output_dir,
+    )
+
+    print(f"[OK] Ozet panel kaydedildi: {filepath}")
+    return filepath
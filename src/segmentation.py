@@ -14,6 +14,10 @@ def segment_image(
     Böylece orijinal görüntü sadece K adet renkten oluşan
     posterize bir görüntüye dönüşür.
 
+    Merkezler önce K satırlık uint8 palete çevrilir, sonra
+    etiketlerle indekslenir; böylece (N, 3) float64 ara dizi
+    oluşmaz ve sonuç doğrudan uint8 olarak üretilir.
+
     Args:
         labels: Her pikselin küme etiketi (N,).
         centers: Küme merkezleri (K, 3) - RGB değerleri.
@@ -22,15 +26,15 @@ def segment_image(
     Returns:
         Segmented görüntü (H, W, 3) - uint8.
     """
+    # float -> uint8 dönüşümü (görüntü formatı), sadece K renk icin
+    palette = centers.astype(np.uint8)
+
     # Her pikseli kendi küme merkezinin rengiyle doldur
-    segmented_flat = centers[labels]
+    segmented_flat = palette[labels]
 
     # Düz diziyi orijinal görüntü boyutuna geri çevir
     segmented = segmented_flat.reshape(original_shape)
 
-    # float -> uint8 dönüşümü (görüntü formatı)
-    segmented = segmented.astype(np.uint8)
-
     print(f"[OK] Segmentasyon tamamlandi.")
     print(f"     Boyut: {segmented.shape}")
     print(f"     Benzersiz renk sayisi: {len(centers)}")
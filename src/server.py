@@ -0,0 +1,425 @@
+# ==================================================
+# SERVER - Yerel HTTP Palet Servisi
+# ==================================================
+# Web backend'inden çağrılmak üzere standart kütüphane ile
+# yazılmış küçük bir HTTP sunucusu:
+#
+#   POST /palette?k=8&segmented=1   gövde: görüntü dosyası (JPEG/PNG ...)
+#   GET  /health                    havuz ve kuyruk durumu
+#
+# İstekler önceden ısıtılmış bir süreç havuzunda işlenir: her
+# işçi cv2 / sklearn'ü bir kez import eder, renk sözlüğünün LAB
+# tablosunu hazırlar ve küçük bir K-Means ile OpenMP'yi başlatır.
+# Sabit palet tablosu (mode=palette) havuzdan önce ana süreçte bir
+# kez diske yazılır; işçiler onu ilk palet isteğinde yalnızca açar.
+# Böylece istek başına süreç açma ve soğuk başlangıç maliyeti
+# ortadan kalkar.
+#
+# Aynı anda kabul edilen iş sayısı sınırlıdır (işçi + kuyruk);
+# sınır aşılırsa 503 + Retry-After döner. Her yanıt aşama
+# sürelerini Server-Timing başlığında taşır.
+
+import base64
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from config import (
+    K_CLUSTERS,
+    RANDOM_STATE,
+    SERVER_KMEANS_MODE,
+    SERVER_QUEUE_SIZE,
+    SERVER_TIMEOUT,
+    SERVER_MAX_BODY_BYTES,
+    KMEANS_UNIQUE_COLORS,
+    PALETTE_LUT_LEVELS,
+)
+
+
+# Sorgu parametrelerinin izin verilen değerleri
+_KMEANS_MODES = ("full", "downsample", "streaming", "palette")
+_SCALES = (1, 2, 4, 8)
+_MAX_K = 256
+
+
+def _init_worker(threads_per_worker: int) -> None:
+    """İşçi süreci ısıtır: import'lar, renk sözlüğü, OpenMP.
+
+    İşçilerin [OK] çıktıları sunucu günlüğünü doldurmasın diye
+    stdout kapatılır; hatalar yanıtla birlikte döner.
+    """
+    import numpy as np
+    from sklearn.cluster import KMeans
+    from threadpoolctl import threadpool_limits
+
+    from src.color_categorization import get_dictionary_lab
+    import src.image_io  # noqa: F401
+    import src.pipeline  # noqa: F401
+
+    sys.stdout = open(os.devnull, "w")
+    threadpool_limits(limits=threads_per_worker)
+
+    get_dictionary_lab()
+    warmup = np.random.default_rng(0).random((256, 3), dtype=np.float32)
+    KMeans(n_clusters=2, n_init=1, random_state=0).fit(warmup)
+
+
+def _content_length(value: Optional[str]) -> int:
+    """Content-Length başlığını doğrular ve gövde uzunluğunu döndürür.
+
+    Raises:
+        ValueError: Başlık yoksa, tam sayı değilse veya pozitif değilse.
+    """
+    try:
+        length = int(value or 0)
+    except ValueError:
+        raise ValueError(f"Gecersiz Content-Length: {value!r}") from None
+    if length < 0:
+        raise ValueError(f"Gecersiz Content-Length: {value!r}")
+    if length == 0:
+        raise ValueError("Goruntu verisi bos")
+    return length
+
+
+def _build_palette_lut() -> None:
+    """Sabit palet tablosunu ana süreçte bir kez oluşturur (yoksa).
+
+    İşçiler aynı tabloyu disk önbelleğinden açar; soğuk önbellekte
+    N işçinin aynı tabloyu aynı anda üretmesi önlenir.
+    """
+    from src.color_lut import get_palette_lut
+    from src.pipeline import _fixed_palette
+
+    get_palette_lut(_fixed_palette(), PALETTE_LUT_LEVELS)
+
+
+def _ping() -> int:
+    """Havuzun tüm işçilerini başlatmak için boş iş."""
+    time.sleep(0.05)
+    return os.getpid()
+
+
+def extract_palette(
+    data: bytes,
+    k: int,
+    random_state: int,
+    kmeans_mode: str = "downsample",
+    scale: int = 1,
+    segmented: bool = False,
+    unique_colors: bool = False,
+) -> dict:
+    """Görüntü byte'larından dominant renkleri ve isimlerini çıkarır.
+
+    İşçi süreçte çalışır. Dosya yazılmaz; istenirse segmented
+    görüntü paletli PNG olarak base64 döner.
+
+    Args:
+        data: Görüntü dosyasının byte içeriği.
+        k: Küme sayısı ("palette" modunda yok sayılır).
+        random_state: Tekrarlanabilirlik için seed değeri.
+        kmeans_mode: "full", "downsample", "streaming" veya "palette".
+        scale: Çözme küçültme oranı (1, 2, 4, 8).
+        segmented: Segmented paletli PNG'yi yanıta ekle.
+        unique_colors: K-Means benzersiz renkler üzerinde mi çalışsın.
+
+    Returns:
+        {"width", "height", "k" (gerçek renk sayısı),
+         "dominant_colors": [...],
+         "segmented_png": base64 | yok, "timings": {aşama: ms},
+         "started_at": işçinin işe başladığı zaman (epoch sn)}
+    """
+    from src.clustering import get_dominant_colors
+    from src.color_categorization import categorize_centers
+    from src.image_io import decode_image, encode_indexed_png
+    from src.pipeline import cluster_image
+
+    started_at = time.time()
+    timings = {}
+
+    def lap(name: str, since: float) -> float:
+        now = time.perf_counter()
+        timings[name] = round((now - since) * 1000, 2)
+        return now
+
+    t = time.perf_counter()
+    image = decode_image(data, scale=scale)
+    t = lap("decode", t)
+
+    labels, centers = cluster_image(
+        image, None, k, random_state, kmeans_mode, unique_colors
+    )
+    t = lap("kmeans", t)
+
+    dominant_colors = get_dominant_colors(centers, labels)
+    color_names = categorize_centers(centers)
+    t = lap("naming", t)
+
+    name_map = {c["color_id"]: c["name"] for c in color_names}
+    result = {
+        "width": int(image.shape[1]),
+        "height": int(image.shape[0]),
+        "k": len(centers),
+        "dominant_colors": [
+            {**color, "name": name_map.get(color["color_id"], "?")}
+            for color in dominant_colors
+        ],
+    }
+
+    if segmented:
+        png = encode_indexed_png(labels.reshape(image.shape[:2]), centers)
+        result["segmented_png"] = base64.b64encode(png).decode("ascii")
+        lap("encode", t)
+
+    result["timings"] = timings
+    result["started_at"] = started_at
+    return result
+
+
+def _parse_options(query: str) -> dict:
+    """Sorgu parametrelerini extract_palette() argümanlarına çevirir.
+
+    Raises:
+        ValueError: Geçersiz parametre değeri verilirse.
+    """
+    params = {key: values[-1] for key, values in parse_qs(query).items()}
+
+    def flag(name: str) -> bool:
+        return params.get(name, "0").lower() in ("1", "true", "yes")
+
+    options = {
+        "k": int(params.get("k", K_CLUSTERS)),
+        "random_state": int(params.get("random_state", RANDOM_STATE)),
+        "kmeans_mode": params.get("mode", SERVER_KMEANS_MODE),
+        "scale": int(params.get("scale", 1)),
+        "segmented": flag("segmented"),
+        "unique_colors": flag("unique_colors") or KMEANS_UNIQUE_COLORS,
+    }
+
+    if not 1 <= options["k"] <= _MAX_K:
+        raise ValueError(f"k 1-{_MAX_K} araliginda olmali")
+    if options["kmeans_mode"] not in _KMEANS_MODES:
+        raise ValueError(f"mode su degerlerden biri olmali: {_KMEANS_MODES}")
+    if options["scale"] not in _SCALES:
+        raise ValueError(f"scale su degerlerden biri olmali: {_SCALES}")
+
+    return options
+
+
+class PaletteServer(ThreadingHTTPServer):
+    """Isıtılmış süreç havuzu ve sınırlı kuyruğa sahip HTTP sunucusu.
+
+    Her bağlantı bir thread'de karşılanır; asıl iş süreç havuzuna
+    verilir. Havuzda çalışan + bekleyen iş sayısı max_inflight ile
+    sınırlıdır. Zaman aşımına uğrayan işin yeri, iş gerçekten
+    bitene kadar boşalmaz; böylece havuz aşırı yüklenmez.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        workers: Optional[int] = None,
+        queue_size: int = SERVER_QUEUE_SIZE,
+        timeout: float = SERVER_TIMEOUT,
+    ):
+        """
+        Args:
+            address: (host, port).
+            workers: İşçi süreç sayısı. None ise os.cpu_count().
+            queue_size: İşçiler meşgulken bekletilebilecek istek sayısı.
+            timeout: İstek başına en fazla bekleme süresi (sn).
+        """
+        # Önce port bağlanır; bağlanamazsa işçiler hiç başlatılmaz
+        super().__init__(address, PaletteRequestHandler)
+
+        cpu_count = os.cpu_count() or 1
+        self.workers = workers or cpu_count
+        self.max_inflight = self.workers + max(0, queue_size)
+        self.request_timeout = timeout
+
+        self._slots = threading.BoundedSemaphore(self.max_inflight)
+        self._inflight = 0
+        self._lock = threading.Lock()
+        self.served = 0
+        self.rejected = 0
+
+        _build_palette_lut()
+
+        print(f"[..] {self.workers} işçi süreç ısıtılıyor...")
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(max(1, cpu_count // self.workers),),
+        )
+        # Tüm işçilerin başlayıp ısınmasını bekle
+        pids = {
+            f.result()
+            for f in [self.pool.submit(_ping) for _ in range(self.workers)]
+        }
+        print(f"[OK] Isıtılmış işçi: {len(pids)}")
+
+    def try_submit(self, options: dict, data: bytes):
+        """İşi havuza verir; kuyruk doluysa None döner."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            return None
+
+        with self._lock:
+            self._inflight += 1
+
+        def release(_):
+            with self._lock:
+                self._inflight -= 1
+            self._slots.release()
+
+        future = self.pool.submit(extract_palette, data, **options)
+        future.add_done_callback(release)
+        return future
+
+    def record_served(self) -> None:
+        """Başarıyla yanıtlanan istek sayacını artırır."""
+        with self._lock:
+            self.served += 1
+
+    def status(self) -> dict:
+        """Havuz ve kuyruk durumu (/health yanıtı)."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "inflight": self._inflight,
+                "max_inflight": self.max_inflight,
+                "served": self.served,
+                "rejected": self.rejected,
+            }
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class PaletteRequestHandler(BaseHTTPRequestHandler):
+    """/palette ve /health isteklerini karşılar."""
+
+    server: PaletteServer
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(
+        self, status: int, payload: dict, headers: Optional[dict] = None
+    ) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if urlparse(self.path).path == "/health":
+            self._send_json(200, self.server.status())
+        else:
+            self._send_json(404, {"error": "Bulunamadi"})
+
+    def do_POST(self) -> None:
+        received = time.perf_counter()
+        url = urlparse(self.path)
+
+        if url.path != "/palette":
+            self._send_json(404, {"error": "Bulunamadi"})
+            return
+
+        try:
+            length = _content_length(self.headers.get("Content-Length"))
+        except ValueError as exc:
+            # Govde okunmadi; baglanti yeniden kullanilamaz
+            self.close_connection = True
+            self._send_json(400, {"error": str(exc)})
+            return
+        if length > SERVER_MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_json(413, {"error": "Goruntu cok buyuk"})
+            return
+
+        data = self.rfile.read(length)
+
+        try:
+            options = _parse_options(url.query)
+        except ValueError as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+
+        submitted_at = time.time()
+        future = self.server.try_submit(options, data)
+        if future is None:
+            self._send_json(
+                503, {"error": "Sunucu mesgul, tekrar deneyin"},
+                {"Retry-After": "1"},
+            )
+            return
+
+        try:
+            result = future.result(timeout=self.server.request_timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self._send_json(504, {"error": "Zaman asimi"})
+            return
+        except ValueError as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+        except Exception as exc:
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+
+        timings = result.pop("timings")
+        queue_ms = max(0.0, (result.pop("started_at") - submitted_at) * 1000)
+        total_ms = (time.perf_counter() - received) * 1000
+
+        server_timing = ", ".join(
+            [f"queue;dur={queue_ms:.2f}"]
+            + [f"{name};dur={ms:.2f}" for name, ms in timings.items()]
+            + [f"total;dur={total_ms:.2f}"]
+        )
+
+        self.server.record_served()
+        self._send_json(200, result, {"Server-Timing": server_timing})
+
+    def log_message(self, format: str, *args) -> None:
+        print(f"[HTTP] {self.address_string()} {format % args}")
+
+
+def serve(
+    host: str,
+    port: int,
+    workers: Optional[int] = None,
+    queue_size: int = SERVER_QUEUE_SIZE,
+    timeout: float = SERVER_TIMEOUT,
+) -> None:
+    """Palet sunucusunu başlatır ve Ctrl+C'ye kadar çalıştırır.
+
+    Args:
+        host: Dinlenecek adres (örn: "127.0.0.1").
+        port: Dinlenecek port.
+        workers: İşçi süreç sayısı. None ise os.cpu_count().
+        queue_size: İşçiler meşgulken bekletilebilecek istek sayısı.
+        timeout: İstek başına en fazla bekleme süresi (sn).
+    """
+    server = PaletteServer((host, port), workers, queue_size, timeout)
+    print(f"[OK] Sunucu dinliyor: http://{host}:{port} "
+          f"(POST /palette, GET /health)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[..] Sunucu kapatılıyor...")
+    finally:
+        server.server_close()
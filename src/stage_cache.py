@@ -0,0 +1,154 @@
+# ==================================================
+# STAGE CACHE - İçerik Adresli Aşama Önbelleği
+# ==================================================
+# Aynı görüntü aynı parametrelerle tekrar işlendiğinde
+# pahalı aşamaları (özellikle K-Means) atlamak için kullanılır.
+#
+# Her kaydın anahtarı, görüntü içeriğinin hash'i ile aşama
+# parametrelerinden türetilir. Bir aşamanın anahtarı kendinden
+# önceki aşamanın anahtarını içerdiğinden, örneğin renk sözlüğü
+# değiştiğinde yalnızca isimlendirme aşaması geçersiz olur.
+#
+# Kayıtlar klasörde tek tek dosya olarak tutulur (.npz / .json).
+# Toplam boyut sınırı aşılınca en uzun süredir kullanılmayan
+# kayıtlar silinir (dosya mtime'ına göre LRU).
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+def image_hash(image: np.ndarray) -> str:
+    """Görüntü içeriğinin hash'ini döndürür (boyut ve dtype dahil).
+
+    Args:
+        image: Herhangi bir numpy dizisi (genellikle (H, W, 3) uint8).
+
+    Returns:
+        32 karakterlik hex hash.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.shape}/{image.dtype}".encode("utf-8"))
+    digest.update(np.ascontiguousarray(image).data)
+    return digest.hexdigest()
+
+
+def stage_key(stage: str, **params: Any) -> str:
+    """Bir aşamanın önbellek anahtarını parametrelerinden türetir.
+
+    Args:
+        stage: Aşama adı (örn: "kmeans").
+        **params: Aşama sonucunu belirleyen tüm parametreler
+            (JSON'a çevrilebilir olmalı). Önceki aşamanın anahtarı
+            da parametre olarak verilerek zincir kurulur.
+
+    Returns:
+        "<stage>-<hash>" biçiminde anahtar.
+    """
+    payload = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16)
+    return f"{stage}-{digest.hexdigest()}"
+
+
+def _entry_path(cache_dir: str, key: str, extension: str) -> Optional[str]:
+    """Kaydın dosya yolunu döndürür; kayıt yoksa None.
+
+    Bulunan kaydın mtime'ı güncellenir (LRU için son kullanım).
+    """
+    path = os.path.join(cache_dir, f"{key}{extension}")
+
+    if not os.path.exists(path):
+        return None
+
+    os.utime(path)
+    return path
+
+
+def _evict(cache_dir: str, max_bytes: int) -> None:
+    """Toplam boyut max_bytes'ı aşarsa en eski kayıtları siler."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(".tmp"):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def _write_atomic(path: str, write) -> None:
+    """Dosyayı önce geçici isimle yazar, sonra yerine taşır."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def load_arrays(cache_dir: str, key: str) -> Optional[Dict[str, np.ndarray]]:
+    """Önbellekteki numpy dizilerini yükler.
+
+    Args:
+        cache_dir: Önbellek klasörü.
+        key: stage_key() ile üretilen anahtar.
+
+    Returns:
+        İsim -> dizi sözlüğü veya kayıt yoksa None.
+    """
+    path = _entry_path(cache_dir, key, ".npz")
+    if path is None:
+        return None
+
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+
+def save_arrays(
+    cache_dir: str, key: str, arrays: Dict[str, np.ndarray], max_bytes: int
+) -> None:
+    """Numpy dizilerini önbelleğe yazar ve gerekirse eski kayıtları siler.
+
+    Args:
+        cache_dir: Önbellek klasörü.
+        key: stage_key() ile üretilen anahtar.
+        arrays: İsim -> dizi sözlüğü.
+        max_bytes: Önbelleğin toplam boyut sınırı.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{key}.npz")
+    _write_atomic(path, lambda f: np.savez(f, **arrays))
+    _evict(cache_dir, max_bytes)
+
+
+def load_json(cache_dir: str, key: str) -> Optional[Any]:
+    """Önbellekteki JSON değerini yükler; kayıt yoksa None."""
+    path = _entry_path(cache_dir, key, ".json")
+    if path is None:
+        return None
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_json(cache_dir: str, key: str, value: Any, max_bytes: int) -> None:
+    """JSON'a çevrilebilir bir değeri önbelleğe yazar."""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{key}.json")
+    payload = json.dumps(value, ensure_ascii=False).encode("utf-8")
+    _write_atomic(path, lambda f: f.write(payload))
+    _evict(cache_dir, max_bytes)
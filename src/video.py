@@ -0,0 +1,183 @@
+# ==================================================
+# VIDEO - Video Karelerini Posterize Etme
+# ==================================================
+# Video kareleri bir generator ile tek tek okunur ve her kare
+# K-Means ile K renge indirgenir.
+#
+# Ardışık kareler birbirine çok benzediğinden her kare, önceki
+# karenin merkezleriyle başlatılır (init=önceki merkezler,
+# n_init=1). Bu hem 10 ayrı k-means++ başlangıcını ortadan
+# kaldırır hem de renklerin kareden kareye titremesini önler.
+# Histogram farkı eşiği aşan sahne geçişlerinde tam fit yapılır.
+
+import os
+import time
+from typing import Iterator
+
+import cv2
+import numpy as np
+
+from config import KMEANS_BACKEND
+from src.clustering import apply_kmeans
+from src.histogram import compute_histograms
+from src.pixel_analysis import extract_pixels
+from src.segmentation import segment_image
+
+
+def iter_frames(path: str) -> Iterator[np.ndarray]:
+    """Video dosyasındaki kareleri RGB formatında sırayla üretir.
+
+    Args:
+        path: Video dosyasının yolu.
+
+    Yields:
+        RGB formatında kareler (H, W, 3) - uint8.
+
+    Raises:
+        FileNotFoundError: Dosya bulunamazsa.
+        ValueError: Video açılamazsa.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Video bulunamadı: {path}")
+
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        raise ValueError(f"Video açılamadı: {path}")
+
+    try:
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            yield cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+    finally:
+        capture.release()
+
+
+def histogram_distance(first: np.ndarray, second: np.ndarray) -> float:
+    """İki histogram arasındaki farkı 0-1 aralığında ölçer.
+
+    Her kanal kendi toplamına bölünerek olasılık dağılımına
+    çevrilir; kanal başına toplam varyasyon mesafesi (L1 / 2)
+    hesaplanıp kanalların ortalaması alınır. 0 aynı dağılım,
+    1 tamamen ayrık dağılım demektir.
+
+    Args:
+        first: compute_histograms() çıktısı (3, 256).
+        second: compute_histograms() çıktısı (3, 256).
+
+    Returns:
+        Histogram farkı (0-1).
+    """
+    p = first / first.sum(axis=1, keepdims=True)
+    q = second / second.sum(axis=1, keepdims=True)
+    return float(np.abs(p - q).sum(axis=1).mean() / 2)
+
+
+def process_video(
+    input_path: str,
+    output_path: str,
+    k: int,
+    random_state: int,
+    scene_cut_threshold: float,
+    fourcc: str = "mp4v",
+    unique_colors: bool = False,
+    backend: str = KMEANS_BACKEND,
+) -> dict:
+    """Videonun her karesini K renge indirger ve yeni videoya yazar.
+
+    İlk karede ve sahne geçişlerinde (histogram farkı eşiği
+    aştığında) tam K-Means (n_init=10) yapılır. Diğer karelerde
+    K-Means önceki karenin merkezleriyle tek başlangıçla çalışır.
+
+    Args:
+        input_path: Girdi video dosyası.
+        output_path: Segmented videonun yazılacağı dosya.
+        k: Küme sayısı (dominant renk sayısı).
+        random_state: Tekrarlanabilirlik için seed değeri.
+        scene_cut_threshold: Tam fit için histogram farkı eşiği (0-1).
+        fourcc: VideoWriter codec kodu (örn: "mp4v").
+        unique_colors: K-Means benzersiz renkler üzerinde mi çalışsın.
+        backend: K-Means motoru ("sklearn", "cv2", "numba").
+
+    Returns:
+        Özet: {"frames": ..., "refits": ..., "elapsed_seconds": ...,
+               "frames_per_second": ..., "output": ...}
+
+    Raises:
+        ValueError: Video açılamazsa veya çıktı yazıcısı açılamazsa
+            (desteklenmeyen fourcc, yazılamayan yol).
+    """
+    capture = cv2.VideoCapture(input_path)
+    fps = capture.get(cv2.CAP_PROP_FPS) or 25.0
+    capture.release()
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+    writer = None
+    prev_centers = None
+    prev_histograms = None
+    frames = 0
+    refits = 0
+    start = time.perf_counter()
+
+    try:
+        for frame in iter_frames(input_path):
+            histograms = compute_histograms(frame)
+            scene_cut = (
+                prev_histograms is not None
+                and histogram_distance(prev_histograms, histograms)
+                > scene_cut_threshold
+            )
+
+            pixels = extract_pixels(frame, np.uint8)
+            if prev_centers is None or scene_cut:
+                labels, centers = apply_kmeans(
+                    pixels, k, random_state, unique_colors=unique_colors,
+                    backend=backend,
+                )
+                refits += 1
+            else:
+                labels, centers = apply_kmeans(
+                    pixels, k, random_state, unique_colors=unique_colors,
+                    init=prev_centers, n_init=1, backend=backend,
+                )
+
+            segmented = segment_image(labels, centers, frame.shape)
+
+            if writer is None:
+                height, width = frame.shape[0], frame.shape[1]
+                writer = cv2.VideoWriter(
+                    output_path, cv2.VideoWriter_fourcc(*fourcc),
+                    fps, (width, height),
+                )
+                if not writer.isOpened():
+                    raise ValueError(f"Video yazılamadı: {output_path}")
+            writer.write(cv2.cvtColor(segmented, cv2.COLOR_RGB2BGR))
+
+            prev_centers = centers
+            prev_histograms = histograms
+            frames += 1
+    finally:
+        if writer is not None:
+            writer.release()
+
+    elapsed = time.perf_counter() - start
+
+    print("=" * 45)
+    print("VİDEO ÖZETİ")
+    print("=" * 45)
+    print(f"  Kare sayısı  : {frames}")
+    print(f"  Tam fit      : {refits}")
+    print(f"  Süre         : {elapsed:.2f} sn")
+    print(f"  Çıktı        : {output_path}")
+    print("=" * 45)
+
+    return {
+        "input": input_path,
+        "output": output_path,
+        "frames": frames,
+        "refits": refits,
+        "elapsed_seconds": round(elapsed, 3),
+        "frames_per_second": round(frames / elapsed, 3) if elapsed else 0.0,
+    }
@@ -3,9 +3,14 @@
 # ==================================================
 
 import os
-from typing import List
+from typing import List, Optional
 
 import numpy as np
+import matplotlib
+
+# Grafikler sadece dosyaya yazilir; GUI backend secimine gerek yok
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 
@@ -68,6 +73,7 @@ def plot_comparison(
     original: np.ndarray,
     segmented: np.ndarray,
     output_dir: str,
+    k: Optional[int] = None,
 ) -> str:
     """Orijinal ve segmented goruntuyu yan yana gosterir.
 
@@ -75,6 +81,9 @@ def plot_comparison(
         original: Orijinal RGB goruntu.
         segmented: Segmented RGB goruntu.
         output_dir: Cikti klasoru.
+        k: Basliktaki renk sayisi (None ise gosterilmez). Segmented
+            goruntunun tum piksellerinde benzersiz renk saymamak
+            icin cagiran taraftan verilir.
 
     Returns:
         Kaydedilen dosyanin tam yolu.
@@ -89,7 +98,7 @@ def plot_comparison(
     ax1.axis("off")
 
     ax2.imshow(segmented)
-    ax2.set_title(f"Segmented (K={len(np.unique(segmented.reshape(-1, 3), axis=0))} renk)")
+    ax2.set_title("Segmented" if k is None else f"Segmented (K={k} renk)")
     ax2.axis("off")
 
     plt.tight_layout()
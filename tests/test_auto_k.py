@@ -0,0 +1,62 @@
+# ==================================================
+# AUTO K testleri
+# ==================================================
+
+import threading
+import time
+
+import numpy as np
+
+from src import auto_k
+from src.auto_k import elbow_k, select_k
+
+
+def _image(seed: int = 0, size: int = 120) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(size, size, 3), dtype=np.uint8)
+
+
+def _scores(ks, inertias):
+    return [{"k": k, "inertia": i} for k, i in zip(ks, inertias)]
+
+
+def test_elbow_k_finds_the_knee():
+    scores = _scores(range(2, 9), [1000, 400, 150, 120, 100, 90, 85])
+
+    assert elbow_k(scores) == 4
+
+
+def test_elbow_k_needs_three_points():
+    assert elbow_k([]) is None
+    assert elbow_k(_scores([3, 4], [10, 5])) is None
+
+
+def test_elbow_k_flat_curve_returns_first_k():
+    assert elbow_k(_scores([3, 4, 5], [7.0, 7.0, 7.0])) == 3
+
+
+def test_budgeted_fit_matches_unbudgeted_fit(monkeypatch):
+    sample = _image().reshape(-1, 3).astype(np.float32)
+    full = auto_k._fit_sample(sample, 5, 0, None)
+
+    # İlk dilim 1 iterasyon; merkezlerden devam sonucu değiştirmez
+    monkeypatch.setattr(auto_k, "_FIT_CHUNK_ITER", 1)
+    deadline = time.perf_counter() + 600
+    chunked = auto_k._fit_sample(sample, 5, 0, deadline)
+
+    np.testing.assert_allclose(chunked.cluster_centers_, full.cluster_centers_)
+    assert chunked.inertia_ == full.inertia_
+
+
+def test_select_k_stops_running_fits_when_budget_expires():
+    threads = threading.active_count()
+    start = time.perf_counter()
+    selection = select_k(
+        _image(size=400), range(3, 13), 0, 50_000, 1_000, time_budget=0.05,
+        fallback_k=7,
+    )
+    elapsed = time.perf_counter() - start
+
+    assert selection["timed_out"]
+    assert elapsed < 1.0
+    assert threading.active_count() == threads
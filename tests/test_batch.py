@@ -0,0 +1,78 @@
+# ==================================================
+# BATCH testleri
+# ==================================================
+
+import json
+import os
+
+import numpy as np
+
+from config import BATCH_SUMMARY_FILE
+from src.batch import _output_subdirs, run_batch
+
+
+def test_output_subdirs_do_not_collide():
+    paths = ["x/a.png", "y/a.png", "a_2.png", "z/a.jpg", "A.png"]
+
+    names = [os.path.basename(d) for d in _output_subdirs(paths, "out")]
+
+    assert names == ["a", "a_2", "a_2_2", "a_3", "A_4"]
+    assert len({name.casefold() for name in names}) == len(paths)
+
+
+def test_output_subdirs_keep_plain_names():
+    names = _output_subdirs(["b.png", "c.png"], "out")
+
+    assert names == [os.path.join("out", "b"), os.path.join("out", "c")]
+
+
+def _write_images(folder, count=2):
+    import cv2
+
+    rng = np.random.default_rng(0)
+    for i in range(count):
+        image = rng.integers(0, 256, size=(24, 32, 3), dtype=np.uint8)
+        cv2.imwrite(str(folder / f"img{i}.png"), image)
+    (folder / "bozuk.png").write_bytes(b"png degil")
+
+
+def _check_summary(output_dir, summary):
+    with open(output_dir / BATCH_SUMMARY_FILE, encoding="utf-8") as f:
+        written = json.load(f)
+
+    statuses = {
+        os.path.basename(r["image"]): r["status"] for r in summary["results"]
+    }
+    assert statuses == {
+        "bozuk.png": "error", "img0.png": "ok", "img1.png": "ok",
+    }
+    assert (summary["succeeded"], summary["failed"]) == (2, 1)
+    assert written["failed"] == 1
+
+
+def test_bad_image_does_not_abort_pool_run(tmp_path):
+    source = tmp_path / "in"
+    source.mkdir()
+    _write_images(source)
+    output_dir = tmp_path / "out"
+
+    summary = run_batch(
+        str(source), str(output_dir), 3, 0, workers=2, pipelined=False,
+        stages=frozenset(), use_cache=False,
+    )
+
+    _check_summary(output_dir, summary)
+
+
+def test_bad_image_does_not_abort_pipelined_run(tmp_path):
+    source = tmp_path / "in"
+    source.mkdir()
+    _write_images(source)
+    output_dir = tmp_path / "out"
+
+    summary = run_batch(
+        str(source), str(output_dir), 3, 0, pipelined=True,
+        stages=frozenset(), use_cache=False,
+    )
+
+    _check_summary(output_dir, summary)
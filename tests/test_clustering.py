@@ -0,0 +1,137 @@
+# ==================================================
+# CLUSTERING testleri
+# ==================================================
+
+import numpy as np
+import pytest
+
+from src.clustering import apply_kmeans, compress_colors, restart_seeds
+
+
+def _pixels(n: int = 5000, colors: int = 40, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    palette = rng.integers(0, 256, size=(colors, 3), dtype=np.uint8)
+    return palette[rng.integers(0, colors, size=n)]
+
+
+def test_compress_colors_round_trips_pixels():
+    pixels = _pixels()
+    colors, counts, inverse = compress_colors(pixels)
+
+    assert len(colors) == len(np.unique(pixels, axis=0))
+    assert counts.sum() == len(pixels)
+    np.testing.assert_array_equal(colors[inverse], pixels.astype(np.float32))
+    np.testing.assert_array_equal(
+        counts, np.bincount(inverse, minlength=len(colors))
+    )
+
+
+def test_compress_colors_accepts_float_pixels():
+    pixels = _pixels()
+    colors, counts, inverse = compress_colors(pixels.astype(np.float32))
+    expected = compress_colors(pixels)
+
+    np.testing.assert_array_equal(colors, expected[0])
+    np.testing.assert_array_equal(counts, expected[1])
+    np.testing.assert_array_equal(inverse, expected[2])
+
+
+def test_unique_colors_matches_full_kmeans():
+    pixels = _pixels()
+    init = pixels[:6].astype(np.float64) + 0.5
+
+    full = apply_kmeans(pixels, 6, 0, unique_colors=False, init=init)
+    weighted = apply_kmeans(pixels, 6, 0, unique_colors=True, init=init)
+
+    np.testing.assert_array_equal(weighted[0], full[0])
+    np.testing.assert_allclose(weighted[1], full[1], atol=1e-3)
+
+
+def test_restart_seeds_depend_only_on_random_state():
+    assert restart_seeds(7, 4) == restart_seeds(7, 4)
+    assert restart_seeds(7, 4)[:2] == restart_seeds(7, 2)
+    assert restart_seeds(7, 4) != restart_seeds(8, 4)
+
+
+@pytest.mark.parametrize("unique_colors", [False, True])
+def test_restarts_are_deterministic_across_worker_counts(unique_colors):
+    rng = np.random.default_rng(3)
+    pixels = rng.integers(0, 256, size=(6000, 3), dtype=np.uint8)
+
+    runs = []
+    for workers in (1, 2, 4):
+        stats = {}
+        labels, centers = apply_kmeans(
+            pixels, 5, 0, unique_colors=unique_colors, n_init=6,
+            workers=workers, seed_sample_size=500, stats=stats,
+        )
+        runs.append((labels, centers, stats))
+
+    labels, centers, stats = runs[0]
+    for other_labels, other_centers, other_stats in runs[1:]:
+        np.testing.assert_array_equal(other_labels, labels)
+        np.testing.assert_array_equal(other_centers, centers)
+        assert other_stats["best_restart"] == stats["best_restart"]
+        assert other_stats["inertia"] == stats["inertia"]
+
+
+@pytest.mark.parametrize("tile_rows", [7, 32, 1000])
+def test_streaming_labels_match_nearest_center(tile_rows):
+    from src.clustering import apply_streaming_kmeans, assign_labels
+
+    image = np.random.default_rng(4).integers(
+        0, 256, size=(45, 30, 3), dtype=np.uint8
+    )
+    labels, centers = apply_streaming_kmeans(image, 5, 0, tile_rows)
+
+    assert labels.shape == (45 * 30,)
+    assert labels.dtype == np.uint8
+    np.testing.assert_array_equal(
+        labels, assign_labels(image.reshape(-1, 3), centers)
+    )
+
+
+def test_streaming_accepts_memmap_image(tmp_path):
+    from src.clustering import apply_streaming_kmeans
+
+    image = np.random.default_rng(4).integers(
+        0, 256, size=(45, 30, 3), dtype=np.uint8
+    )
+    mapped = np.lib.format.open_memmap(
+        str(tmp_path / "image.npy"), mode="w+", dtype=np.uint8,
+        shape=image.shape,
+    )
+    mapped[:] = image
+
+    expected = apply_streaming_kmeans(image, 5, 0, 16)
+    labels, centers = apply_streaming_kmeans(mapped, 5, 0, 16)
+
+    np.testing.assert_array_equal(labels, expected[0])
+    np.testing.assert_array_equal(centers, expected[1])
+
+
+@pytest.mark.parametrize("method", ["resize", "stratified"])
+def test_downsample_labels_fit_segment_image(method):
+    from src.clustering import (
+        apply_downsampled_kmeans,
+        assign_labels,
+        label_dtype,
+    )
+    from src.segmentation import create_label_map, segment_image
+
+    image = np.random.default_rng(5).integers(
+        0, 256, size=(60, 90, 3), dtype=np.uint8
+    )
+    labels, centers = apply_downsampled_kmeans(image, 6, 0, 500, method)
+
+    assert labels.shape == (60 * 90,)
+    assert labels.dtype == label_dtype(6)
+    assert centers.shape == (6, 3)
+    np.testing.assert_array_equal(
+        labels, assign_labels(image.reshape(-1, 3), centers)
+    )
+
+    segmented = segment_image(labels, centers, image.shape)
+    assert segmented.shape == image.shape
+    assert segmented.dtype == np.uint8
+    assert create_label_map(labels, image.shape).shape == image.shape[:2]
@@ -0,0 +1,99 @@
+# ==================================================
+# COLLECTION testleri
+# ==================================================
+
+import json
+
+import numpy as np
+import pytest
+
+import src.collection as collection
+from src.collection import _collection_shares
+
+
+def _result(width, height, shares, status="ok"):
+    return {
+        "status": status,
+        "width": width,
+        "height": height,
+        "dominant_colors": [
+            {"color_id": color_id, "percentage": percentage}
+            for color_id, percentage in shares.items()
+        ],
+    }
+
+
+def test_collection_shares_weighted_by_pixels():
+    results = [
+        _result(10, 10, {0: 100.0}),           # 100 piksel
+        _result(30, 10, {1: 50.0, 2: 50.0}),   # 300 piksel
+    ]
+
+    shares = _collection_shares(results, 3)
+
+    assert [s["percentage"] for s in shares] == [25.0, 37.5, 37.5]
+
+
+def test_collection_shares_skips_failed_and_unused():
+    results = [
+        _result(10, 10, {1: 100.0}),
+        {"status": "error", "image": "x.jpg"},
+    ]
+
+    shares = _collection_shares(results, 3)
+
+    assert [s["percentage"] for s in shares] == [0.0, 100.0, 0.0]
+
+
+def test_collection_shares_all_failed():
+    shares = _collection_shares([{"status": "error"}], 2)
+
+    assert [s["percentage"] for s in shares] == [0.0, 0.0]
+
+
+def test_run_collection_writes_collection_block(tmp_path, monkeypatch):
+    cv2 = pytest.importorskip("cv2")
+    image_dir = tmp_path / "images"
+    image_dir.mkdir()
+    rng = np.random.default_rng(0)
+    for i in range(3):
+        image = rng.integers(0, 256, (24, 32, 3), dtype=np.uint8)
+        cv2.imwrite(str(image_dir / f"im{i}.png"), image)
+
+    monkeypatch.setattr(collection, "COLLECTION_PALETTE_FILE", "shared.json")
+    output_dir = tmp_path / "out"
+
+    summary = collection.run_collection(
+        str(image_dir), str(output_dir), 4, 0, pipelined=True,
+        stages=frozenset(), write_run_report=False,
+    )
+
+    with open(output_dir / "batch_summary.json", encoding="utf-8") as f:
+        written = json.load(f)
+    assert written["collection"] == summary["collection"]
+    assert len(written["collection"]["colors"]) == 4
+    assert written["collection"]["images"] == 3
+
+
+def test_run_collection_labels_match_rgb_assignment(tmp_path):
+    cv2 = pytest.importorskip("cv2")
+    from src.clustering import assign_labels
+
+    image_dir = tmp_path / "images"
+    image_dir.mkdir()
+    rng = np.random.default_rng(1)
+    image = rng.integers(0, 256, (20, 30, 3), dtype=np.uint8)
+    cv2.imwrite(str(image_dir / "im.png"), cv2.cvtColor(image, cv2.COLOR_RGB2BGR))
+
+    summary = collection.run_collection(
+        str(image_dir), str(tmp_path / "out"), 5, 0, pipelined=True,
+        stages=frozenset({"segmentation"}), write_run_report=False,
+    )
+
+    centers = np.array(
+        [c["center"] for c in summary["collection"]["colors"]]
+    )
+    labels = np.load(tmp_path / "out" / "im" / "labels.npz")["labels"]
+    np.testing.assert_array_equal(
+        labels.reshape(-1), assign_labels(image.reshape(-1, 3), centers)
+    )
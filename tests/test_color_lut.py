@@ -0,0 +1,53 @@
+# ==================================================
+# COLOR LUT testleri
+# ==================================================
+
+import numpy as np
+import pytest
+
+from src.color_categorization import classify_colors, rgb_to_lab_array
+from src.color_lut import _AMBIGUOUS, get_palette_lut, quantize_pixels
+
+
+@pytest.fixture(scope="module")
+def palette():
+    return np.random.default_rng(1).integers(0, 256, (12, 3), dtype=np.uint8)
+
+
+@pytest.fixture(scope="module")
+def pixels(palette):
+    rng = np.random.default_rng(2)
+    noise = rng.integers(0, 256, (4096, 3), dtype=np.uint8)
+    # Palet renklerinin orta noktaları belirsiz hücrelere düşer
+    i, j = rng.integers(0, len(palette), (2, 1024))
+    middle = ((palette[i].astype(int) + palette[j]) // 2).astype(np.uint8)
+    return np.concatenate([noise, middle])
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("color_lut"))
+
+
+def test_full_lut_matches_classify_colors(palette, pixels, cache_dir):
+    expected = classify_colors(pixels, palette_lab=rgb_to_lab_array(palette))
+
+    labels = quantize_pixels(pixels, palette, 256, cache_dir)
+
+    np.testing.assert_array_equal(labels, expected)
+
+
+@pytest.mark.parametrize("levels", [16, 32, 64])
+def test_coarse_lut_matches_full_lut(palette, pixels, cache_dir, levels):
+    full = quantize_pixels(pixels, palette, 256, cache_dir)
+
+    coarse = quantize_pixels(pixels, palette, levels, cache_dir)
+
+    np.testing.assert_array_equal(coarse, full)
+
+
+def test_coarse_lut_has_certain_and_ambiguous_cells(palette, cache_dir):
+    lut = np.asarray(get_palette_lut(palette, 32, cache_dir))
+
+    assert (lut == _AMBIGUOUS).any()
+    assert (lut < len(palette)).any()
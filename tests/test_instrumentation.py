@@ -0,0 +1,30 @@
+# ==================================================
+# INSTRUMENTATION testleri
+# ==================================================
+
+import threading
+import time
+
+from src.instrumentation import measure_stage, new_report
+
+
+def _burn(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_cpu_seconds_excludes_other_threads():
+    report = new_report()
+    stop = threading.Event()
+    thread = threading.Thread(target=_burn, args=(stop,))
+    thread.start()
+    try:
+        with measure_stage(report, "bekleme"):
+            time.sleep(0.3)
+    finally:
+        stop.set()
+        thread.join()
+
+    record = report["stages"][0]
+    assert record["cpu_seconds"] < 0.05
+    assert record["process_cpu_seconds"] > 0.1
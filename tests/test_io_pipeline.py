@@ -0,0 +1,44 @@
+# ==================================================
+# IO PIPELINE testleri
+# ==================================================
+
+import threading
+import time
+
+from src.io_pipeline import BackgroundWriter
+
+
+def test_writer_records_job_durations():
+    record = {}
+    with BackgroundWriter(workers=2) as writer:
+        writer.submit(time.sleep, 0.05, key="a", record=record)
+        writer.submit(time.sleep, 0.05, key="a", record=record)
+
+    assert record["writer_jobs"] == 2
+    assert record["writer_wall_seconds"] >= 0.1
+    assert record["writer_queue_seconds"] >= 0.0
+
+
+def test_when_done_runs_after_all_jobs_of_key():
+    release = threading.Event()
+    finished = []
+    seen = []
+
+    with BackgroundWriter(workers=2) as writer:
+        writer.submit(lambda: (release.wait(5), finished.append("a")), key="a")
+        writer.submit(release.wait, 5, key="b")
+        writer.when_done("a", lambda: seen.append(list(finished)))
+        assert seen == []
+        release.set()
+
+    assert seen == [["a"]]
+
+
+def test_when_done_without_jobs_runs_now_and_records_errors():
+    def fail():
+        raise OSError("disk dolu")
+
+    with BackgroundWriter() as writer:
+        writer.when_done("a", fail)
+
+    assert writer.errors == {"a": ["OSError: disk dolu"]}
@@ -0,0 +1,51 @@
+# ==================================================
+# KMEANS BACKENDS testleri
+# ==================================================
+
+import numpy as np
+import pytest
+
+from src.clustering import apply_kmeans
+from src.kmeans_backends import check_backend
+
+
+def test_check_backend_rejects_weighted_cv2():
+    check_backend("cv2")
+    check_backend("sklearn", weighted=True)
+
+    with pytest.raises(ValueError):
+        check_backend("cv2", weighted=True)
+
+
+def test_check_backend_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        check_backend("faiss")
+
+
+def test_apply_kmeans_rejects_cv2_unique_colors_before_work(monkeypatch):
+    import src.clustering as clustering
+
+    def fail(*args, **kwargs):
+        raise AssertionError("compress_colors cagrilmamali")
+
+    monkeypatch.setattr(clustering, "compress_colors", fail)
+    pixels = np.zeros((10, 3), dtype=np.uint8)
+
+    with pytest.raises(ValueError):
+        apply_kmeans(pixels, 2, 0, unique_colors=True, backend="cv2")
+
+
+def test_cv2_reports_unknown_iteration_count():
+    pytest.importorskip("cv2")
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, size=(2000, 3), dtype=np.uint8)
+
+    stats = {}
+    labels, centers = apply_kmeans(
+        pixels, 4, 0, unique_colors=False, n_init=3, stats=stats,
+        backend="cv2",
+    )
+
+    assert stats["n_iter"] is None
+    assert centers.shape == (4, 3)
+    assert labels.shape == (2000,)
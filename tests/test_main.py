@@ -0,0 +1,39 @@
+# ==================================================
+# MAIN (komut satiri) testleri
+# ==================================================
+
+import pytest
+
+from main import parse_args
+
+
+@pytest.mark.parametrize("argv", [
+    ["video", "v.mp4", "--mode", "downsample"],
+    ["video", "v.mp4", "--only", "palette"],
+    ["--scale", "2", "video", "v.mp4"],
+])
+def test_video_rejects_image_only_options(argv):
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+
+
+def test_video_accepts_kmeans_options():
+    args = parse_args(
+        ["video", "v.mp4", "out.mp4", "--k", "4", "--backend", "cv2"]
+    )
+
+    assert (args.input, args.output, args.k, args.backend) == (
+        "v.mp4", "out.mp4", 4, "cv2"
+    )
+
+
+def test_image_options_stay_available_for_batch():
+    args = parse_args(["batch", "data", "--mode", "palette", "--no-plots"])
+
+    assert args.mode == "palette"
+    assert args.no_plots
+
+
+def test_report_drift_flag_is_parsed():
+    assert parse_args(["--report-drift", "--mode", "downsample"]).report_drift
+    assert not hasattr(parse_args([]), "report_drift")
@@ -0,0 +1,82 @@
+# ==================================================
+# PALETTE INDEX testleri
+# ==================================================
+
+import numpy as np
+
+import src.palette_index as palette_index
+from src.palette_index import PaletteIndex, pack_palette, palette_signatures
+
+
+def _items(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        (f"img{i}.jpg", rng.integers(0, 256, (5, 3)), rng.random(5) + 0.1)
+        for i in range(count)
+    ]
+
+
+def test_palette_signatures_unit_length():
+    palettes = np.stack([pack_palette(c, p) for _, c, p in _items(20)])
+
+    signatures = palette_signatures(palettes)
+
+    assert signatures.shape == (20, palette_index.SIGNATURE_DIM)
+    np.testing.assert_allclose(
+        np.linalg.norm(signatures, axis=1), 1.0, rtol=1e-5
+    )
+
+
+def test_palette_signatures_chunked_matches_single(monkeypatch):
+    palettes = np.stack([pack_palette(c, p) for _, c, p in _items(50)])
+    expected = palette_signatures(palettes)
+
+    monkeypatch.setattr(palette_index, "_SIGNATURE_CHUNK_ROWS", 7)
+
+    np.testing.assert_array_equal(palette_signatures(palettes), expected)
+
+
+def test_add_many_in_chunks_matches_single_insert(tmp_path, monkeypatch):
+    items = _items(50)
+    single = PaletteIndex(str(tmp_path / "single"))
+    single.add_many(items)
+
+    # Hem add_many içi parçalama hem birden çok çağrı
+    monkeypatch.setattr(palette_index, "_SIGNATURE_CHUNK_ROWS", 8)
+    chunked = PaletteIndex(str(tmp_path / "chunked"))
+    for start in range(0, len(items), 20):
+        chunked.add_many(items[start:start + 20])
+
+    for name in ("signatures.f32", "palettes.f32", "ids.txt"):
+        assert (tmp_path / "single" / name).read_bytes() == (
+            tmp_path / "chunked" / name
+        ).read_bytes()
+
+
+def test_failed_insert_is_rolled_back(tmp_path, monkeypatch):
+    monkeypatch.setattr(palette_index, "_SIGNATURE_CHUNK_ROWS", 4)
+    index = PaletteIndex(str(tmp_path))
+    index.add_many(_items(3))
+
+    bad = _items(10, seed=1) + [("bad\nid", np.zeros((1, 3)), np.ones(1))]
+    try:
+        index.add_many(bad)
+    except ValueError:
+        pass
+
+    assert len(index) == 3
+    assert len(PaletteIndex(str(tmp_path))) == 3
+    row_bytes = index.max_colors * 4 * 4
+    assert (tmp_path / "palettes.f32").stat().st_size == 3 * row_bytes
+
+
+def test_search_finds_inserted_palette(tmp_path):
+    items = _items(30)
+    index = PaletteIndex(str(tmp_path))
+    index.add_many(items)
+
+    _, centers, percentages = items[12]
+    matches = index.search(centers, percentages, top_k=3)
+
+    assert matches[0]["image"] == "img12.jpg"
+    assert matches[0]["distance"] == 0.0
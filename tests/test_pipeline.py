@@ -0,0 +1,31 @@
+# ==================================================
+# PIPELINE testleri
+# ==================================================
+
+import json
+import os
+
+import numpy as np
+
+from config import RUN_REPORT_FILE
+from src.pipeline import run_pipeline
+
+
+def _image(seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(60, 80, 3), dtype=np.uint8)
+
+
+def test_report_drift_is_written_to_run_report(tmp_path):
+    result = run_pipeline(
+        "a.png", str(tmp_path), 4, 0, kmeans_mode="downsample",
+        report_drift=True, use_cache=False, stages=frozenset(),
+        image=_image(),
+    )
+
+    with open(os.path.join(tmp_path, RUN_REPORT_FILE), encoding="utf-8") as f:
+        report = json.load(f)
+    record = next(s for s in report["stages"] if s["stage"] == "palette_drift")
+
+    assert record["drift"] == result["palette_drift"]
+    assert len(record["drift"]["per_color"]) == 4
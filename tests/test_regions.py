@@ -0,0 +1,56 @@
+# ==================================================
+# REGIONS testleri
+# ==================================================
+
+import numpy as np
+
+from src.regions import _merge_small, extract_regions
+
+
+def _edges(*edges):
+    """(a, b, uzunluk) kenarlarını iki yönlü çift dizilerine çevirir."""
+    pairs = [(a, b) for a, b, _ in edges] + [(b, a) for a, b, _ in edges]
+    lengths = [n for _, _, n in edges] * 2
+    return np.array(pairs, dtype=np.int64), np.array(lengths, dtype=np.int64)
+
+
+def test_merge_small_follows_longest_shared_border():
+    # 2 numaralı küçük bölge hem 0'a hem 1'e komşu; 1 ile sınırı uzun
+    areas = np.array([100, 50, 3])
+    pairs, lengths = _edges((0, 1, 10), (0, 2, 1), (1, 2, 4))
+
+    root = _merge_small(areas, pairs, lengths, min_area=10)
+
+    np.testing.assert_array_equal(root, [0, 1, 1])
+
+
+def test_merge_small_collapses_chains_to_root():
+    # 3 -> 2 -> 1 -> 0 zinciri; yalnızca 0 min_area'yı aşıyor
+    areas = np.array([100, 4, 3, 2])
+    pairs, lengths = _edges((0, 1, 2), (1, 2, 2), (2, 3, 2))
+
+    root = _merge_small(areas, pairs, lengths, min_area=10)
+
+    np.testing.assert_array_equal(root, [0, 0, 0, 0])
+
+
+def test_merge_small_without_small_regions_keeps_all():
+    areas = np.array([20, 30])
+    pairs, lengths = _edges((0, 1, 5))
+
+    root = _merge_small(areas, pairs, lengths, min_area=10)
+
+    np.testing.assert_array_equal(root, [0, 1])
+
+
+def test_extract_regions_merges_speck_into_surrounding_region():
+    label_map = np.zeros((20, 20), dtype=np.uint8)
+    label_map[:, 10:] = 1
+    label_map[5, 3] = 2  # tek piksellik leke
+
+    region_map, regions = extract_regions(label_map, min_area=4)
+
+    assert len(regions["area"]) == 2
+    assert regions["area"].sum() == label_map.size
+    assert region_map[5, 3] == region_map[0, 0]
+    assert regions["label"][region_map[5, 3]] == 0
@@ -0,0 +1,79 @@
+# ==================================================
+# SERVER testleri
+# ==================================================
+
+import socket
+import threading
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from config import SERVER_MAX_BODY_BYTES
+from src.server import PaletteRequestHandler, _content_length, extract_palette
+
+
+def _png_bytes(image: np.ndarray) -> bytes:
+    import cv2
+
+    ok, buffer = cv2.imencode(".png", image[:, :, ::-1])
+    assert ok
+    return buffer.tobytes()
+
+
+def test_extract_palette_reports_palette_size_in_palette_mode():
+    from src.pipeline import _fixed_palette
+
+    image = np.random.default_rng(0).integers(
+        0, 256, size=(32, 32, 3), dtype=np.uint8
+    )
+    result = extract_palette(_png_bytes(image), 3, 0, kmeans_mode="palette")
+
+    assert result["k"] == len(_fixed_palette())
+
+
+def test_extract_palette_reports_k_in_kmeans_mode():
+    image = np.random.default_rng(0).integers(
+        0, 256, size=(32, 32, 3), dtype=np.uint8
+    )
+    result = extract_palette(_png_bytes(image), 3, 0, kmeans_mode="full")
+
+    assert result["k"] == 3
+
+
+def test_content_length_rejects_invalid_values():
+    assert _content_length("12") == 12
+    for value in ("abc", "-5", "0", None, "1.5"):
+        with pytest.raises(ValueError):
+            _content_length(value)
+
+
+@pytest.fixture
+def http_server():
+    # Gecersiz istekler havuza ulasmadan yanitlanir; havuz gerekmez
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PaletteRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def _post_status(address, length: str) -> int:
+    with socket.create_connection(address, timeout=5) as sock:
+        sock.sendall(
+            f"POST /palette HTTP/1.1\r\nHost: x\r\n"
+            f"Content-Length: {length}\r\n\r\n".encode()
+        )
+        status_line = sock.makefile("rb").readline()
+    return int(status_line.split()[1])
+
+
+@pytest.mark.parametrize("length,status", [
+    ("abc", 400),
+    ("-1", 400),
+    ("0", 400),
+    (str(SERVER_MAX_BODY_BYTES + 1), 413),
+])
+def test_post_rejects_bad_content_length(http_server, length, status):
+    assert _post_status(http_server, length) == status
@@ -0,0 +1,115 @@
+# ==================================================
+# STAGE CACHE testleri
+# ==================================================
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from config import RUN_REPORT_FILE
+from src import pipeline
+from src.stage_cache import load_arrays, save_arrays, stage_key
+
+
+def _image(seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(40, 50, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache")
+    monkeypatch.setattr(pipeline, "STAGE_CACHE_DIR", path)
+    return path
+
+
+def _run(output_dir, k=4, image=None):
+    """Tek görüntüyü önbellekle çalıştırır; aşama kayıtlarını döndürür."""
+    pipeline.run_pipeline(
+        "a.png", str(output_dir), k, 0, kmeans_mode="full",
+        use_cache=True, stages=frozenset({"naming"}),
+        image=_image() if image is None else image,
+    )
+    with open(os.path.join(output_dir, RUN_REPORT_FILE), encoding="utf-8") as f:
+        return {s["stage"]: s for s in json.load(f)["stages"]}
+
+
+def _entries(cache_dir):
+    """Önbellekteki kayıtları aşama önekine göre sayar."""
+    counts = {}
+    for name in os.listdir(cache_dir):
+        stage = name.split("-")[0]
+        counts[stage] = counts.get(stage, 0) + 1
+    return counts
+
+
+def test_cache_hit_returns_identical_labels_and_centers(tmp_path, cache_dir):
+    assert not _run(tmp_path / "first")["kmeans"]["cache_hit"]
+    assert _run(tmp_path / "second")["kmeans"]["cache_hit"]
+
+    key = pipeline._clustering_key(
+        _image(), 4, 0, "full", False, pipeline.KMEANS_BACKEND
+    )
+    cached = load_arrays(cache_dir, key)
+    labels, centers = pipeline.cluster_image(
+        _image(), None, 4, 0, "full", False
+    )
+
+    np.testing.assert_array_equal(cached["labels"], labels)
+    np.testing.assert_array_equal(cached["centers"], centers)
+
+
+def test_changing_k_invalidates_kmeans_and_downstream(tmp_path, cache_dir):
+    _run(tmp_path / "first", k=4)
+    assert _entries(cache_dir) == {"kmeans": 1, "dominant": 1, "names": 1}
+
+    assert not _run(tmp_path / "second", k=5)["kmeans"]["cache_hit"]
+    assert _entries(cache_dir) == {"kmeans": 2, "dominant": 2, "names": 2}
+
+
+def test_changing_dictionary_invalidates_only_naming(
+    tmp_path, cache_dir, monkeypatch
+):
+    import src.color_lut
+
+    _run(tmp_path / "first")
+    monkeypatch.setattr(src.color_lut, "dictionary_hash", lambda: "baska")
+
+    assert _run(tmp_path / "second")["kmeans"]["cache_hit"]
+    assert _entries(cache_dir) == {"kmeans": 1, "dominant": 1, "names": 2}
+
+
+def test_stage_keys_chain_previous_key():
+    kmeans = stage_key("kmeans", image="abc", k=4)
+
+    assert stage_key("kmeans", image="abc", k=4) == kmeans
+    assert stage_key("kmeans", image="abc", k=5) != kmeans
+    assert stage_key("names", kmeans=kmeans, dictionary="d1") != stage_key(
+        "names", kmeans=stage_key("kmeans", image="abc", k=5), dictionary="d1"
+    )
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    cache_dir = str(tmp_path)
+    array = {"a": np.zeros(1000, dtype=np.uint8)}
+    unlimited = 1 << 30
+
+    for i, key in enumerate(["old", "used", "new"]):
+        save_arrays(cache_dir, key, array, unlimited)
+        stamp = 1_000_000 + i * 100
+        os.utime(os.path.join(cache_dir, f"{key}.npz"), (stamp, stamp))
+
+    # "old" okunur ve en yeni kullanılan olur
+    assert load_arrays(cache_dir, "old") is not None
+    entry_size = os.path.getsize(os.path.join(cache_dir, "old.npz"))
+
+    max_bytes = 2 * entry_size
+    save_arrays(cache_dir, "latest", array, max_bytes)
+
+    remaining = sorted(os.listdir(cache_dir))
+    assert remaining == ["latest.npz", "old.npz"]
+    assert sum(
+        os.path.getsize(os.path.join(cache_dir, name)) for name in remaining
+    ) <= max_bytes
@@ -0,0 +1,81 @@
+# ==================================================
+# VIDEO testleri
+# ==================================================
+
+import numpy as np
+import pytest
+
+from src import video
+from src.histogram import compute_histograms
+from src.video import histogram_distance, process_video
+
+
+def _frame(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(48, 64, 3), dtype=np.uint8)
+
+
+def test_histogram_distance_is_zero_for_same_distribution():
+    hist = compute_histograms(_frame(0))
+
+    assert histogram_distance(hist, hist) == 0.0
+    # Ölçek farkı (aynı dağılım, farklı piksel sayısı) mesafe sayılmaz
+    assert histogram_distance(hist, hist * 4) == pytest.approx(0.0)
+
+
+def test_histogram_distance_is_one_for_disjoint_distributions():
+    dark = compute_histograms(np.zeros((8, 8, 3), dtype=np.uint8))
+    light = compute_histograms(np.full((8, 8, 3), 255, dtype=np.uint8))
+
+    assert histogram_distance(dark, light) == pytest.approx(1.0)
+
+
+def test_histogram_distance_is_symmetric_and_bounded():
+    first = compute_histograms(_frame(0))
+    second = compute_histograms(_frame(1) // 2)
+
+    distance = histogram_distance(first, second)
+    assert 0.0 < distance < 1.0
+    assert distance == pytest.approx(histogram_distance(second, first))
+
+
+def _write_video(path: str, frames: int = 3) -> None:
+    import cv2
+
+    writer = cv2.VideoWriter(
+        path, cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (64, 48)
+    )
+    assert writer.isOpened()
+    for i in range(frames):
+        writer.write(_frame(i)[:, :, ::-1].copy())
+    writer.release()
+
+
+def test_process_video_forwards_backend(tmp_path, monkeypatch):
+    source = str(tmp_path / "in.avi")
+    _write_video(source)
+
+    backends = []
+    apply_kmeans = video.apply_kmeans
+
+    def recording(*args, **kwargs):
+        backends.append(kwargs.get("backend"))
+        return apply_kmeans(*args, **kwargs)
+
+    monkeypatch.setattr(video, "apply_kmeans", recording)
+    summary = process_video(
+        source, str(tmp_path / "out.avi"), 3, 0, 1.0, fourcc="MJPG",
+        backend="cv2",
+    )
+
+    assert summary["frames"] == 3
+    assert backends == ["cv2"] * 3
+
+
+def test_process_video_raises_when_writer_cannot_open(tmp_path):
+    source = str(tmp_path / "in.avi")
+    _write_video(source)
+    output = str(tmp_path / "out.avi")
+
+    with pytest.raises(ValueError, match="Video yazılamadı"):
+        process_video(source, output, 3, 0, 1.0, fourcc="????")